@@ -1,6 +1,6 @@
 """Core analysis modules for citation data processing."""
 
-from .field_norm import FieldNormalizer
+from .field_norm import FieldNormalizer, PapersSoA
 from .independence import IndependenceClassifier
 from .merger import DataMerger
 from .uptake import UptakeAggregator
@@ -9,5 +9,6 @@ __all__ = [
     "DataMerger",
     "FieldNormalizer",
     "IndependenceClassifier",
+    "PapersSoA",
     "UptakeAggregator",
 ]
@@ -0,0 +1,163 @@
+"""Array kernels for field-level citation statistics.
+
+The kernels are written against NumPy/SciPy ufuncs only, which are already
+compiled, so there is no JIT warm-up or separate build step: the first call
+from a CLI run or demo script is as fast as any later one.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+from scipy.special import ndtr
+
+
+def cdf_array(z_scores: np.ndarray) -> np.ndarray:
+    """Evaluate the standard normal CDF element-wise.
+
+    Args:
+        z_scores: Standard normal variables
+
+    Returns:
+        Cumulative probabilities, same shape as ``z_scores``
+    """
+    return ndtr(z_scores)
+
+
+def h_index(sorted_desc: np.ndarray) -> int:
+    """Calculate the h-index of citation counts sorted in descending order.
+
+    Args:
+        sorted_desc: Citation counts sorted from highest to lowest
+
+    Returns:
+        H-index value
+    """
+    if sorted_desc.size == 0:
+        return 0
+
+    ranks = np.arange(1, sorted_desc.size + 1)
+    return int(np.count_nonzero(sorted_desc >= ranks))
+
+
+def citation_metrics(citations: np.ndarray) -> Tuple[int, int]:
+    """Calculate the h-index and i10-index of a set of citation counts.
+
+    Args:
+        citations: Citation counts in any order (not modified)
+
+    Returns:
+        Tuple of (h-index, i10-index)
+    """
+    citations = np.asarray(citations)
+    i10_index = int(np.count_nonzero(citations >= 10))
+    return h_index(np.sort(citations)[::-1]), i10_index
+
+
+def field_stats(
+    values: np.ndarray, field_ids: np.ndarray, n_fields: int
+) -> Dict[str, np.ndarray]:
+    """Calculate per-field statistics for a flat array of values.
+
+    All fields are reduced together: a single sort groups the values by field
+    (descending within each field) and every statistic is read off the sorted
+    array or accumulated with ``np.bincount``.
+
+    Args:
+        values: Numeric values (e.g. citation counts), one per paper
+        field_ids: Integer field id (0..n_fields-1) for each value
+        n_fields: Number of distinct fields
+
+    Returns:
+        Dictionary of arrays indexed by field id with keys ``count``, ``sum``,
+        ``mean``, ``std``, ``median``, ``max``, ``min`` and ``h_index``.
+        Statistics of empty fields are NaN (``count``/``sum``/``h_index`` are 0).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    field_ids = np.asarray(field_ids, dtype=np.intp)
+
+    counts = np.bincount(field_ids, minlength=n_fields)
+    sums = np.bincount(field_ids, weights=values, minlength=n_fields)
+
+    nonempty = counts > 0
+    safe_counts = np.where(nonempty, counts, 1)
+    means = np.where(nonempty, sums / safe_counts, np.nan)
+
+    deviations = values - means[field_ids]
+    variances = np.bincount(field_ids, weights=deviations**2, minlength=n_fields)
+    stds = np.where(nonempty, np.sqrt(variances / safe_counts), np.nan)
+
+    # Group by field, highest value first within each field
+    order = np.lexsort((-values, field_ids))
+    sorted_values = values[order]
+    sorted_ids = field_ids[order]
+
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    last = np.maximum(starts + counts - 1, 0)
+
+    maxs = np.full(n_fields, np.nan)
+    mins = np.full(n_fields, np.nan)
+    medians = np.full(n_fields, np.nan)
+    if sorted_values.size:
+        maxs[nonempty] = sorted_values[starts[nonempty]]
+        mins[nonempty] = sorted_values[last[nonempty]]
+        lower_mid = starts + (counts - 1) // 2
+        upper_mid = starts + counts // 2
+        medians[nonempty] = (
+            sorted_values[lower_mid[nonempty]] + sorted_values[upper_mid[nonempty]]
+        ) / 2
+
+    # Rank of each value within its field (1-based) for the h-index
+    ranks = np.arange(sorted_values.size) - starts[sorted_ids] + 1
+    h_indices = np.bincount(
+        sorted_ids, weights=sorted_values >= ranks, minlength=n_fields
+    ).astype(np.int64)
+
+    return {
+        "count": counts,
+        "sum": sums,
+        "mean": means,
+        "std": stds,
+        "median": medians,
+        "max": maxs,
+        "min": mins,
+        "h_index": h_indices,
+    }
+
+
+def field_quantiles(
+    values: np.ndarray, field_ids: np.ndarray, n_fields: int, q: float
+) -> np.ndarray:
+    """Calculate a quantile of the values of every field at once.
+
+    Quantiles are linearly interpolated between the two closest ranks, as
+    with NumPy's and pandas' default method. One sort groups all fields.
+
+    Args:
+        values: Numeric values without NaN, one per paper
+        field_ids: Integer field id (0..n_fields-1) for each value
+        n_fields: Number of distinct fields
+        q: Quantile to compute, between 0 and 1
+
+    Returns:
+        Array of per-field quantiles indexed by field id (NaN for empty fields)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    field_ids = np.asarray(field_ids, dtype=np.intp)
+
+    counts = np.bincount(field_ids, minlength=n_fields)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    sorted_values = values[np.lexsort((values, field_ids))]
+
+    quantiles = np.full(n_fields, np.nan)
+    nonempty = counts > 0
+    if not nonempty.any():
+        return quantiles
+
+    position = q * (counts[nonempty] - 1)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.ceil(position).astype(np.intp)
+    offsets = starts[nonempty]
+    low_values = sorted_values[offsets + lower]
+    high_values = sorted_values[offsets + upper]
+    quantiles[nonempty] = low_values + (high_values - low_values) * (position - lower)
+    return quantiles
@@ -1,16 +1,160 @@
 """Field normalization for academic metrics."""
 
 import logging
+import math
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from ..core.models import PaperRecord
+from ._fieldnorm_kernels import cdf_array, field_stats
 
 logger = logging.getLogger(__name__)
 
+# Empirical RCR distribution parameters by field (approximate):
+# (mean_log_rcr, std_log_rcr). These are rough estimates - in production,
+# would use actual field distributions.
+_FIELD_RCR_PARAMS = {
+    "Medicine": (0.0, 0.8),
+    "Biology": (0.0, 0.85),
+    "Physics": (0.0, 0.75),
+    "Chemistry": (0.0, 0.8),
+    "Computer Science": (0.0, 0.9),
+    "Engineering": (0.0, 0.85),
+    "Mathematics": (0.0, 0.7),
+    "Social Sciences": (0.0, 0.9),
+}
+_FIELD_RCR_PARAMS_LC = tuple(
+    (name.lower(), params) for name, params in _FIELD_RCR_PARAMS.items()
+)
+
+# Default parameters for unknown fields
+_DEFAULT_RCR_PARAMS = (0.0, 0.8)
+
+# Attribute getters for the per-paper columns (resolved once, not per paper)
+_get_citation_count = attrgetter("citation_count")
+_get_paper_columns = attrgetter(
+    "id",
+    "title",
+    "primary_field",
+    "citation_count",
+    "rcr",
+    "year",
+    "percentile",
+    "independent_citations",
+)
+
+# Column layout of the field comparison matrix
+_COMPARISON_MATRIX_DTYPE = np.dtype(
+    [
+        ("field", "O"),
+        ("paper_count", "i8"),
+        ("total_citations", "i8"),
+        ("mean_citations", "f8"),
+        ("median_citations", "f8"),
+        ("max_citations", "i8"),
+        ("h_index", "i8"),
+        ("mean_rcr", "f8"),
+        ("median_rcr", "f8"),
+        ("papers_with_rcr", "i8"),
+        ("rcr_coverage", "f8"),
+        ("year_range_start", "f8"),
+        ("year_range_end", "f8"),
+        ("papers_per_year", "f8"),
+    ]
+)
+
+
+@lru_cache(maxsize=256)
+def _field_rcr_params(field: str) -> Tuple[float, float]:
+    """Look up RCR distribution parameters for a field (fuzzy match)."""
+    if not field:
+        return _DEFAULT_RCR_PARAMS
+
+    field_lc = field.lower()
+    for name_lc, params in _FIELD_RCR_PARAMS_LC:
+        if name_lc in field_lc or field_lc in name_lc:
+            return params
+
+    return _DEFAULT_RCR_PARAMS
+
+
+@dataclass
+class PapersSoA:
+    """Column-oriented (structure-of-arrays) view of a list of papers.
+
+    Built once with ``FieldNormalizer.from_papers`` so that the field analyses
+    work on contiguous arrays instead of per-paper attribute access. Missing
+    numeric values are NaN; fields are stored as integer codes into ``fields``.
+    """
+
+    papers: List[PaperRecord]
+    ids: np.ndarray
+    titles: np.ndarray
+    citation_count: np.ndarray
+    rcr: np.ndarray
+    year: np.ndarray
+    percentile: np.ndarray
+    independent_citations: np.ndarray
+    field_codes: np.ndarray
+    fields: np.ndarray
+    _group_indices: Optional[List[np.ndarray]] = dataclass_field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __len__(self) -> int:
+        return len(self.papers)
+
+    def take(self, indices: np.ndarray) -> "PapersSoA":
+        """Select a subset of papers by position.
+
+        Args:
+            indices: Positions of the papers to keep
+
+        Returns:
+            New ``PapersSoA`` sharing the same field categories
+        """
+        return PapersSoA(
+            papers=[self.papers[i] for i in indices],
+            ids=self.ids[indices],
+            titles=self.titles[indices],
+            citation_count=self.citation_count[indices],
+            rcr=self.rcr[indices],
+            year=self.year[indices],
+            percentile=self.percentile[indices],
+            independent_citations=self.independent_citations[indices],
+            field_codes=self.field_codes[indices],
+            fields=self.fields,
+        )
+
+    def group_indices(self) -> List[np.ndarray]:
+        """Positions of the papers in each field, indexed by field code.
+
+        Computed on first use and reused by every analysis of this view.
+
+        Returns:
+            One array per field, with positions in input order
+        """
+        if self._group_indices is None:
+            order = np.argsort(self.field_codes, kind="stable")
+            counts = np.bincount(self.field_codes, minlength=len(self.fields))
+            self._group_indices = np.split(order, np.cumsum(counts)[:-1])
+        return self._group_indices
+
+    def group_index(self) -> Dict[str, np.ndarray]:
+        """Positions of the papers in each field, keyed by field name.
+
+        Returns:
+            Dictionary mapping field names to position arrays
+        """
+        return dict(zip(self.fields, self.group_indices()))
+
 
 class FieldNormalizer:
     """Calculates field-normalized metrics for papers."""
@@ -18,7 +162,8 @@ class FieldNormalizer:
     def __init__(self):
         """Initialize field normalizer."""
         self.logger = logger
-        self.field_baselines = {}  # Cache field-specific baselines
+        # Cache field-specific baselines, keyed by (field, hash of paper ids)
+        self.field_baselines: Dict[Tuple[Optional[str], int], Tuple] = {}
 
     def calculate_rcr_percentile(
         self, rcr: float, field: str, year: int
@@ -39,73 +184,64 @@ class FieldNormalizer:
         if not rcr or rcr <= 0:
             return None
 
-        # Empirical RCR distribution parameters by field (approximate)
-        # These are rough estimates - in production, would use actual field distributions
-        field_params = {
-            "Medicine": {"mean_log_rcr": 0.0, "std_log_rcr": 0.8},
-            "Biology": {"mean_log_rcr": 0.0, "std_log_rcr": 0.85},
-            "Physics": {"mean_log_rcr": 0.0, "std_log_rcr": 0.75},
-            "Chemistry": {"mean_log_rcr": 0.0, "std_log_rcr": 0.8},
-            "Computer Science": {"mean_log_rcr": 0.0, "std_log_rcr": 0.9},
-            "Engineering": {"mean_log_rcr": 0.0, "std_log_rcr": 0.85},
-            "Mathematics": {"mean_log_rcr": 0.0, "std_log_rcr": 0.7},
-            "Social Sciences": {"mean_log_rcr": 0.0, "std_log_rcr": 0.9},
-        }
-
-        # Default parameters for unknown fields
-        default_params = {"mean_log_rcr": 0.0, "std_log_rcr": 0.8}
-
-        # Get field parameters (fuzzy match)
-        params = default_params
-        if field:
-            for field_key, field_params_val in field_params.items():
-                if (
-                    field_key.lower() in field.lower()
-                    or field.lower() in field_key.lower()
-                ):
-                    params = field_params_val
-                    break
+        percentile = self.calculate_rcr_percentiles_batch([rcr], [field], [year])[0]
+        return float(percentile)
 
-        # Adjust for publication year (older papers tend to have higher RCR)
-        year_adjustment = 0.0
-        if year and year < 2020:
-            year_adjustment = (2020 - year) * 0.02  # 2% adjustment per year
+    def calculate_rcr_percentiles_batch(
+        self,
+        rcrs: Sequence[Optional[float]],
+        fields: Sequence[Optional[str]],
+        years: Sequence[Optional[int]],
+    ) -> np.ndarray:
+        """Convert many RCR values to field-specific percentiles at once.
+
+        Vectorized equivalent of ``calculate_rcr_percentile``.
 
-        # Calculate log-normal percentile
-        log_rcr = np.log(rcr)
-        adjusted_log_rcr = log_rcr - year_adjustment
+        Args:
+            rcrs: Relative Citation Ratios (None or non-positive if unknown)
+            fields: Primary field of study for each RCR
+            years: Publication year for each RCR
+
+        Returns:
+            Array of percentiles (0.1-99.9), NaN where no percentile applies
+        """
+        rcrs = np.array(rcrs, dtype=np.float64)
+        years = np.array(years, dtype=np.float64)
+
+        field_ids, unique_fields = pd.factorize(
+            np.array([field or "" for field in fields], dtype=object)
+        )
+        params = np.array(
+            [_field_rcr_params(field) for field in unique_fields], dtype=np.float64
+        ).reshape(-1, 2)
+        means = params[field_ids, 0]
+        stds = params[field_ids, 1]
+
+        # Adjust for publication year (older papers tend to have higher RCR)
+        year_adjustment = np.where(
+            (years > 0) & (years < 2020), (2020 - years) * 0.02, 0.0
+        )
 
-        # Standard normal CDF approximation
-        z_score = (adjusted_log_rcr - params["mean_log_rcr"]) / params["std_log_rcr"]
-        percentile = self._norm_cdf(z_score) * 100
+        # Log-normal percentile; invalid RCRs become NaN
+        valid = rcrs > 0
+        log_rcrs = np.log(np.where(valid, rcrs, np.nan))
+        z_scores = (log_rcrs - year_adjustment - means) / stds
+        percentiles = np.clip(cdf_array(z_scores) * 100, 0.1, 99.9)
 
-        return min(99.9, max(0.1, percentile))
+        return percentiles
 
-    def _norm_cdf(self, x: float) -> float:
-        """Approximate standard normal CDF using error function.
+    def _norm_cdf(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Standard normal CDF.
 
         Args:
-            x: Standard normal variable
+            x: Standard normal variable (scalar or array)
 
         Returns:
-            Cumulative probability
+            Cumulative probability (array for array input)
         """
-        # Abramowitz and Stegun approximation
-        t = 1.0 / (1.0 + 0.2316419 * abs(x))
-        d = 0.3989423 * np.exp(-x * x / 2.0)
-        prob = (
-            d
-            * t
-            * (
-                0.3193815
-                + t * (-0.3565638 + t * (1.7814779 + t * (-1.8212560 + t * 1.3302744)))
-            )
-        )
-
-        if x > 0:
-            return 1.0 - prob
-        else:
-            return prob
+        if isinstance(x, np.ndarray):
+            return cdf_array(x)
+        return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
 
     def calculate_field_impact_score(
         self, paper: PaperRecord, field_benchmarks: Optional[Dict] = None
@@ -124,301 +260,422 @@ class FieldNormalizer:
         if not paper:
             return 0.0
 
-        components = []
-        weights = []
-
-        # Citation count component (log-transformed)
-        if paper.citation_count > 0:
-            citation_score = min(100, np.log1p(paper.citation_count) * 15)
-            components.append(citation_score)
-            weights.append(0.3)
-
-        # RCR component
-        if paper.rcr and paper.rcr > 0:
-            rcr_score = min(100, paper.rcr * 20)  # RCR of 5.0 = 100 points
-            components.append(rcr_score)
-            weights.append(0.4)
-
-        # Percentile component
-        if paper.percentile:
-            components.append(paper.percentile)
-            weights.append(0.2)
-
-        # Independence component
-        if paper.independent_citations is not None and paper.citation_count > 0:
-            independence_ratio = paper.independent_citations / paper.citation_count
-            independence_score = independence_ratio * 100
-            components.append(independence_score)
-            weights.append(0.1)
-
-        if not components:
-            return 0.0
+        return float(self.calculate_field_impact_scores([paper])[0])
+
+    def calculate_field_impact_scores(
+        self, papers: Union[PapersSoA, List[PaperRecord]]
+    ) -> np.ndarray:
+        """Calculate field-adjusted impact scores for many papers at once.
+
+        Vectorized equivalent of ``calculate_field_impact_score``: each
+        component only contributes (with its weight) where it is available.
 
-        # Weighted average
-        weighted_score = sum(c * w for c, w in zip(components, weights)) / sum(weights)
+        Args:
+            papers: List of paper records or their ``PapersSoA`` view
+
+        Returns:
+            Array of field-adjusted impact scores (0-100), one per paper
+        """
+        soa = self._as_soa(papers)
+        n = len(soa)
+        cc = np.nan_to_num(soa.citation_count, nan=0.0)
+        rcr = soa.rcr
+        pct = soa.percentile
+        indep = soa.independent_citations
+
+        has_citations = cc > 0
+        safe_cc = np.where(has_citations, cc, 1.0)
+
+        # Columns: citation count (log-transformed), RCR, percentile, independence
+        components = np.column_stack(
+            (
+                np.minimum(100, np.log1p(cc) * 15),
+                np.minimum(100, rcr * 20),  # RCR of 5.0 = 100 points
+                pct,
+                indep / safe_cc * 100,
+            )
+        )
+        present = np.column_stack(
+            (
+                has_citations,
+                rcr > 0,
+                ~np.isnan(pct) & (pct != 0),
+                ~np.isnan(indep) & has_citations,
+            )
+        )
+        weights = present * np.array([0.3, 0.4, 0.2, 0.1])
+
+        weight_sums = weights.sum(axis=1)
+        weighted = np.where(present, components, 0.0) * weights
+        scores = np.divide(
+            weighted.sum(axis=1),
+            weight_sums,
+            out=np.zeros(n),
+            where=weight_sums > 0,
+        )
 
-        return min(100, max(0, weighted_score))
+        return np.clip(scores, 0, 100)
 
     def normalize_citation_metrics(
-        self, papers: List[PaperRecord], by_field: bool = True
+        self, papers: Union[PapersSoA, List[PaperRecord]], by_field: bool = True
     ) -> List[PaperRecord]:
         """Normalize citation metrics across papers.
 
         Args:
-            papers: List of paper records
+            papers: List of paper records or their ``PapersSoA`` view
             by_field: Whether to normalize within fields
 
         Returns:
             List of papers with normalized metrics
         """
-        if not papers:
-            return papers
+        soa = self._as_soa(papers)
+        if not soa:
+            return soa.papers
 
         # Group papers by field if requested
         if by_field:
-            field_groups = defaultdict(list)
-            for paper in papers:
-                field = paper.primary_field or "Unknown"
-                field_groups[field].append(paper)
-
             normalized_papers = []
-            for field, field_papers in field_groups.items():
-                normalized_papers.extend(self._normalize_field_group(field_papers))
+            for field, indices in zip(soa.fields, soa.group_indices()):
+                normalized_papers.extend(
+                    self._normalize_field_group(soa.take(indices), field)
+                )
 
             return normalized_papers
         else:
-            return self._normalize_field_group(papers)
+            return self._normalize_field_group(soa)
 
-    def _normalize_field_group(self, papers: List[PaperRecord]) -> List[PaperRecord]:
+    def _normalize_field_group(
+        self,
+        papers: Union[PapersSoA, List[PaperRecord]],
+        field: Optional[str] = None,
+    ) -> List[PaperRecord]:
         """Normalize metrics within a single field group.
 
         Args:
             papers: Papers from same field
+            field: Field name used to cache the group's baseline statistics
 
         Returns:
             Papers with normalized metrics
         """
-        if len(papers) < 2:
-            return papers
+        soa = self._as_soa(papers)
+        if len(soa) < 2:
+            return soa.papers
 
-        # Extract metrics
-        citations = [p.citation_count for p in papers if p.citation_count is not None]
-        rcrs = [p.rcr for p in papers if p.rcr is not None and p.rcr > 0]
+        # Metrics as arrays (NaN marks missing values)
+        cites = soa.citation_count
+        rcrs = np.where(soa.rcr > 0, soa.rcr, np.nan)
 
-        if not citations:
-            return papers
+        citation_mean, citation_std, rcr_mean, rcr_std, n_citations = (
+            self._field_baseline(soa, field)
+        )
+
+        if not n_citations:
+            return soa.papers
+
+        impact_scores = self.calculate_field_impact_scores(soa)
+
+        # Identical values everywhere: no z-scores to write, only impact scores
+        if citation_std == 0 and rcr_std == 0:
+            return [
+                paper.model_copy(update={"field_impact_score": float(impact)})
+                for paper, impact in zip(soa.papers, impact_scores)
+            ]
 
-        # Calculate field statistics
-        citation_mean = np.mean(citations)
-        citation_std = np.std(citations) if len(citations) > 1 else 1.0
+        # Vectorized z-scores and percentiles for the whole group
+        if citation_std > 0:
+            citation_z = (cites - citation_mean) / citation_std
+            citation_pct = cdf_array(citation_z) * 100.0
+        else:
+            citation_z = citation_pct = np.full(len(soa), np.nan)
 
-        rcr_mean = np.mean(rcrs) if rcrs else 1.0
-        rcr_std = np.std(rcrs) if len(rcrs) > 1 else 1.0
+        if rcr_std > 0:
+            rcr_z = (rcrs - rcr_mean) / rcr_std
+        else:
+            rcr_z = np.full(len(soa), np.nan)
 
         # Normalize each paper
         normalized_papers = []
-        for paper in papers:
-            # Create copy to avoid modifying original
-            normalized_paper = PaperRecord(**paper.model_dump())
+
+        for paper, c_z, c_pct, r_z, impact in zip(
+            soa.papers, citation_z, citation_pct, rcr_z, impact_scores
+        ):
+            updates = {"field_impact_score": float(impact)}
 
             # Citation z-score
-            if paper.citation_count is not None and citation_std > 0:
-                citation_z = (paper.citation_count - citation_mean) / citation_std
-                normalized_paper.citation_z_score = citation_z
-                normalized_paper.citation_percentile = self._norm_cdf(citation_z) * 100
+            if not np.isnan(c_z):
+                updates["citation_z_score"] = float(c_z)
+                updates["citation_percentile"] = float(c_pct)
 
             # RCR z-score
-            if paper.rcr is not None and paper.rcr > 0 and rcr_std > 0:
-                rcr_z = (paper.rcr - rcr_mean) / rcr_std
-                normalized_paper.rcr_z_score = rcr_z
+            if not np.isnan(r_z):
+                updates["rcr_z_score"] = float(r_z)
 
-            # Calculate field impact score
-            normalized_paper.field_impact_score = self.calculate_field_impact_score(
-                normalized_paper
-            )
-
-            normalized_papers.append(normalized_paper)
+            # Shallow copy with all updates applied at once (no re-validation)
+            normalized_papers.append(paper.model_copy(update=updates))
 
         return normalized_papers
 
+    def _field_baseline(
+        self, soa: PapersSoA, field: Optional[str]
+    ) -> Tuple[float, float, float, float, int]:
+        """Get (or compute and cache) baseline statistics for a field group.
+
+        Baselines are keyed by the field and the set of paper ids, so
+        re-normalizing the same group reuses them. Use ``invalidate_field``
+        when the metrics of cached papers change.
+
+        Args:
+            soa: Papers from same field
+            field: Field name
+
+        Returns:
+            Tuple of (citation_mean, citation_std, rcr_mean, rcr_std,
+            papers_with_citations)
+        """
+        key = (field, hash(tuple(sorted(soa.ids))))
+        baseline = self.field_baselines.get(key)
+        if baseline is not None:
+            return baseline
+
+        cites = soa.citation_count
+        rcrs = np.where(soa.rcr > 0, soa.rcr, np.nan)
+
+        n_citations = int(np.count_nonzero(~np.isnan(cites)))
+        n_rcrs = int(np.count_nonzero(~np.isnan(rcrs)))
+
+        if n_citations:
+            citation_mean = float(np.nanmean(cites))
+            citation_std = float(np.nanstd(cites)) if n_citations > 1 else 1.0
+        else:
+            citation_mean = citation_std = np.nan
+
+        rcr_mean = float(np.nanmean(rcrs)) if n_rcrs else 1.0
+        rcr_std = float(np.nanstd(rcrs)) if n_rcrs > 1 else 1.0
+
+        baseline = (citation_mean, citation_std, rcr_mean, rcr_std, n_citations)
+        self.field_baselines[key] = baseline
+        return baseline
+
+    def invalidate_field(self, field: Optional[str] = None) -> None:
+        """Drop cached baseline statistics.
+
+        Args:
+            field: Field whose baselines to drop; all fields if None
+        """
+        if field is None:
+            self.field_baselines.clear()
+            return
+
+        for key in [key for key in self.field_baselines if key[0] == field]:
+            del self.field_baselines[key]
+
     def identify_field_outliers(
-        self, papers: List[PaperRecord], threshold: float = 2.0
+        self, papers: Union[PapersSoA, List[PaperRecord]], threshold: float = 2.0
     ) -> Dict[str, List[PaperRecord]]:
         """Identify papers that are outliers in their fields.
 
         Args:
-            papers: List of paper records
+            papers: List of paper records or their ``PapersSoA`` view
             threshold: Z-score threshold for outlier detection
 
         Returns:
             Dictionary mapping field names to outlier papers
         """
-        outliers = defaultdict(list)
-
-        if not papers:
-            return dict(outliers)
-
-        # Group by field
-        field_groups = defaultdict(list)
-        for paper in papers:
-            field = paper.primary_field or "Unknown"
-            field_groups[field].append(paper)
-
-        # Find outliers in each field
-        for field, field_papers in field_groups.items():
-            if (
-                len(field_papers) < 3
-            ):  # Need at least 3 papers for meaningful outlier detection
-                continue
-
-            citations = [
-                p.citation_count for p in field_papers if p.citation_count is not None
-            ]
-            if len(citations) < 3:
-                continue
+        soa = self._as_soa(papers)
+        if not soa:
+            return {}
 
-            mean_citations = np.mean(citations)
-            std_citations = np.std(citations)
+        n_fields = len(soa.fields)
+        citations = soa.citation_count
+        valid = ~np.isnan(citations)
+
+        # Population statistics per field, broadcast back to each paper
+        stats = field_stats(citations[valid], soa.field_codes[valid], n_fields)
+        mean = stats["mean"][soa.field_codes]
+        std = stats["std"][soa.field_codes]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_scores = np.abs(citations - mean) / std
+
+        # Need at least 3 papers (with citations) for meaningful outlier detection
+        sizes = np.bincount(soa.field_codes, minlength=n_fields)
+        eligible = (
+            valid
+            & (sizes[soa.field_codes] >= 3)
+            & (stats["count"][soa.field_codes] >= 3)
+            & (std > 0)
+        )
 
-            if std_citations == 0:
-                continue
+        # Report fields in order of first appearance, papers in input order
+        flagged = np.flatnonzero(eligible & (z_scores > threshold))
+        flagged = flagged[np.argsort(soa.field_codes[flagged], kind="stable")]
 
-            for paper in field_papers:
-                if paper.citation_count is not None:
-                    z_score = abs(paper.citation_count - mean_citations) / std_citations
-                    if z_score > threshold:
-                        outliers[field].append(paper)
+        outliers = defaultdict(list)
+        for i in flagged:
+            outliers[soa.fields[soa.field_codes[i]]].append(soa.papers[i])
 
         return dict(outliers)
 
-    def calculate_field_rankings(self, papers: List[PaperRecord]) -> Dict[str, Any]:
+    def calculate_field_rankings(
+        self, papers: Union[PapersSoA, List[PaperRecord]]
+    ) -> Dict[str, Any]:
         """Calculate rankings within each field.
 
         Args:
-            papers: List of paper records
+            papers: List of paper records or their ``PapersSoA`` view
 
         Returns:
             Dictionary with field rankings and statistics
         """
-        if not papers:
+        soa = self._as_soa(papers)
+        if not soa:
             return {}
 
-        # Group by field
-        field_groups = defaultdict(list)
-        for paper in papers:
-            field = paper.primary_field or "Unknown"
-            field_groups[field].append(paper)
+        citations = np.nan_to_num(soa.citation_count, nan=0.0)
 
-        field_rankings = {}
+        # Field statistics for all fields in one pass
+        stats = field_stats(citations, soa.field_codes, len(soa.fields))
 
-        for field, field_papers in field_groups.items():
-            # Sort by citation count
-            sorted_papers = sorted(
-                field_papers, key=lambda p: p.citation_count or 0, reverse=True
-            )
+        field_rankings = {}
+        citation_counts = list(map(_get_citation_count, soa.papers))
 
-            # Calculate rankings
-            rankings = []
-            for i, paper in enumerate(sorted_papers, 1):
-                rank_info = {
-                    "paper_id": paper.id,
-                    "title": paper.title,
-                    "citation_count": paper.citation_count,
-                    "rank": i,
-                    "percentile_rank": ((len(sorted_papers) - i) / len(sorted_papers))
-                    * 100,
+        for idx, (field, indices) in enumerate(zip(soa.fields, soa.group_indices())):
+            # One stable sort by citation count gives ranks and percentile ranks
+            if stats["std"][idx] == 0:
+                # All citation counts equal: the stable order is the input order
+                ranked = indices
+            else:
+                ranked = indices[np.argsort(-citations[indices], kind="stable")]
+            n_papers = len(ranked)
+            ranks = np.arange(1, n_papers + 1)
+
+            rankings = pd.DataFrame(
+                {
+                    "paper_id": soa.ids[ranked],
+                    "title": soa.titles[ranked],
+                    "citation_count": [citation_counts[i] for i in ranked],
+                    "rank": ranks,
+                    "percentile_rank": (n_papers - ranks) / n_papers * 100,
                 }
-                rankings.append(rank_info)
-
-            # Field statistics
-            citations = [p.citation_count or 0 for p in field_papers]
-            field_stats = {
-                "total_papers": len(field_papers),
-                "mean_citations": np.mean(citations),
-                "median_citations": np.median(citations),
-                "max_citations": max(citations),
-                "min_citations": min(citations),
-                "std_citations": np.std(citations),
-                "total_citations": sum(citations),
+            ).to_dict("records")
+
+            statistics = {
+                "total_papers": n_papers,
+                "mean_citations": stats["mean"][idx],
+                "median_citations": stats["median"][idx],
+                "max_citations": int(stats["max"][idx]),
+                "min_citations": int(stats["min"][idx]),
+                "std_citations": stats["std"][idx],
+                "total_citations": int(stats["sum"][idx]),
+                "h_index": int(stats["h_index"][idx]),
             }
 
-            field_rankings[field] = {"rankings": rankings, "statistics": field_stats}
+            field_rankings[field] = {"rankings": rankings, "statistics": statistics}
 
         return field_rankings
 
-    def create_field_comparison_matrix(self, papers: List[PaperRecord]) -> pd.DataFrame:
+    def create_field_comparison_matrix(
+        self, papers: Union[PapersSoA, List[PaperRecord]]
+    ) -> pd.DataFrame:
         """Create a matrix comparing metrics across fields.
 
         Args:
-            papers: List of paper records
+            papers: List of paper records or their ``PapersSoA`` view
 
         Returns:
             DataFrame with field comparison metrics
         """
-        if not papers:
+        soa = self._as_soa(papers)
+        if not soa:
             return pd.DataFrame()
 
-        field_data = []
-
-        # Group by field
-        field_groups = defaultdict(list)
-        for paper in papers:
-            field = paper.primary_field or "Unknown"
-            field_groups[field].append(paper)
-
-        for field, field_papers in field_groups.items():
-            citations = [p.citation_count or 0 for p in field_papers]
-            rcrs = [p.rcr for p in field_papers if p.rcr is not None and p.rcr > 0]
-            years = [p.year for p in field_papers if p.year is not None]
-
-            field_metrics = {
-                "field": field,
-                "paper_count": len(field_papers),
-                "total_citations": sum(citations),
-                "mean_citations": np.mean(citations) if citations else 0,
-                "median_citations": np.median(citations) if citations else 0,
-                "max_citations": max(citations) if citations else 0,
-                "h_index": self._calculate_h_index(citations),
-                "mean_rcr": np.mean(rcrs) if rcrs else None,
-                "median_rcr": np.median(rcrs) if rcrs else None,
-                "papers_with_rcr": len(rcrs),
-                "rcr_coverage": len(rcrs) / len(field_papers) if field_papers else 0,
-                "year_range_start": min(years) if years else None,
-                "year_range_end": max(years) if years else None,
-                "papers_per_year": len(field_papers) / (max(years) - min(years) + 1)
-                if years and len(set(years)) > 1
-                else None,
-            }
+        # Integer field codes let all fields be reduced in one pass
+        field_ids = soa.field_codes
+        n_fields = len(soa.fields)
 
-            field_data.append(field_metrics)
+        citations = np.nan_to_num(soa.citation_count, nan=0.0)
+        rcrs = np.where(soa.rcr > 0, soa.rcr, np.nan)
+        years = soa.year
 
-        if not field_data:
-            return pd.DataFrame()
+        has_rcr = ~np.isnan(rcrs)
+        has_year = ~np.isnan(years)
 
-        df = pd.DataFrame(field_data)
+        citation_stats = field_stats(citations, field_ids, n_fields)
+        rcr_stats = field_stats(rcrs[has_rcr], field_ids[has_rcr], n_fields)
+        year_stats = field_stats(years[has_year], field_ids[has_year], n_fields)
+
+        paper_counts = citation_stats["count"]
+        year_span = year_stats["max"] - year_stats["min"]
+        papers_per_year = np.full(n_fields, np.nan)
+        multi_year = year_span > 0
+        papers_per_year[multi_year] = paper_counts[multi_year] / (
+            year_span[multi_year] + 1
+        )
+
+        # Fill a typed record array so no per-column dtype inference is needed
+        matrix = np.empty(n_fields, dtype=_COMPARISON_MATRIX_DTYPE)
+        matrix["field"] = soa.fields
+        matrix["paper_count"] = paper_counts
+        matrix["total_citations"] = citation_stats["sum"]
+        matrix["mean_citations"] = citation_stats["mean"]
+        matrix["median_citations"] = citation_stats["median"]
+        matrix["max_citations"] = citation_stats["max"]
+        matrix["h_index"] = citation_stats["h_index"]
+        matrix["mean_rcr"] = rcr_stats["mean"]
+        matrix["median_rcr"] = rcr_stats["median"]
+        matrix["papers_with_rcr"] = rcr_stats["count"]
+        matrix["rcr_coverage"] = rcr_stats["count"] / paper_counts
+        matrix["year_range_start"] = year_stats["min"]
+        matrix["year_range_end"] = year_stats["max"]
+        matrix["papers_per_year"] = papers_per_year
+
+        df = pd.DataFrame.from_records(matrix)
+        df["field"] = pd.Categorical(df["field"], categories=soa.fields)
         df = df.sort_values("total_citations", ascending=False)
 
         return df
 
-    def _calculate_h_index(self, citations: List[int]) -> int:
-        """Calculate h-index for a list of citation counts.
+    @staticmethod
+    def from_papers(papers: List[PaperRecord]) -> PapersSoA:
+        """Build the structure-of-arrays view of papers in a single pass.
 
         Args:
-            citations: List of citation counts
+            papers: List of paper records
 
         Returns:
-            H-index value
+            ``PapersSoA`` with one array element per paper, in input order
         """
-        if not citations:
-            return 0
+        n_papers = len(papers)
+        ids, titles, field_names, cc, rcr, year, pct, indep = (
+            zip(*map(_get_paper_columns, papers)) if papers else ((),) * 8
+        )
 
-        sorted_citations = sorted(citations, reverse=True)
-        h_index = 0
+        def to_array(values) -> np.ndarray:
+            return np.fromiter(
+                (np.nan if v is None else v for v in values),
+                dtype=np.float64,
+                count=n_papers,
+            )
 
-        for i, cite_count in enumerate(sorted_citations, 1):
-            if cite_count >= i:
-                h_index = i
-            else:
-                break
+        field_codes, fields = pd.factorize(
+            np.array([name or "Unknown" for name in field_names], dtype=object)
+        )
 
-        return h_index
+        return PapersSoA(
+            papers=papers,
+            ids=np.array(ids, dtype=object),
+            titles=np.array(titles, dtype=object),
+            citation_count=to_array(cc),
+            rcr=to_array(rcr),
+            year=to_array(year),
+            percentile=to_array(pct),
+            independent_citations=to_array(indep),
+            field_codes=field_codes.astype(np.intp),
+            fields=np.asarray(fields, dtype=object),
+        )
+
+    def _as_soa(self, papers: Union[PapersSoA, List[PaperRecord]]) -> PapersSoA:
+        """Return papers as a ``PapersSoA``, building it from a list if needed."""
+        if isinstance(papers, PapersSoA):
+            return papers
+        return self.from_papers(papers)
@@ -1,17 +1,196 @@
 """Independence classifier for distinguishing self-citations from independent citations."""
 
 import logging
+import os
 import re
+import sys
 from collections import defaultdict
-from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz, process
 
 from ..core.models import Author, Citation, Institution, PaperRecord
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# Honorifics and name suffixes dropped from author names
+_PREFIXES = frozenset({"dr.", "prof.", "mr.", "ms.", "mrs."})
+_SUFFIXES = frozenset({"jr.", "sr.", "iii", "iv", "phd", "md"})
+
+# Common institution words that don't affect identity
+_INST_STOP = frozenset(
+    {
+        "university",
+        "college",
+        "institute",
+        "school",
+        "center",
+        "centre",
+        "hospital",
+        "medical",
+        "health",
+        "system",
+        "dept",
+        "department",
+        "faculty",
+        "division",
+        "laboratory",
+        "lab",
+        "research",
+        "sciences",
+    }
+)
+
+
+@lru_cache(maxsize=200_000)
+def _normalize_author_name(name: str) -> str:
+    """Normalize author name for comparison.
+
+    Args:
+        name: Author name
+
+    Returns:
+        Normalized author name
+    """
+    if not name:
+        return ""
+
+    # Convert to lowercase and remove extra whitespace
+    normalized = _WS_RE.sub(" ", name.lower().strip())
+
+    words = normalized.split()
+
+    # Remove common prefixes/suffixes
+    if words and words[0] in _PREFIXES:
+        words = words[1:]
+
+    if words and words[-1] in _SUFFIXES:
+        words = words[:-1]
+
+    # Handle "Last, First" format
+    if len(words) >= 2 and "," in words[0]:
+        parts = normalized.split(",")
+        if len(parts) == 2:
+            last = parts[0].strip()
+            first = parts[1].strip()
+            normalized = f"{first} {last}"
+        else:
+            normalized = " ".join(words)
+    else:
+        normalized = " ".join(words)
+
+    # Remove punctuation except spaces; interned for cheap set operations
+    return sys.intern(_PUNCT_RE.sub("", normalized))
+
+
+@lru_cache(maxsize=200_000)
+def _normalize_institution_name(name: str) -> str:
+    """Normalize institution name for comparison.
+
+    Args:
+        name: Institution name
+
+    Returns:
+        Normalized institution name
+    """
+    if not name:
+        return ""
+
+    # Fast path: short single-word names ("MIT", "CERN") are already canonical
+    stripped = name.lower().strip()
+    if len(stripped) <= 8 and stripped.isalnum() and stripped not in _INST_STOP:
+        return sys.intern(stripped)
+
+    # Convert to lowercase and remove extra whitespace
+    normalized = _WS_RE.sub(" ", stripped)
+
+    words = normalized.split()
+    # Keep core identifying words
+    core_words = [word for word in words if word not in _INST_STOP]
+
+    # If removing common words leaves too few words, keep original
+    if len(core_words) < 2 and len(words) > 2:
+        normalized = " ".join(words)
+    else:
+        normalized = " ".join(core_words)
+
+    # Remove punctuation except spaces; interned for cheap set operations
+    return sys.intern(_PUNCT_RE.sub("", normalized))
+
+
+def _normalize_orcid(orcid: str) -> str:
+    """Reduce an ORCID (bare or https://orcid.org/ URL) to its identifier.
+
+    Args:
+        orcid: ORCID identifier or URL
+
+    Returns:
+        Upper-cased bare identifier
+    """
+    return orcid.strip().rstrip("/").rsplit("/", 1)[-1].upper()
+
+
+class _NormAuthor(NamedTuple):
+    """Tokenized form of a normalized author name."""
+
+    text: str
+    words: Tuple[str, ...]
+    initials: str
+
+
+@lru_cache(maxsize=200_000)
+def _author_tokens(normalized: str) -> _NormAuthor:
+    """Split a normalized author name into words and initials.
+
+    Two names can only match with initials if their initials are equal, so the
+    initials string doubles as a cheap blocking key.
+
+    Args:
+        normalized: Normalized author name
+
+    Returns:
+        Name text, its words and the first letter of each word
+    """
+    words = tuple(normalized.split())
+    return _NormAuthor(normalized, words, "".join(word[0] for word in words))
+
+
+def _lengths_can_match(length1, length2, threshold: float):
+    """Check the upper bound of the fuzzy ratio given only the name lengths.
+
+    ``fuzz.ratio`` is ``2 * LCS / (len1 + len2)`` and the longest common
+    subsequence is at most the shorter length, so pairs failing this bound can
+    be rejected without scoring. Works on scalars and NumPy arrays.
+
+    Args:
+        length1: Length(s) of the first name(s)
+        length2: Length(s) of the second name(s)
+        threshold: Similarity threshold (0-1)
+
+    Returns:
+        False (elementwise) where the pair can never reach the threshold
+    """
+    # Small tolerance so float rounding never rejects a pair exactly at the bound
+    bound = threshold * (length1 + length2) - 1e-9
+    return 2 * np.minimum(length1, length2) >= bound
+
 
 class IndependenceClassifier:
     """Classifies citations as self-citations or independent citations."""
@@ -31,15 +210,22 @@ class IndependenceClassifier:
         self.author_threshold = author_similarity_threshold
         self.institution_threshold = institution_similarity_threshold
 
-        # Cache for author and institution normalizations
-        self.author_cache = {}
-        self.institution_cache = {}
+        # Normalized names per Author/Institution object (keyed by id()),
+        # filled once per classify_citations call. The objects are kept
+        # alive alongside so their ids cannot be reused while cached.
+        self._norm_author_by_id: Dict[int, str] = {}
+        self._norm_institution_by_id: Dict[int, str] = {}
+        self._normalized_objects: List[Any] = []
 
-    def classify_citations(self, papers: List[PaperRecord]) -> List[PaperRecord]:
+    def classify_citations(
+        self, papers: List[PaperRecord], n_jobs: int = 1
+    ) -> List[PaperRecord]:
         """Classify all citations in the papers as self or independent.
 
         Args:
             papers: List of paper records with citations
+            n_jobs: Number of worker threads classifying papers (-1 for one
+                per CPU). Papers are independent once the networks are built.
 
         Returns:
             Papers with classified citations
@@ -47,36 +233,122 @@ class IndependenceClassifier:
         if not papers:
             return papers
 
+        self._cache_normalized_names(papers)
+        try:
+            return self._classify_papers(papers, n_jobs)
+        finally:
+            self._clear_normalized_names()
+
+    def _classify_papers(
+        self, papers: List[PaperRecord], n_jobs: int = 1
+    ) -> List[PaperRecord]:
+        """Classify citations of papers whose names have been pre-normalized.
+
+        Args:
+            papers: List of paper records with citations
+            n_jobs: Number of worker threads (-1 for one per CPU)
+
+        Returns:
+            Papers with classified citations
+        """
         # Build author and institution networks
         author_network = self._build_author_network(papers)
         institution_network = self._build_institution_network(papers)
+        author_components = self._build_author_components(papers)
 
-        classified_papers = []
+        classify = partial(
+            self._classify_paper,
+            author_network=author_network,
+            institution_network=institution_network,
+            author_components=author_components,
+        )
 
-        for paper in papers:
-            classified_paper = PaperRecord(**paper.model_dump())
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs <= 1 or len(papers) == 1:
+            return [classify(paper) for paper in papers]
 
-            # Classify each citation
-            independent_count = 0
-            self_count = 0
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            return list(executor.map(classify, papers))
 
-            for citation in paper.citations:
-                is_independent = self._is_independent_citation(
-                    paper, citation, author_network, institution_network
-                )
+    def _classify_paper(
+        self,
+        paper: PaperRecord,
+        author_network: Dict[str, Set[str]],
+        institution_network: Dict[str, Set[str]],
+        author_components: Dict[str, int],
+    ) -> PaperRecord:
+        """Classify the citations of a single paper.
 
-                if is_independent:
-                    independent_count += 1
-                else:
-                    self_count += 1
+        Args:
+            paper: Paper record with citations
+            author_network: Author connection network
+            institution_network: Institution connection network
+            author_components: Co-author component id of each author
 
-            # Update counts
-            classified_paper.independent_citations = independent_count
-            classified_paper.self_citations = self_count
+        Returns:
+            Copy of the paper with independent/self citation counts
+        """
+        # Cited-side names are the same for every citation of this paper
+        cited_authors = self._paper_author_names(paper)
+        cited_institutions = self._paper_institution_names(paper)
+
+        # Collaborators always share a co-author component, so only collect
+        # the cited authors' neighbors if some citing author could be one
+        cited_components = {
+            author_components[author]
+            for author in cited_authors
+            if author in author_components
+        }
+        if any(
+            author_components.get(self._author_key(author)) in cited_components
+            for citation in paper.citations
+            for author in citation.citing_authors
+        ):
+            close_reach = self._close_collaborators(cited_authors, author_network)
+        else:
+            close_reach = frozenset()
+
+        # Score every citing author of this paper against the cited authors in
+        # a single call instead of one score matrix per citation
+        fuzzy_authors = self._fuzzy_matched_names(
+            cited_authors,
+            {
+                self._author_key(author)
+                for citation in paper.citations
+                for author in citation.citing_authors
+            },
+            self.author_threshold,
+        )
 
-            classified_papers.append(classified_paper)
+        # Classify each citation
+        independent_count = 0
+        self_count = 0
+
+        for citation in paper.citations:
+            is_independent = self._is_independent_citation(
+                paper,
+                citation,
+                author_network,
+                institution_network,
+                cited_authors=cited_authors,
+                cited_institutions=cited_institutions,
+                close_reach=close_reach,
+                fuzzy_authors=fuzzy_authors,
+            )
 
-        return classified_papers
+            if is_independent:
+                independent_count += 1
+            else:
+                self_count += 1
+
+        # Shallow copy with updated counts (no dump/re-validation round trip)
+        return paper.model_copy(
+            update={
+                "independent_citations": independent_count,
+                "self_citations": self_count,
+            }
+        )
 
     def _build_author_network(self, papers: List[PaperRecord]) -> Dict[str, Set[str]]:
         """Build network of author connections across papers.
@@ -93,22 +365,61 @@ class IndependenceClassifier:
             # Normalize author names
             normalized_authors = []
             for author in paper.authors:
-                normalized_name = self._normalize_author_name(author.display_name)
+                normalized_name = self._author_key(author)
                 normalized_authors.append(normalized_name)
 
-                # Also store ORCID mappings if available
+                # Also store ORCID mappings if available (interned like the
+                # names, so every neighbor set holds one shared string per key)
                 if author.orcid:
-                    author_network[normalized_name].add(f"orcid:{author.orcid}")
+                    author_network[normalized_name].add(
+                        sys.intern(f"orcid:{author.orcid}")
+                    )
 
-            # Connect all co-authors
-            for i, author1 in enumerate(normalized_authors):
-                for j, author2 in enumerate(normalized_authors):
-                    if i != j:
-                        author_network[author1].add(author2)
-                        author_network[author2].add(author1)
+            # Connect all co-authors (one bulk set update per author)
+            coauthors = set(normalized_authors)
+            if len(coauthors) > 1:
+                for author_name in coauthors:
+                    neighbors = author_network[author_name]
+                    neighbors.update(coauthors)
+                    neighbors.discard(author_name)
 
         return dict(author_network)
 
+    def _build_author_components(self, papers: List[PaperRecord]) -> Dict[str, int]:
+        """Find connected components of the co-author graph (union-find).
+
+        Args:
+            papers: List of paper records
+
+        Returns:
+            Dictionary mapping normalized author names to component ids
+        """
+        parent: Dict[str, str] = {}
+
+        def find(name: str) -> str:
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]  # Path halving
+                name = parent[name]
+            return name
+
+        for paper in papers:
+            names = [self._author_key(author) for author in paper.authors]
+            for name in names:
+                parent.setdefault(name, name)
+
+            if names:
+                root = find(names[0])
+                for name in names[1:]:
+                    other = find(name)
+                    if other != root:
+                        parent[other] = root
+
+        component_ids: Dict[str, int] = {}
+        return {
+            name: component_ids.setdefault(find(name), len(component_ids))
+            for name in parent
+        }
+
     def _build_institution_network(
         self, papers: List[PaperRecord]
     ) -> Dict[str, Set[str]]:
@@ -128,18 +439,14 @@ class IndependenceClassifier:
             # Collect all institutions from all authors
             for author in paper.authors:
                 for institution in author.institutions:
-                    normalized_name = self._normalize_institution_name(
-                        institution.display_name
-                    )
-                    institutions.add(normalized_name)
+                    institutions.add(self._institution_key(institution))
 
             # Connect institutions that appear on the same paper
-            institution_list = list(institutions)
-            for i, inst1 in enumerate(institution_list):
-                for j, inst2 in enumerate(institution_list):
-                    if i != j:
-                        institution_network[inst1].add(inst2)
-                        institution_network[inst2].add(inst1)
+            if len(institutions) > 1:
+                for institution_name in institutions:
+                    neighbors = institution_network[institution_name]
+                    neighbors.update(institutions)
+                    neighbors.discard(institution_name)
 
         return dict(institution_network)
 
@@ -149,6 +456,10 @@ class IndependenceClassifier:
         citation: Citation,
         author_network: Dict[str, Set[str]],
         institution_network: Dict[str, Set[str]],
+        cited_authors: Optional[FrozenSet[str]] = None,
+        cited_institutions: Optional[FrozenSet[str]] = None,
+        close_reach: Optional[FrozenSet[str]] = None,
+        fuzzy_authors: Optional[FrozenSet[str]] = None,
     ) -> bool:
         """Determine if a citation is independent or self-citation.
 
@@ -157,20 +468,37 @@ class IndependenceClassifier:
             citation: The citation object
             author_network: Author connection network
             institution_network: Institution connection network
+            cited_authors: Precomputed normalized authors of the cited paper
+            cited_institutions: Precomputed normalized institutions of the
+                cited paper
+            close_reach: Precomputed direct collaborators of the cited authors
+            fuzzy_authors: Precomputed citing author names that fuzzily match
+                a cited author
 
         Returns:
             True if independent citation, False if self-citation
         """
+        if cited_authors is None:
+            cited_authors = self._paper_author_names(cited_paper)
+        if cited_institutions is None:
+            cited_institutions = self._paper_institution_names(cited_paper)
+
         # Check author overlap
-        if self._has_author_overlap(cited_paper, citation, author_network):
+        if self._has_author_overlap(
+            cited_paper, citation, author_network, cited_authors, fuzzy_authors
+        ):
             return False
 
         # Check institution overlap
-        if self._has_institution_overlap(cited_paper, citation, institution_network):
+        if self._has_institution_overlap(
+            cited_paper, citation, institution_network, cited_institutions
+        ):
             return False
 
         # Check for close collaborator relationships
-        if self._has_close_collaborator_overlap(cited_paper, citation, author_network):
+        if self._has_close_collaborator_overlap(
+            cited_paper, citation, author_network, cited_authors, close_reach
+        ):
             return False
 
         return True
@@ -180,6 +508,8 @@ class IndependenceClassifier:
         cited_paper: PaperRecord,
         citation: Citation,
         author_network: Dict[str, Set[str]],
+        cited_authors: Optional[FrozenSet[str]] = None,
+        fuzzy_authors: Optional[FrozenSet[str]] = None,
     ) -> bool:
         """Check if there's author overlap between cited and citing papers.
 
@@ -187,30 +517,108 @@ class IndependenceClassifier:
             cited_paper: The cited paper
             citation: The citation
             author_network: Author network
+            cited_authors: Precomputed normalized authors of the cited paper
+            fuzzy_authors: Precomputed citing author names that fuzzily match
+                one of ``cited_authors``
 
         Returns:
             True if there's author overlap
         """
-        # Normalize cited paper authors
-        cited_authors = {
-            self._normalize_author_name(author.display_name)
+        # Authors identified by ORCID on both sides are compared by ID only
+        cited_orcids = {
+            _normalize_orcid(author.orcid)
             for author in cited_paper.authors
+            if author.orcid
         }
+        citing_orcids = {
+            _normalize_orcid(author.orcid)
+            for author in citation.citing_authors
+            if author.orcid
+        }
+
+        if cited_orcids and citing_orcids:
+            if cited_orcids & citing_orcids:
+                return True
+
+            # Names are only compared where at least one side lacks an ORCID
+            cited_unidentified = {
+                self._author_key(author)
+                for author in cited_paper.authors
+                if not author.orcid
+            }
+            citing_unidentified = {
+                self._author_key(author)
+                for author in citation.citing_authors
+                if not author.orcid
+            }
+            cited_identified = {
+                self._author_key(author)
+                for author in cited_paper.authors
+                if author.orcid
+            }
+            return self._author_names_overlap(
+                cited_unidentified,
+                {self._author_key(author) for author in citation.citing_authors},
+            ) or self._author_names_overlap(cited_identified, citing_unidentified)
+
+        # Normalize cited paper authors
+        if cited_authors is None:
+            cited_authors = self._paper_author_names(cited_paper)
 
         # Normalize citing paper authors
         citing_authors = {
-            self._normalize_author_name(author.display_name)
-            for author in citation.citing_authors
+            self._author_key(author) for author in citation.citing_authors
         }
 
+        return self._author_names_overlap(cited_authors, citing_authors, fuzzy_authors)
+
+    def _author_names_overlap(
+        self,
+        cited_authors: Set[str],
+        citing_authors: Set[str],
+        fuzzy_authors: Optional[FrozenSet[str]] = None,
+    ) -> bool:
+        """Check if any pair of normalized author names refers to the same person.
+
+        Args:
+            cited_authors: Normalized names of cited paper authors
+            citing_authors: Normalized names of citing paper authors
+            fuzzy_authors: Precomputed citing names that fuzzily match one of
+                ``cited_authors``; scored here when not given
+
+        Returns:
+            True if any pair matches exactly, by initials or fuzzily
+        """
         # Direct overlap check
         if cited_authors & citing_authors:
             return True
 
+        if not cited_authors or not citing_authors:
+            return False
+
+        # Single pair: compare directly without building a score matrix
+        if len(cited_authors) == 1 and len(citing_authors) == 1:
+            return self._are_similar_authors(
+                next(iter(cited_authors)), next(iter(citing_authors))
+            )
+
         # Check for similar author names (accounting for name variations)
-        for cited_author in cited_authors:
-            for citing_author in citing_authors:
-                if self._are_similar_authors(cited_author, citing_author):
+        if fuzzy_authors is not None:
+            if not fuzzy_authors.isdisjoint(citing_authors):
+                return True
+        elif self._any_fuzzy_match(
+            cited_authors, citing_authors, self.author_threshold
+        ):
+            return True
+
+        # Initials match (names must share the same initials to qualify)
+        cited_tokens = [_author_tokens(author) for author in cited_authors]
+        for citing_author in citing_authors:
+            citing = _author_tokens(citing_author)
+            for cited in cited_tokens:
+                if cited.initials == citing.initials and (
+                    self._names_match_with_initials(cited.words, citing.words)
+                ):
                     return True
 
         return False
@@ -220,6 +628,7 @@ class IndependenceClassifier:
         cited_paper: PaperRecord,
         citation: Citation,
         institution_network: Dict[str, Set[str]],
+        cited_institutions: Optional[FrozenSet[str]] = None,
     ) -> bool:
         """Check if there's institutional overlap.
 
@@ -227,40 +636,47 @@ class IndependenceClassifier:
             cited_paper: The cited paper
             citation: The citation
             institution_network: Institution network
+            cited_institutions: Precomputed normalized institutions of the
+                cited paper
 
         Returns:
             True if there's institutional overlap
         """
         # Collect cited paper institutions
-        cited_institutions = set()
-        for author in cited_paper.authors:
-            for institution in author.institutions:
-                normalized = self._normalize_institution_name(institution.display_name)
-                cited_institutions.add(normalized)
+        if cited_institutions is None:
+            cited_institutions = self._paper_institution_names(cited_paper)
 
         # Collect citing paper institutions
-        citing_institutions = set()
-        for institution in citation.citing_institutions:
-            normalized = self._normalize_institution_name(institution.display_name)
-            citing_institutions.add(normalized)
+        citing_institutions = {
+            self._institution_key(institution)
+            for institution in citation.citing_institutions
+        }
 
         # Direct overlap check
         if cited_institutions & citing_institutions:
             return True
 
-        # Check for similar institution names
-        for cited_inst in cited_institutions:
-            for citing_inst in citing_institutions:
-                if self._are_similar_institutions(cited_inst, citing_inst):
-                    return True
+        if not cited_institutions or not citing_institutions:
+            return False
 
-        return False
+        # Single pair: compare directly without building a score matrix
+        if len(cited_institutions) == 1 and len(citing_institutions) == 1:
+            return self._are_similar_institutions(
+                next(iter(cited_institutions)), next(iter(citing_institutions))
+            )
+
+        # Check for similar institution names
+        return self._any_fuzzy_match(
+            cited_institutions, citing_institutions, self.institution_threshold
+        )
 
     def _has_close_collaborator_overlap(
         self,
         cited_paper: PaperRecord,
         citation: Citation,
         author_network: Dict[str, Set[str]],
+        cited_authors: Optional[FrozenSet[str]] = None,
+        close_reach: Optional[FrozenSet[str]] = None,
     ) -> bool:
         """Check for close collaborator relationships.
 
@@ -268,6 +684,8 @@ class IndependenceClassifier:
             cited_paper: The cited paper
             citation: The citation
             author_network: Author network
+            cited_authors: Precomputed normalized authors of the cited paper
+            close_reach: Precomputed direct collaborators of the cited authors
 
         Returns:
             True if citing authors are close collaborators of cited authors
@@ -275,74 +693,123 @@ class IndependenceClassifier:
         # This is a more sophisticated check for frequent collaborators
         # For now, implement a simple version
 
-        cited_authors = {
-            self._normalize_author_name(author.display_name)
-            for author in cited_paper.authors
-        }
+        if close_reach is None:
+            if cited_authors is None:
+                cited_authors = self._paper_author_names(cited_paper)
+            close_reach = self._close_collaborators(cited_authors, author_network)
 
-        citing_authors = {
-            self._normalize_author_name(author.display_name)
+        # Check if any citing author is in the direct network of cited authors
+        return any(
+            self._author_key(author) in close_reach
             for author in citation.citing_authors
-        }
+        )
 
-        # Check if any citing author is in the direct network of cited authors
-        for cited_author in cited_authors:
-            if cited_author in author_network:
-                connected_authors = author_network[cited_author]
-                if connected_authors & citing_authors:
-                    return True
+    def _close_collaborators(
+        self, cited_authors: FrozenSet[str], author_network: Dict[str, Set[str]]
+    ) -> FrozenSet[str]:
+        """Collect the direct network neighbors of all cited authors.
 
-        return False
+        Args:
+            cited_authors: Normalized authors of the cited paper
+            author_network: Author network
 
-    def _normalize_author_name(self, name: str) -> str:
-        """Normalize author name for comparison.
+        Returns:
+            Union of the cited authors' connections
+        """
+        return frozenset().union(
+            *(author_network.get(author, ()) for author in cited_authors)
+        )
+
+    def _paper_author_names(self, paper: PaperRecord) -> FrozenSet[str]:
+        """Get the normalized author names of a paper.
 
         Args:
-            name: Author name
+            paper: Paper record
 
         Returns:
-            Normalized author name
+            Set of normalized author names
         """
-        if name in self.author_cache:
-            return self.author_cache[name]
+        return frozenset(self._author_key(author) for author in paper.authors)
 
-        if not name:
-            return ""
+    def _paper_institution_names(self, paper: PaperRecord) -> FrozenSet[str]:
+        """Get the normalized institution names of a paper's authors.
 
-        # Convert to lowercase and remove extra whitespace
-        normalized = re.sub(r"\s+", " ", name.lower().strip())
+        Args:
+            paper: Paper record
 
-        # Remove common prefixes/suffixes
-        prefixes = ["dr.", "prof.", "mr.", "ms.", "mrs."]
-        suffixes = ["jr.", "sr.", "iii", "iv", "phd", "md"]
+        Returns:
+            Set of normalized institution names
+        """
+        return frozenset(
+            self._institution_key(institution)
+            for author in paper.authors
+            for institution in author.institutions
+        )
 
-        words = normalized.split()
+    def _cache_normalized_names(self, papers: List[PaperRecord]) -> None:
+        """Normalize every author and institution name once, per object.
+
+        Args:
+            papers: List of paper records with citations
+        """
+        for paper in papers:
+            for author in paper.authors:
+                self._remember_author(author)
+                for institution in author.institutions:
+                    self._remember_institution(institution)
 
-        # Remove prefixes
-        if words and words[0] in prefixes:
-            words = words[1:]
+            for citation in paper.citations:
+                for author in citation.citing_authors:
+                    self._remember_author(author)
+                for institution in citation.citing_institutions:
+                    self._remember_institution(institution)
+
+    def _remember_author(self, author: Author) -> None:
+        """Store the normalized name of an author object."""
+        if id(author) not in self._norm_author_by_id:
+            self._norm_author_by_id[id(author)] = self._normalize_author_name(
+                author.display_name
+            )
+            self._normalized_objects.append(author)
 
-        # Remove suffixes
-        if words and words[-1] in suffixes:
-            words = words[:-1]
+    def _remember_institution(self, institution: Institution) -> None:
+        """Store the normalized name of an institution object."""
+        if id(institution) not in self._norm_institution_by_id:
+            self._norm_institution_by_id[id(institution)] = (
+                self._normalize_institution_name(institution.display_name)
+            )
+            self._normalized_objects.append(institution)
+
+    def _clear_normalized_names(self) -> None:
+        """Drop the per-object name cache and release the held objects."""
+        self._norm_author_by_id.clear()
+        self._norm_institution_by_id.clear()
+        self._normalized_objects.clear()
+
+    def _author_key(self, author: Author) -> str:
+        """Get the normalized name of an author, using the per-object cache."""
+        name = self._norm_author_by_id.get(id(author))
+        if name is None:
+            name = self._normalize_author_name(author.display_name)
+        return name
+
+    def _institution_key(self, institution: Institution) -> str:
+        """Get the normalized name of an institution, using the per-object cache."""
+        name = self._norm_institution_by_id.get(id(institution))
+        if name is None:
+            name = self._normalize_institution_name(institution.display_name)
+        return name
 
-        # Handle "Last, First" format
-        if len(words) >= 2 and "," in words[0]:
-            parts = normalized.split(",")
-            if len(parts) == 2:
-                last = parts[0].strip()
-                first = parts[1].strip()
-                normalized = f"{first} {last}"
-            else:
-                normalized = " ".join(words)
-        else:
-            normalized = " ".join(words)
+    def _normalize_author_name(self, name: str) -> str:
+        """Normalize author name for comparison.
 
-        # Remove punctuation except spaces
-        normalized = re.sub(r"[^\w\s]", "", normalized)
+        Args:
+            name: Author name
 
-        self.author_cache[name] = normalized
-        return normalized
+        Returns:
+            Normalized author name
+        """
+        return _normalize_author_name(name)
 
     def _normalize_institution_name(self, name: str) -> str:
         """Normalize institution name for comparison.
@@ -353,52 +820,7 @@ class IndependenceClassifier:
         Returns:
             Normalized institution name
         """
-        if name in self.institution_cache:
-            return self.institution_cache[name]
-
-        if not name:
-            return ""
-
-        # Convert to lowercase and remove extra whitespace
-        normalized = re.sub(r"\s+", " ", name.lower().strip())
-
-        # Remove common institution words that don't affect identity
-        remove_words = [
-            "university",
-            "college",
-            "institute",
-            "school",
-            "center",
-            "centre",
-            "hospital",
-            "medical",
-            "health",
-            "system",
-            "dept",
-            "department",
-            "faculty",
-            "division",
-            "laboratory",
-            "lab",
-            "research",
-            "sciences",
-        ]
-
-        words = normalized.split()
-        # Keep core identifying words
-        core_words = [word for word in words if word not in remove_words]
-
-        # If removing common words leaves too few words, keep original
-        if len(core_words) < 2 and len(words) > 2:
-            normalized = " ".join(words)
-        else:
-            normalized = " ".join(core_words)
-
-        # Remove punctuation except spaces
-        normalized = re.sub(r"[^\w\s]", "", normalized)
-
-        self.institution_cache[name] = normalized
-        return normalized
+        return _normalize_institution_name(name)
 
     def _are_similar_authors(self, name1: str, name2: str) -> bool:
         """Check if two author names are similar enough to be the same person.
@@ -418,23 +840,31 @@ class IndependenceClassifier:
             return True
 
         # Check for initials vs full names
-        words1 = name1.split()
-        words2 = name2.split()
+        tokens1 = _author_tokens(name1)
+        tokens2 = _author_tokens(name2)
 
         # Handle case where one name has initials
-        if self._names_match_with_initials(words1, words2):
+        if tokens1.initials == tokens2.initials and (
+            self._names_match_with_initials(tokens1.words, tokens2.words)
+        ):
             return True
 
-        # Use sequence matcher for fuzzy matching
-        similarity = SequenceMatcher(None, name1, name2).ratio()
-        return similarity >= self.author_threshold
+        # Names whose lengths differ too much can never reach the threshold
+        if not _lengths_can_match(len(name1), len(name2), self.author_threshold):
+            return False
+
+        # Fuzzy matching on normalized edit distance
+        cutoff = self.author_threshold * 100
+        return fuzz.ratio(name1, name2, score_cutoff=cutoff) >= cutoff
 
-    def _names_match_with_initials(self, words1: List[str], words2: List[str]) -> bool:
+    def _names_match_with_initials(
+        self, words1: Sequence[str], words2: Sequence[str]
+    ) -> bool:
         """Check if names match allowing for initials.
 
         Args:
-            words1: First name as list of words
-            words2: Second name as list of words
+            words1: First name as sequence of words
+            words2: Second name as sequence of words
 
         Returns:
             True if names match with initials
@@ -472,9 +902,79 @@ class IndependenceClassifier:
         if name1 == name2:
             return True
 
-        # Use sequence matcher for fuzzy matching
-        similarity = SequenceMatcher(None, name1, name2).ratio()
-        return similarity >= self.institution_threshold
+        # Names whose lengths differ too much can never reach the threshold
+        if not _lengths_can_match(len(name1), len(name2), self.institution_threshold):
+            return False
+
+        # Fuzzy matching on normalized edit distance
+        cutoff = self.institution_threshold * 100
+        return fuzz.ratio(name1, name2, score_cutoff=cutoff) >= cutoff
+
+    def _any_fuzzy_match(
+        self, names1: Set[str], names2: Set[str], threshold: float
+    ) -> bool:
+        """Check if any pair of names is similar enough, scoring all pairs at once.
+
+        Args:
+            names1: First set of normalized names
+            names2: Second set of normalized names
+            threshold: Similarity threshold (0-1)
+
+        Returns:
+            True if any non-empty pair reaches the threshold
+        """
+        names1 = [name for name in names1 if name]
+        names2 = [name for name in names2 if name]
+        if not names1 or not names2:
+            return False
+
+        # Only run the scorer if some pair passes the length bound
+        lengths1 = np.fromiter(map(len, names1), dtype=np.float64, count=len(names1))
+        lengths2 = np.fromiter(map(len, names2), dtype=np.float64, count=len(names2))
+        possible = _lengths_can_match(lengths1[:, None], lengths2[None, :], threshold)
+        if not possible.any():
+            return False
+
+        cutoff = threshold * 100
+        scores = process.cdist(
+            names1, names2, scorer=fuzz.ratio, score_cutoff=cutoff, dtype=np.float64
+        )
+        return bool((scores >= cutoff).any())
+
+    def _fuzzy_matched_names(
+        self, names1: Set[str], names2: Set[str], threshold: float
+    ) -> FrozenSet[str]:
+        """Find the names in ``names2`` similar enough to some name in ``names1``.
+
+        All pairs are scored in one ``process.cdist`` call, so the per-call
+        overhead is paid once per set rather than once per citation. The
+        matrix is small (one paper's names), so it is scored on the calling
+        thread; papers themselves are spread over threads by
+        ``classify_citations``.
+
+        Args:
+            names1: First set of normalized names
+            names2: Second set of normalized names
+            threshold: Similarity threshold (0-1)
+
+        Returns:
+            Names of ``names2`` reaching the threshold against any of ``names1``
+        """
+        names1 = [name for name in names1 if name]
+        names2 = [name for name in names2 if name]
+        if not names1 or not names2:
+            return frozenset()
+
+        cutoff = threshold * 100
+        scores = process.cdist(
+            names1,
+            names2,
+            scorer=fuzz.ratio,
+            score_cutoff=cutoff,
+            dtype=np.float64,
+        )
+        matched = np.flatnonzero((scores >= cutoff).any(axis=0))
+        return frozenset(names2[i] for i in matched)
 
     def analyze_citation_patterns(self, papers: List[PaperRecord]) -> Dict[str, Any]:
         """Analyze citation patterns across the paper collection.
@@ -488,46 +988,87 @@ class IndependenceClassifier:
         if not papers:
             return {}
 
-        total_citations = sum(paper.citation_count or 0 for paper in papers)
-        total_independent = sum(paper.independent_citations or 0 for paper in papers)
-        total_self = sum(paper.self_citations or 0 for paper in papers)
+        return self._analyze_citation_frame(papers, self._citation_frame(papers))
 
-        # Field-wise analysis
-        field_patterns = defaultdict(
-            lambda: {"papers": 0, "citations": 0, "independent": 0, "self": 0}
+    def _citation_frame(self, papers: List[PaperRecord]) -> pd.DataFrame:
+        """Extract the per-paper citation counts used by the analyses.
+
+        Args:
+            papers: List of paper records
+
+        Returns:
+            DataFrame with one row per paper (missing counts are 0)
+        """
+        n_papers = len(papers)
+        return pd.DataFrame(
+            {
+                "field": [paper.primary_field or "Unknown" for paper in papers],
+                "year": np.fromiter(
+                    (paper.year or 0 for paper in papers), np.int64, n_papers
+                ),
+                "papers": np.ones(n_papers, dtype=np.int64),
+                "citations": np.fromiter(
+                    (paper.citation_count or 0 for paper in papers), np.int64, n_papers
+                ),
+                "independent": np.fromiter(
+                    (paper.independent_citations or 0 for paper in papers),
+                    np.int64,
+                    n_papers,
+                ),
+                "self": np.fromiter(
+                    (paper.self_citations or 0 for paper in papers), np.int64, n_papers
+                ),
+            }
         )
 
-        for paper in papers:
-            field = paper.primary_field or "Unknown"
-            field_patterns[field]["papers"] += 1
-            field_patterns[field]["citations"] += paper.citation_count or 0
-            field_patterns[field]["independent"] += paper.independent_citations or 0
-            field_patterns[field]["self"] += paper.self_citations or 0
-
-        # Calculate ratios by field
-        for field, stats in field_patterns.items():
-            if stats["citations"] > 0:
-                stats["independence_ratio"] = stats["independent"] / stats["citations"]
-                stats["self_citation_ratio"] = stats["self"] / stats["citations"]
-            else:
-                stats["independence_ratio"] = 0.0
-                stats["self_citation_ratio"] = 0.0
+    def _analyze_citation_frame(
+        self, papers: List[PaperRecord], df: pd.DataFrame
+    ) -> Dict[str, Any]:
+        """Analyze citation patterns from an extracted citation frame.
 
-        # Year-wise analysis
-        year_patterns = defaultdict(
-            lambda: {"papers": 0, "citations": 0, "independent": 0, "self": 0}
+        Args:
+            papers: List of paper records
+            df: Citation frame of the papers (see ``_citation_frame``)
+
+        Returns:
+            Dictionary with citation pattern analysis
+        """
+        n_papers = len(papers)
+        counts = ["papers", "citations", "independent", "self"]
+
+        total_citations = int(df["citations"].sum())
+        total_independent = int(df["independent"].sum())
+        total_self = int(df["self"].sum())
+
+        # Field-wise analysis
+        field_sums = df.groupby("field", sort=False)[counts].sum()
+        field_citations = field_sums["citations"].to_numpy()
+        has_citations = field_citations > 0
+        safe_citations = np.where(has_citations, field_citations, 1)
+        field_sums["independence_ratio"] = np.where(
+            has_citations, field_sums["independent"].to_numpy() / safe_citations, 0.0
+        )
+        field_sums["self_citation_ratio"] = np.where(
+            has_citations, field_sums["self"].to_numpy() / safe_citations, 0.0
         )
+        field_patterns = field_sums.to_dict("index")
 
-        for paper in papers:
-            year = paper.year or 0
-            if year > 0:
-                year_patterns[year]["papers"] += 1
-                year_patterns[year]["citations"] += paper.citation_count or 0
-                year_patterns[year]["independent"] += paper.independent_citations or 0
-                year_patterns[year]["self"] += paper.self_citations or 0
+        # Year-wise analysis
+        year_sums = df[df["year"] > 0].groupby("year", sort=False)[counts].sum()
+        year_patterns = {
+            int(year): stats for year, stats in year_sums.to_dict("index").items()
+        }
+
+        # Per-paper ratios for the highlight lists
+        citations = df["citations"].to_numpy()
+        safe_paper_citations = np.where(citations > 0, citations, 1)
+        independence_ratios = df["independent"].to_numpy() / safe_paper_citations
+        self_ratios = df["self"].to_numpy() / safe_paper_citations
+        paper_ids = np.array([paper.id for paper in papers], dtype=object)
+        well_cited = citations > 5
 
         analysis = {
-            "total_papers": len(papers),
+            "total_papers": n_papers,
             "total_citations": total_citations,
             "total_independent_citations": total_independent,
             "total_self_citations": total_self,
@@ -537,24 +1078,14 @@ class IndependenceClassifier:
             "overall_self_citation_ratio": total_self / total_citations
             if total_citations > 0
             else 0.0,
-            "field_patterns": dict(field_patterns),
-            "year_patterns": dict(year_patterns),
-            "highly_independent_papers": [
-                paper.id
-                for paper in papers
-                if paper.citation_count
-                and paper.citation_count > 5
-                and paper.independent_citations
-                and paper.independent_citations / paper.citation_count > 0.8
-            ],
-            "high_self_citation_papers": [
-                paper.id
-                for paper in papers
-                if paper.citation_count
-                and paper.citation_count > 5
-                and paper.self_citations
-                and paper.self_citations / paper.citation_count > 0.5
-            ],
+            "field_patterns": field_patterns,
+            "year_patterns": year_patterns,
+            "highly_independent_papers": paper_ids[
+                well_cited & (independence_ratios > 0.8)
+            ].tolist(),
+            "high_self_citation_papers": paper_ids[
+                well_cited & (self_ratios > 0.5)
+            ].tolist(),
         }
 
         return analysis
@@ -568,21 +1099,25 @@ class IndependenceClassifier:
         Returns:
             Detailed independence report
         """
-        citation_patterns = self.analyze_citation_patterns(papers)
-
-        # Quality metrics
-        papers_with_high_independence = sum(
-            1
-            for paper in papers
-            if paper.citation_count
-            and paper.citation_count > 0
-            and paper.independent_citations
-            and paper.independent_citations / paper.citation_count > 0.7
+        # Extract once; the summary and quality metrics share the same arrays
+        df = self._citation_frame(papers)
+        citation_patterns = self._analyze_citation_frame(papers, df) if papers else {}
+
+        citations = df["citations"].to_numpy()
+        independent = df["independent"].to_numpy()
+        has_citations = citations > 0
+        ratios = np.divide(
+            independent,
+            citations,
+            out=np.zeros(len(papers)),
+            where=has_citations,
         )
 
-        papers_with_citations = sum(
-            1 for paper in papers if paper.citation_count and paper.citation_count > 0
+        # Quality metrics
+        papers_with_high_independence = int(
+            np.count_nonzero(has_citations & (ratios > 0.7))
         )
+        papers_with_citations = int(np.count_nonzero(has_citations))
 
         independence_quality_score = (
             papers_with_high_independence / papers_with_citations * 100
@@ -590,45 +1125,34 @@ class IndependenceClassifier:
             else 0
         )
 
+        # Top papers by independence ratio (stable, so ties keep input order)
+        candidates = np.flatnonzero((citations > 5) & (independent > 0))
+        top = candidates[np.argsort(-ratios[candidates], kind="stable")[:10]]
+
         report = {
             "summary": citation_patterns,
             "quality_metrics": {
                 "independence_quality_score": independence_quality_score,
                 "papers_with_high_independence": papers_with_high_independence,
                 "papers_with_citations": papers_with_citations,
-                "average_independence_ratio": np.mean(
-                    [
-                        paper.independent_citations / paper.citation_count
-                        for paper in papers
-                        if paper.citation_count
-                        and paper.citation_count > 0
-                        and paper.independent_citations is not None
-                    ]
-                )
-                if papers
-                else 0.0,
+                "average_independence_ratio": (
+                    float(ratios[has_citations].mean())
+                    if papers_with_citations
+                    else 0.0
+                ),
             },
             "recommendations": self._generate_independence_recommendations(papers),
-            "top_independent_papers": sorted(
-                [
-                    {
-                        "id": paper.id,
-                        "title": paper.title,
-                        "citation_count": paper.citation_count,
-                        "independent_citations": paper.independent_citations,
-                        "independence_ratio": paper.independent_citations
-                        / paper.citation_count
-                        if paper.citation_count
-                        else 0,
-                    }
-                    for paper in papers
-                    if paper.citation_count
-                    and paper.citation_count > 5
-                    and paper.independent_citations
-                ],
-                key=lambda x: x["independence_ratio"],
-                reverse=True,
-            )[:10],
+            "top_independent_papers": [
+                {
+                    "id": papers[i].id,
+                    "title": papers[i].title,
+                    "citation_count": papers[i].citation_count,
+                    "independent_citations": papers[i].independent_citations,
+                    "independence_ratio": papers[i].independent_citations
+                    / papers[i].citation_count,
+                }
+                for i in top
+            ],
         }
 
         return report
@@ -1,17 +1,171 @@
 """Data merger for combining multiple API sources into canonical dataframes."""
 
 import logging
+import weakref
+from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import polars as pl
 
 from ..core.models import AnalysisResult, Author, Citation, Institution, PaperRecord
 from ..data_acquisition import OpenAlexClient, iCiteClient
+from ._fieldnorm_kernels import citation_metrics, field_quantiles
+
+if TYPE_CHECKING:
+    import polars as pl
 
 logger = logging.getLogger(__name__)
 
+# Column names and dtypes of the papers, citations and institutions dataframes
+_PAPER_COLUMNS = {
+    "id": object,
+    "doi": object,
+    "pmid": object,
+    "title": object,
+    "year": np.float64,
+    "journal": object,
+    "venue": object,
+    "citation_count": np.int64,
+    "independent_citations": np.int64,
+    "self_citations": np.int64,
+    "rcr": np.float64,
+    "fcr": np.float64,
+    "percentile": np.float64,
+    "primary_field": object,
+    "num_authors": np.int64,
+    "num_fields": np.int64,
+    "patent_citations": np.int64,
+    "clinical_trials": np.int64,
+    "primary_author_name": object,
+    "primary_author_orcid": object,
+    "primary_institution": object,
+    "primary_institution_country": object,
+    "publication_date": object,
+}
+_CITATION_COLUMNS = {
+    "cited_paper_id": object,
+    "cited_paper_title": object,
+    "citing_paper_id": object,
+    "citation_context": object,
+    "citing_year": np.float64,
+    "citing_authors": object,
+    "citing_institutions": object,
+    "citing_countries": object,
+    "num_citing_authors": np.int64,
+    "num_citing_institutions": np.int64,
+}
+_INSTITUTION_COLUMNS = {
+    "paper_id": object,
+    "paper_title": object,
+    "author_name": object,
+    "author_orcid": object,
+    "institution_id": object,
+    "institution_name": object,
+    "institution_country": object,
+    "institution_type": object,
+    "institution_latitude": np.float64,
+    "institution_longitude": np.float64,
+    "is_corresponding": bool,
+}
+
+# Papers dataframe columns with few distinct, repeated values
+_CATEGORICAL_COLUMNS = ("journal", "primary_field", "primary_institution_country")
+
+# Paper attributes read for every row of the papers dataframe. A multi-attribute
+# attrgetter builds the value tuple in C, so it is at least as fast as an
+# accessor generated for this fixed schema (``lambda p: (p.id, p.doi, ...)``)
+_PAPER_FIELDS = attrgetter(
+    "id",
+    "doi",
+    "pmid",
+    "title",
+    "year",
+    "journal",
+    "venue",
+    "citation_count",
+    "independent_citations",
+    "self_citations",
+    "rcr",
+    "fcr",
+    "percentile",
+    "publication_date",
+    "authors",
+    "fields_of_study",
+    "patent_citations",
+    "clinical_trials",
+)
+_CITATION_FIELDS = attrgetter(
+    "citing_paper_id",
+    "citation_context",
+    "year",
+    "citing_authors",
+    "citing_institutions",
+)
+_AUTHOR_FIELDS = attrgetter("display_name", "orcid", "is_corresponding")
+_INSTITUTION_FIELDS = attrgetter(
+    "id", "display_name", "country_code", "type", "latitude", "longitude"
+)
+
+
+@lru_cache(maxsize=1)
+def _polars():
+    """Import Polars on first use, so pandas-only callers never load it.
+
+    Returns:
+        The ``polars`` module
+    """
+    import polars
+
+    return polars
+
+
+@lru_cache(maxsize=1)
+def _polars_schema() -> Dict[str, Any]:
+    """Get the Polars dtypes of the columns produced by ``_extract_columns``.
+
+    Returns:
+        Dictionary mapping paper column names to Polars dtypes
+    """
+    pl = _polars()
+    dtypes = {object: pl.Utf8, np.float64: pl.Float64, np.int64: pl.Int64}
+    schema = {name: dtypes[dtype] for name, dtype in _PAPER_COLUMNS.items()}
+    schema["publication_date"] = pl.Datetime("us")
+    return schema
+
+
+def _primary_field(paper: PaperRecord) -> Optional[str]:
+    """Get a paper's primary field, falling back to its first field of study.
+
+    Args:
+        paper: Paper record
+
+    Returns:
+        Primary field name, or None if the paper has no field information
+    """
+    primary_field = paper.primary_field
+    if not primary_field and paper.fields_of_study:
+        primary_field = paper.fields_of_study[0].display_name
+    return primary_field
+
+
+def _allocate_columns(dtypes: Dict[str, Any], n: int) -> Dict[str, np.ndarray]:
+    """Allocate one uninitialized array per column.
+
+    Object columns start out filled with None.
+
+    Args:
+        dtypes: Column names mapped to NumPy dtypes
+        n: Number of rows
+
+    Returns:
+        Dictionary mapping column names to arrays of length ``n``
+    """
+    return {name: np.empty(n, dtype=dtype) for name, dtype in dtypes.items()}
+
 
 class DataMerger:
     """Merges data from multiple sources into canonical dataframes."""
@@ -19,6 +173,44 @@ class DataMerger:
     def __init__(self):
         """Initialize data merger."""
         self.logger = logger
+        # Flattened (author, institution) pairs per paper, keyed by id(paper)
+        # and dropped when the paper is garbage collected
+        self._affiliations_cache: Dict[
+            int, Tuple[weakref.ref, List[Author], List[Tuple[Author, Institution]]]
+        ] = {}
+
+    def _paper_affiliations(
+        self, paper: PaperRecord
+    ) -> List[Tuple[Author, Institution]]:
+        """Get the (author, institution) pairs of a paper, walking them once.
+
+        The flattened list is shared by every consumer of the affiliations
+        (institution rows, country counts) for as long as the paper is alive
+        and its author list is not replaced.
+
+        Args:
+            paper: Paper record
+
+        Returns:
+            List of (author, institution) pairs in author order
+        """
+        key = id(paper)
+        entry = self._affiliations_cache.get(key)
+        if entry is not None and entry[0]() is paper and entry[1] is paper.authors:
+            return entry[2]
+
+        affiliations = [
+            (author, institution)
+            for author in paper.authors
+            for institution in author.institutions
+        ]
+        cache = self._affiliations_cache
+        self._affiliations_cache[key] = (
+            weakref.ref(paper, lambda _, key=key: cache.pop(key, None)),
+            paper.authors,
+            affiliations,
+        )
+        return affiliations
 
     def papers_to_dataframe(self, papers: List[PaperRecord]) -> pd.DataFrame:
         """Convert PaperRecord objects to pandas DataFrame.
@@ -32,87 +224,174 @@ class DataMerger:
         if not papers:
             return pd.DataFrame()
 
-        data = []
-        for paper in papers:
-            # Extract primary author and institution
-            primary_author = paper.authors[0] if paper.authors else None
-            primary_institution = None
-            if primary_author and primary_author.institutions:
-                primary_institution = primary_author.institutions[0]
-
-            # Extract primary field
-            primary_field = paper.primary_field
-            if not primary_field and paper.fields_of_study:
-                primary_field = paper.fields_of_study[0].display_name
-
-            row = {
-                "id": paper.id,
-                "doi": paper.doi,
-                "pmid": paper.pmid,
-                "title": paper.title,
-                "year": paper.year,
-                "journal": paper.journal,
-                "venue": paper.venue,
-                "citation_count": paper.citation_count,
-                "independent_citations": paper.independent_citations,
-                "self_citations": paper.self_citations,
-                "rcr": paper.rcr,
-                "fcr": paper.fcr,
-                "percentile": paper.percentile,
-                "primary_field": primary_field,
-                "num_authors": len(paper.authors),
-                "num_fields": len(paper.fields_of_study),
-                "patent_citations": len(paper.patent_citations),
-                "clinical_trials": len(paper.clinical_trials),
-                "primary_author_name": primary_author.display_name
-                if primary_author
-                else None,
-                "primary_author_orcid": primary_author.orcid
-                if primary_author
-                else None,
-                "primary_institution": primary_institution.display_name
-                if primary_institution
-                else None,
-                "primary_institution_country": primary_institution.country_code
-                if primary_institution
-                else None,
-                "publication_date": paper.publication_date,
-            }
-            data.append(row)
-
-        df = pd.DataFrame(data)
-
-        # Convert data types
-        if not df.empty:
-            df["year"] = pd.to_numeric(df["year"], errors="coerce")
-            df["citation_count"] = pd.to_numeric(df["citation_count"], errors="coerce")
-            df["independent_citations"] = pd.to_numeric(
-                df["independent_citations"], errors="coerce"
-            )
-            df["self_citations"] = pd.to_numeric(df["self_citations"], errors="coerce")
-            df["rcr"] = pd.to_numeric(df["rcr"], errors="coerce")
-            df["fcr"] = pd.to_numeric(df["fcr"], errors="coerce")
-            df["percentile"] = pd.to_numeric(df["percentile"], errors="coerce")
-            df["publication_date"] = pd.to_datetime(
-                df["publication_date"], errors="coerce"
-            )
-
-        return df
+        return self._papers_frame(self._extract_columns(papers))
 
-    def papers_to_polars(self, papers: List[PaperRecord]) -> pl.DataFrame:
+    def papers_to_polars(self, papers: List[PaperRecord]) -> "pl.DataFrame":
         """Convert PaperRecord objects to Polars DataFrame.
 
+        The frame is built directly from the extracted columns with an
+        explicit schema, without going through pandas.
+
         Args:
             papers: List of PaperRecord objects
 
         Returns:
             Polars DataFrame with paper data
         """
-        pandas_df = self.papers_to_dataframe(papers)
-        if pandas_df.empty:
+        pl = _polars()
+        if not papers:
             return pl.DataFrame()
 
-        return pl.from_pandas(pandas_df)
+        columns = self._extract_columns(papers)
+        return pl.DataFrame(
+            {
+                name: values.tolist() if values.dtype == object else values
+                for name, values in columns.items()
+            },
+            schema=_polars_schema(),
+            nan_to_null=True,
+        )
+
+    def build_all(
+        self, papers: List[PaperRecord]
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Build the papers, citations and institutions dataframes together.
+
+        Equivalent to calling ``papers_to_dataframe``,
+        ``create_citations_dataframe`` and ``create_institutions_dataframe``,
+        but walks the papers and their nested records only once.
+
+        Args:
+            papers: List of PaperRecord objects
+
+        Returns:
+            Tuple of (papers, citations, institutions) dataframes
+        """
+        if not papers:
+            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+        n_citations = 0
+        n_institutions = 0
+        for paper in papers:
+            n_citations += len(paper.citations)
+            n_institutions += len(self._paper_affiliations(paper))
+
+        paper_columns = _allocate_columns(_PAPER_COLUMNS, len(papers))
+        citation_columns = _allocate_columns(_CITATION_COLUMNS, n_citations)
+        institution_columns = _allocate_columns(_INSTITUTION_COLUMNS, n_institutions)
+
+        k_citation = 0
+        k_institution = 0
+        for i, paper in enumerate(papers):
+            self._fill_paper_row(paper_columns, i, paper)
+            k_citation = self._fill_citation_rows(citation_columns, k_citation, paper)
+            k_institution = self._fill_institution_rows(
+                institution_columns, k_institution, paper
+            )
+
+        papers_df = self._papers_frame(paper_columns)
+        citations_df = (
+            pd.DataFrame(citation_columns, copy=False)
+            if n_citations
+            else pd.DataFrame()
+        )
+        institutions_df = (
+            pd.DataFrame(institution_columns, copy=False)
+            if n_institutions
+            else pd.DataFrame()
+        )
+        return papers_df, citations_df, institutions_df
+
+    def _papers_frame(self, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """Wrap extracted paper columns in a pandas DataFrame.
+
+        Args:
+            columns: Column arrays from ``_extract_columns``
+
+        Returns:
+            Pandas DataFrame with paper data
+        """
+        columns["publication_date"] = pd.to_datetime(
+            columns["publication_date"], errors="coerce"
+        )
+
+        # Heavily repeated labels are stored as categoricals: one small code
+        # per row and fast groupby on the category codes
+        for name in _CATEGORICAL_COLUMNS:
+            columns[name] = pd.Categorical(columns[name])
+
+        return pd.DataFrame(columns, copy=False)
+
+    def _extract_columns(self, papers: List[PaperRecord]) -> Dict[str, np.ndarray]:
+        """Extract paper data into typed column arrays.
+
+        Args:
+            papers: Non-empty list of PaperRecord objects
+
+        Returns:
+            Dictionary mapping column names to arrays; numeric columns are
+            float64 (NaN for missing values) or int64, other columns are
+            object arrays
+        """
+        columns = _allocate_columns(_PAPER_COLUMNS, len(papers))
+
+        # Single pass filling typed columns, so no dtype coercion is needed
+        for i, paper in enumerate(papers):
+            self._fill_paper_row(columns, i, paper)
+
+        return columns
+
+    def _fill_paper_row(
+        self, columns: Dict[str, np.ndarray], i: int, paper: PaperRecord
+    ) -> None:
+        """Write one paper into row ``i`` of the paper columns.
+
+        Args:
+            columns: Paper column arrays
+            i: Row index
+            paper: Paper record
+        """
+        (
+            columns["id"][i],
+            columns["doi"][i],
+            columns["pmid"][i],
+            columns["title"][i],
+            year,
+            columns["journal"][i],
+            columns["venue"][i],
+            columns["citation_count"][i],
+            columns["independent_citations"][i],
+            columns["self_citations"][i],
+            rcr,
+            fcr,
+            percentile,
+            columns["publication_date"][i],
+            authors,
+            fields_of_study,
+            patents,
+            trials,
+        ) = _PAPER_FIELDS(paper)
+
+        columns["year"][i] = year if year is not None else np.nan
+        columns["rcr"][i] = rcr if rcr is not None else np.nan
+        columns["fcr"][i] = fcr if fcr is not None else np.nan
+        columns["percentile"][i] = percentile if percentile is not None else np.nan
+        columns["primary_field"][i] = _primary_field(paper)
+        columns["num_authors"][i] = len(authors)
+        columns["num_fields"][i] = len(fields_of_study)
+        columns["patent_citations"][i] = len(patents)
+        columns["clinical_trials"][i] = len(trials)
+
+        # Extract primary author and institution (object columns start out
+        # as None, so missing ones need no assignment)
+        if authors:
+            primary_author = authors[0]
+            columns["primary_author_name"][i] = primary_author.display_name
+            columns["primary_author_orcid"][i] = primary_author.orcid
+            if primary_author.institutions:
+                institution = primary_author.institutions[0]
+                columns["primary_institution"][i] = institution.display_name
+                columns["primary_institution_country"][i] = institution.country_code
 
     def merge_icite_data(
         self, papers_df: pd.DataFrame, icite_data: Dict[str, Dict[str, Any]]
@@ -130,50 +409,35 @@ class DataMerger:
             return papers_df
 
         # Create iCite lookup by DOI
-        icite_rows = []
+        lookup_ids = []
+        icite_rcrs = []
+        icite_fcrs = []
         for identifier, metrics in icite_data.items():
             if isinstance(metrics, dict):
-                icite_rows.append(
-                    {
-                        "lookup_id": identifier,
-                        "icite_rcr": metrics.get("relative_citation_ratio"),
-                        "icite_fcr": metrics.get("field_citation_rate"),
-                        "icite_citations": metrics.get("citation_count"),
-                        "icite_provisional": metrics.get("provisional", True),
-                        "icite_year": metrics.get("year"),
-                    }
-                )
+                lookup_ids.append(identifier)
+                icite_rcrs.append(metrics.get("relative_citation_ratio"))
+                icite_fcrs.append(metrics.get("field_citation_rate"))
 
-        if not icite_rows:
+        if not lookup_ids:
             return papers_df
 
-        icite_df = pd.DataFrame(icite_rows)
-
-        # Merge by DOI first, then by PMID if available
-        result_df = papers_df.copy()
-
-        # Merge by DOI
-        doi_merge = result_df.merge(
-            icite_df,
-            left_on="doi",
-            right_on="lookup_id",
-            how="left",
-            suffixes=("", "_icite"),
-        )
+        # Hash-join the DOIs against the iCite identifiers once and reuse the
+        # matched positions for both metrics (-1 marks papers without a match)
+        positions = pd.Index(lookup_ids).get_indexer(papers_df["doi"])
+        matched = positions >= 0
 
         # Update RCR/FCR with iCite data where available
-        doi_merge["rcr"] = doi_merge["icite_rcr"].fillna(doi_merge["rcr"])
-        doi_merge["fcr"] = doi_merge["icite_fcr"].fillna(doi_merge["fcr"])
-
-        # Drop temporary columns
-        cols_to_drop = [
-            col
-            for col in doi_merge.columns
-            if col.startswith("icite_") or col == "lookup_id"
-        ]
-        result_df = doi_merge.drop(columns=cols_to_drop, errors="ignore")
+        updated = {}
+        for column, values in (("rcr", icite_rcrs), ("fcr", icite_fcrs)):
+            metric = np.full(len(papers_df), np.nan)
+            metric[matched] = np.array(values, dtype=np.float64)[positions[matched]]
+            icite_values = pd.Series(metric, index=papers_df.index)
+            updated[column] = icite_values.where(
+                icite_values.notna(), papers_df[column]
+            )
 
-        return result_df
+        # Only the updated columns are new; the rest are shared with papers_df
+        return papers_df.assign(**updated)
 
     def create_citations_dataframe(self, papers: List[PaperRecord]) -> pd.DataFrame:
         """Create a dataframe of all citations across papers.
@@ -184,48 +448,81 @@ class DataMerger:
         Returns:
             DataFrame with citation data
         """
-        citation_data = []
+        n = sum(len(paper.citations) for paper in papers)
+        if n == 0:
+            return pd.DataFrame()
 
+        columns = _allocate_columns(_CITATION_COLUMNS, n)
+        k = 0
         for paper in papers:
-            for citation in paper.citations:
-                # Extract citing author info
-                citing_authors = [
-                    author.display_name for author in citation.citing_authors
-                ]
-                citing_institutions = [
-                    inst.display_name for inst in citation.citing_institutions
-                ]
-                citing_countries = [
-                    inst.country_code
-                    for inst in citation.citing_institutions
-                    if inst.country_code
-                ]
-
-                row = {
-                    "cited_paper_id": paper.id,
-                    "cited_paper_title": paper.title,
-                    "citing_paper_id": citation.citing_paper_id,
-                    "citation_context": citation.citation_context.value,
-                    "citing_year": citation.year,
-                    "citing_authors": "; ".join(citing_authors),
-                    "citing_institutions": "; ".join(citing_institutions),
-                    "citing_countries": "; ".join(citing_countries),
-                    "num_citing_authors": len(citation.citing_authors),
-                    "num_citing_institutions": len(citation.citing_institutions),
-                }
-                citation_data.append(row)
-
-        if not citation_data:
-            return pd.DataFrame()
+            k = self._fill_citation_rows(columns, k, paper)
 
-        citations_df = pd.DataFrame(citation_data)
+        return pd.DataFrame(columns, copy=False)
 
-        # Convert data types
-        citations_df["citing_year"] = pd.to_numeric(
-            citations_df["citing_year"], errors="coerce"
-        )
+    def _fill_citation_rows(
+        self, columns: Dict[str, np.ndarray], k: int, paper: PaperRecord
+    ) -> int:
+        """Write the citations of a paper into the citation columns.
+
+        Args:
+            columns: Citation column arrays
+            k: Row index of the paper's first citation
+            paper: Paper record
+
+        Returns:
+            Row index following the paper's last citation
+        """
+        cited_ids = columns["cited_paper_id"]
+        cited_titles = columns["cited_paper_title"]
+        citing_ids = columns["citing_paper_id"]
+        contexts = columns["citation_context"]
+        citing_years = columns["citing_year"]
+        citing_authors = columns["citing_authors"]
+        citing_institutions = columns["citing_institutions"]
+        citing_countries = columns["citing_countries"]
+        num_citing_authors = columns["num_citing_authors"]
+        num_citing_institutions = columns["num_citing_institutions"]
+
+        paper_id = paper.id
+        paper_title = paper.title
+        for citation in paper.citations:
+            (
+                citing_ids[k],
+                context,
+                year,
+                authors,
+                institutions,
+            ) = _CITATION_FIELDS(citation)
+
+            cited_ids[k] = paper_id
+            cited_titles[k] = paper_title
+            contexts[k] = context.value
+            citing_years[k] = year if year is not None else np.nan
+
+            # Extract citing author info; single author/institution citations
+            # (the common case) skip building a list to join
+            if len(authors) == 1:
+                citing_authors[k] = authors[0].display_name
+            else:
+                citing_authors[k] = "; ".join(
+                    [author.display_name for author in authors]
+                )
+            if len(institutions) == 1:
+                institution = institutions[0]
+                citing_institutions[k] = institution.display_name
+                citing_countries[k] = institution.country_code or ""
+            else:
+                citing_institutions[k] = "; ".join(
+                    [inst.display_name for inst in institutions]
+                )
+                citing_countries[k] = "; ".join(
+                    [inst.country_code for inst in institutions if inst.country_code]
+                )
+            num_citing_authors[k] = len(authors)
+            num_citing_institutions[k] = len(institutions)
+            k += 1
 
-        return citations_df
+        return k
 
     def create_institutions_dataframe(self, papers: List[PaperRecord]) -> pd.DataFrame:
         """Create a dataframe of all institutions across papers.
@@ -236,40 +533,64 @@ class DataMerger:
         Returns:
             DataFrame with institution data
         """
-        institution_data = []
+        n = sum(len(self._paper_affiliations(paper)) for paper in papers)
+        if n == 0:
+            return pd.DataFrame()
 
+        columns = _allocate_columns(_INSTITUTION_COLUMNS, n)
+        k = 0
         for paper in papers:
-            for author in paper.authors:
-                for institution in author.institutions:
-                    row = {
-                        "paper_id": paper.id,
-                        "paper_title": paper.title,
-                        "author_name": author.display_name,
-                        "author_orcid": author.orcid,
-                        "institution_id": institution.id,
-                        "institution_name": institution.display_name,
-                        "institution_country": institution.country_code,
-                        "institution_type": institution.type,
-                        "institution_latitude": institution.latitude,
-                        "institution_longitude": institution.longitude,
-                        "is_corresponding": author.is_corresponding,
-                    }
-                    institution_data.append(row)
-
-        if not institution_data:
-            return pd.DataFrame()
+            k = self._fill_institution_rows(columns, k, paper)
 
-        institutions_df = pd.DataFrame(institution_data)
+        return pd.DataFrame(columns, copy=False)
 
-        # Convert data types
-        institutions_df["institution_latitude"] = pd.to_numeric(
-            institutions_df["institution_latitude"], errors="coerce"
-        )
-        institutions_df["institution_longitude"] = pd.to_numeric(
-            institutions_df["institution_longitude"], errors="coerce"
-        )
+    def _fill_institution_rows(
+        self, columns: Dict[str, np.ndarray], k: int, paper: PaperRecord
+    ) -> int:
+        """Write the author affiliations of a paper into the institution columns.
+
+        Args:
+            columns: Institution column arrays
+            k: Row index of the paper's first affiliation
+            paper: Paper record
 
-        return institutions_df
+        Returns:
+            Row index following the paper's last affiliation
+        """
+        paper_ids = columns["paper_id"]
+        paper_titles = columns["paper_title"]
+        author_names = columns["author_name"]
+        author_orcids = columns["author_orcid"]
+        institution_ids = columns["institution_id"]
+        institution_names = columns["institution_name"]
+        institution_countries = columns["institution_country"]
+        institution_types = columns["institution_type"]
+        latitudes = columns["institution_latitude"]
+        longitudes = columns["institution_longitude"]
+        is_corresponding = columns["is_corresponding"]
+
+        paper_id = paper.id
+        paper_title = paper.title
+        for author, institution in self._paper_affiliations(paper):
+            author_names[k], author_orcids[k], is_corresponding[k] = _AUTHOR_FIELDS(
+                author
+            )
+            (
+                institution_ids[k],
+                institution_names[k],
+                institution_countries[k],
+                institution_types[k],
+                latitude,
+                longitude,
+            ) = _INSTITUTION_FIELDS(institution)
+
+            paper_ids[k] = paper_id
+            paper_titles[k] = paper_title
+            latitudes[k] = latitude if latitude is not None else np.nan
+            longitudes[k] = longitude if longitude is not None else np.nan
+            k += 1
+
+        return k
 
     def aggregate_field_metrics(self, papers_df: pd.DataFrame) -> pd.DataFrame:
         """Aggregate metrics by field of study.
@@ -289,59 +610,65 @@ class DataMerger:
         if field_df.empty:
             return pd.DataFrame()
 
-        # Group by field and calculate metrics
+        # Group by field and calculate metrics with flat column names
+        grouped = field_df.groupby("primary_field", observed=True)
         field_metrics = (
-            field_df.groupby("primary_field")
-            .agg(
-                {
-                    "citation_count": ["count", "sum", "mean", "median", "std"],
-                    "independent_citations": ["sum", "mean"],
-                    "rcr": ["mean", "median"],
-                    "year": ["min", "max", "mean"],
-                    "patent_citations": "sum",
-                    "clinical_trials": "sum",
-                }
+            grouped.agg(
+                paper_count=("citation_count", "count"),
+                total_citations=("citation_count", "sum"),
+                mean_citations=("citation_count", "mean"),
+                median_citations=("citation_count", "median"),
+                std_citations=("citation_count", "std"),
+                total_independent_citations=("independent_citations", "sum"),
+                mean_independent_citations=("independent_citations", "mean"),
+                mean_rcr=("rcr", "mean"),
+                median_rcr=("rcr", "median"),
+                earliest_year=("year", "min"),
+                latest_year=("year", "max"),
+                mean_year=("year", "mean"),
+                total_patent_citations=("patent_citations", "sum"),
+                total_clinical_trials=("clinical_trials", "sum"),
             )
+            .rename_axis("field_name")
             .reset_index()
         )
 
-        # Flatten column names
-        field_metrics.columns = [
-            "field_name",
-            "paper_count",
-            "total_citations",
-            "mean_citations",
-            "median_citations",
-            "std_citations",
-            "total_independent_citations",
-            "mean_independent_citations",
-            "mean_rcr",
-            "median_rcr",
-            "earliest_year",
-            "latest_year",
-            "mean_year",
-            "total_patent_citations",
-            "total_clinical_trials",
-        ]
-
-        # Calculate percentile thresholds
-        field_metrics["top_10_percent_threshold"] = (
-            field_df.groupby("primary_field")["citation_count"].quantile(0.9).values
+        # Percentile thresholds for all fields from one sort, using the row's
+        # group number (the row order of field_metrics) as field id. Missing
+        # counts are skipped, as pandas quantiles do
+        group_ids = grouped.ngroup().to_numpy()
+        citations = field_df["citation_count"].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(citations)
+        citations, group_ids = citations[valid], group_ids[valid]
+        field_metrics["top_10_percent_threshold"] = field_quantiles(
+            citations, group_ids, len(field_metrics), 0.9
         )
-        field_metrics["top_1_percent_threshold"] = (
-            field_df.groupby("primary_field")["citation_count"].quantile(0.99).values
+        field_metrics["top_1_percent_threshold"] = field_quantiles(
+            citations, group_ids, len(field_metrics), 0.99
         )
 
         return field_metrics
 
     def create_analysis_summary(
-        self, papers: List[PaperRecord], field_metrics_df: Optional[pd.DataFrame] = None
+        self,
+        papers: List[PaperRecord],
+        field_metrics_df: Optional[pd.DataFrame] = None,
+        papers_df: Optional[pd.DataFrame] = None,
+        institutions_df: Optional[pd.DataFrame] = None,
     ) -> Dict[str, Any]:
         """Create a comprehensive analysis summary.
 
+        The country distribution walks every author and affiliation, so
+        callers that already have the institutions dataframe should pass it
+        in. All other metrics come from a single pass over the papers.
+
         Args:
             papers: List of PaperRecord objects
             field_metrics_df: Optional field metrics dataframe
+            papers_df: Optional dataframe from ``papers_to_dataframe(papers)``;
+                if given, the year range is read from it
+            institutions_df: Optional dataframe from
+                ``create_institutions_dataframe(papers)``
 
         Returns:
             Dictionary with analysis summary
@@ -349,46 +676,55 @@ class DataMerger:
         if not papers:
             return {}
 
-        papers_df = self.papers_to_dataframe(papers)
-
-        # Basic metrics
+        # Basic metrics, field distribution and year range in one pass over
+        # the papers
         total_papers = len(papers)
-        total_citations = papers_df["citation_count"].sum()
-        total_independent = papers_df["independent_citations"].sum()
-
-        # H-index calculation
-        sorted_citations = sorted([p.citation_count for p in papers], reverse=True)
-        h_index = 0
-        for i, citations in enumerate(sorted_citations, 1):
-            if citations >= i:
-                h_index = i
-            else:
-                break
-
-        # i10-index (papers with >=10 citations)
-        i10_index = sum(1 for p in papers if p.citation_count >= 10)
-
-        # Field distribution
-        field_counts = (
-            papers_df["primary_field"].value_counts().to_dict()
-            if not papers_df.empty
-            else {}
-        )
+        citations = np.empty(total_papers, dtype=np.int64)
+        total_independent = 0
+        field_counter = Counter()
+        earliest_year = latest_year = None
+        for i, paper in enumerate(papers):
+            citations[i] = paper.citation_count
+            total_independent += paper.independent_citations
+            primary_field = _primary_field(paper)
+            if primary_field is not None:
+                field_counter[primary_field] += 1
+            year = paper.year
+            if year is not None:
+                if earliest_year is None or year < earliest_year:
+                    earliest_year = year
+                if latest_year is None or year > latest_year:
+                    latest_year = year
+
+        total_citations = int(citations.sum())
+        h_index, i10_index = citation_metrics(citations)
+        field_counts = dict(field_counter.most_common())
 
         # Geographic distribution
-        institutions_df = self.create_institutions_dataframe(papers)
-        country_counts = (
-            institutions_df["institution_country"].value_counts().to_dict()
-            if not institutions_df.empty
-            else {}
-        )
+        if institutions_df is not None:
+            country_counts = (
+                institutions_df["institution_country"].value_counts().to_dict()
+                if not institutions_df.empty
+                else {}
+            )
+        else:
+            country_counter = Counter(
+                institution.country_code
+                for paper in papers
+                for _, institution in self._paper_affiliations(paper)
+                if institution.country_code is not None
+            )
+            country_counts = dict(country_counter.most_common())
+
+        # A caller-supplied papers dataframe stays the source of the year range
+        if papers_df is not None and not papers_df.empty:
+            earliest_year = papers_df["year"].min()
+            latest_year = papers_df["year"].max()
 
         summary = {
             "total_papers": total_papers,
-            "total_citations": int(total_citations) if pd.notna(total_citations) else 0,
-            "total_independent_citations": int(total_independent)
-            if pd.notna(total_independent)
-            else 0,
+            "total_citations": total_citations,
+            "total_independent_citations": total_independent,
             "h_index": h_index,
             "i10_index": i10_index,
             "average_citations_per_paper": total_citations / total_papers
@@ -400,12 +736,8 @@ class DataMerger:
             "field_distribution": field_counts,
             "country_distribution": country_counts,
             "year_range": {
-                "earliest": int(papers_df["year"].min())
-                if not papers_df.empty and pd.notna(papers_df["year"].min())
-                else None,
-                "latest": int(papers_df["year"].max())
-                if not papers_df.empty and pd.notna(papers_df["year"].max())
-                else None,
+                "earliest": int(earliest_year) if pd.notna(earliest_year) else None,
+                "latest": int(latest_year) if pd.notna(latest_year) else None,
             },
             "analysis_date": datetime.now().isoformat(),
         }
@@ -1,17 +1,302 @@
 """Downstream uptake aggregator for patents, clinical trials, and guidelines."""
 
 import logging
-from collections import Counter, defaultdict
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, itemgetter
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import numpy as np
-import pandas as pd
 
 from ..core.models import ClinicalTrial, PaperRecord, PatentCitation
 
 logger = logging.getLogger(__name__)
 
+_CLINICAL_FIELDS = ("medicine", "biology", "biomedical", "health", "clinical")
+_APPLIED_FIELDS = ("engineering", "computer science", "technology")
+
+
+def _most_common(counts: Counter, n: Optional[int] = None) -> Dict[Any, int]:
+    """Return the ``n`` most common values of a counter, skipping ``None``."""
+    known = (
+        (value, count) for value, count in counts.most_common() if value is not None
+    )
+    return dict(islice(known, n))
+
+
+def _sorted_counts(counts: Counter) -> Dict[Any, int]:
+    """Return the counts of a counter ordered by value, skipping ``None``."""
+    return dict(sorted(item for item in counts.items() if item[0] is not None))
+
+
+def _rank_above(counts: np.ndarray, threshold: int) -> List[int]:
+    """Return the indices of counts at or above a threshold, highest first.
+
+    Ties keep their original order.
+    """
+    selected = np.flatnonzero(counts >= threshold)
+    return selected[np.argsort(-counts[selected], kind="stable")].tolist()
+
+
+# Reads the fields behind a paper's uptake counts in a single call
+_UPTAKE_FIELDS = attrgetter("patent_citations", "clinical_trials", "citation_count")
+
+
+def _uptake_counts(
+    papers: List[PaperRecord],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Collect the patent, clinical trial and citation counts of papers.
+
+    Args:
+        papers: List of paper records
+
+    Returns:
+        Tuple of (patent counts, trial counts, citation counts) arrays
+    """
+    counts = np.array(
+        [
+            (len(patents), len(trials), citation_count or 0)
+            for patents, trials, citation_count in map(_UPTAKE_FIELDS, papers)
+        ],
+        dtype=np.int64,
+    ).reshape(len(papers), 3)
+    return counts[:, 0], counts[:, 1], counts[:, 2]
+
+
+def _translational_scores(
+    patent_counts: np.ndarray, trial_counts: np.ndarray, citation_counts: np.ndarray
+) -> np.ndarray:
+    """Calculate translational impact scores from per-paper uptake counts.
+
+    Vectorized form of ``UptakeAggregator.calculate_translational_impact_score``:
+    components a paper lacks contribute neither to the weighted sum nor to the
+    weights.
+
+    Args:
+        patent_counts: Number of patent citations of each paper
+        trial_counts: Number of clinical trials of each paper
+        citation_counts: Citation count of each paper (0 if unknown)
+
+    Returns:
+        Array of translational impact scores (0-100)
+    """
+    has_patents = patent_counts > 0
+    has_trials = trial_counts > 0
+    has_citations = citation_counts > 0
+
+    # Components are accumulated in place into one buffer. Missing patent and
+    # trial components are zeroed through their masks; log1p(0) already zeroes
+    # a missing citation component. 25n - 5 == 20n + 5(n - 1), 40n - 10 likewise.
+    weighted_sum = np.minimum(patent_counts * 25 - 5, 100) * 0.4
+    weighted_sum *= has_patents
+    trial_part = np.minimum(trial_counts * 40 - 10, 100) * 0.5
+    trial_part *= has_trials
+    weighted_sum += trial_part
+    citation_part = np.log1p(np.maximum(citation_counts, 0))
+    citation_part *= 8
+    np.minimum(citation_part, 50, out=citation_part)
+    citation_part *= 0.1
+    weighted_sum += citation_part
+
+    weights = has_patents * 0.4
+    weights += has_trials * 0.5
+    weights += has_citations * 0.1
+
+    # Papers without any component keep their zero weighted sum
+    np.divide(weighted_sum, weights, out=weighted_sum, where=weights > 0)
+    return np.clip(weighted_sum, 0, 100, out=weighted_sum)
+
+
+@lru_cache(maxsize=256)
+def _field_alignment(field: Optional[str]) -> int:
+    """Score how closely a field aligns with translational research.
+
+    Fields come from a small vocabulary, so each is matched only once.
+    """
+    field = field.lower() if field else ""
+    if any(clinical_field in field for clinical_field in _CLINICAL_FIELDS):
+        return 30
+    if any(applied_field in field for applied_field in _APPLIED_FIELDS):
+        return 20
+    return 10
+
+
+def _extract_year(start_date: Any) -> Optional[int]:
+    """Extract the year of a trial start date given as a datetime or string.
+
+    Strings must start with a four-digit year; anything unparseable gives
+    ``None`` without raising.
+    """
+    if not start_date:
+        return None
+    if isinstance(start_date, str):
+        year = start_date[:4]
+        return int(year) if len(year) == 4 and year.isdecimal() else None
+    return getattr(start_date, "year", None)
+
+
+@dataclass
+class _UptakeTally:
+    """Accumulators for the uptake analyses, filled in one walk over the papers.
+
+    Built with ``from_papers`` so that a full report reads each paper and each
+    patent/trial record once; the analyses then only format these counts.
+    Per-paper values are arrays aligned with the input papers (missing
+    publication years are 0).
+    """
+
+    patent_counts: np.ndarray
+    trial_counts: np.ndarray
+    citation_counts: np.ndarray
+    years: np.ndarray
+    fields: List[Optional[str]]
+    time_to_patent: Tuple[int, int]  # (sum, count) of forward patent lags
+    patent_field_counts: Counter
+    assignee_counts: Counter
+    classification_counts: Counter
+    patent_year_counts: Counter
+    time_to_trial: Tuple[int, int]  # (sum, count) of forward trial lags
+    phase_counts: Counter
+    status_counts: Counter
+    condition_counts: Counter
+    sponsor_counts: Counter
+    trial_year_counts: Counter
+    timeline_events: List[Dict[str, Any]]
+
+    @classmethod
+    def from_papers(
+        cls,
+        papers: List[PaperRecord],
+        current_year: Optional[int] = None,
+        with_timeline: bool = False,
+    ) -> "_UptakeTally":
+        """Accumulate the uptake statistics of papers in a single pass.
+
+        Args:
+            papers: List of paper records
+            current_year: Year used as the publication date of undated papers
+                on the timeline (defaults to the current year)
+            with_timeline: Whether to also collect the timeline events
+
+        Returns:
+            Filled ``_UptakeTally``
+        """
+        if current_year is None:
+            current_year = datetime.now().year
+
+        per_paper = []
+        fields = []
+        events = []
+        patent_lag_sum = patent_lag_count = 0
+        trial_lag_sum = trial_lag_count = 0
+        patent_field_counts = Counter()
+        assignee_counts = Counter()
+        classification_counts = Counter()
+        patent_year_counts = Counter()
+        phase_counts = Counter()
+        status_counts = Counter()
+        condition_counts = Counter()
+        sponsor_counts = Counter()
+        trial_year_counts = Counter()
+
+        for paper in papers:
+            patents, trials = paper.patent_citations, paper.clinical_trials
+            paper_id, paper_title, paper_year = paper.id, paper.title, paper.year
+            per_paper.append(
+                (len(patents), len(trials), paper.citation_count or 0, paper_year or 0)
+            )
+            fields.append(paper.primary_field)
+
+            if with_timeline:
+                # Add publication event
+                events.append(
+                    {
+                        "date": paper_year or current_year,
+                        "type": "publication",
+                        "paper_id": paper_id,
+                        "paper_title": paper_title,
+                        "event_title": f"Published: {paper_title[:50]}...",
+                    }
+                )
+
+            if patents:
+                patent_field_counts[paper.primary_field] += len(patents)
+            for patent in patents:
+                patent_year = patent.year
+                if paper_year and patent_year:
+                    time_diff = patent_year - paper_year
+                    if time_diff >= 0:  # Only consider forward citations
+                        patent_lag_sum += time_diff
+                        patent_lag_count += 1
+                patent_year_counts[patent_year] += 1
+                assignee_counts[patent.assignee] += 1
+                classification_counts[patent.main_class] += 1
+
+                if with_timeline and patent_year:
+                    events.append(
+                        {
+                            "date": patent_year,
+                            "type": "patent",
+                            "paper_id": paper_id,
+                            "patent_id": patent.patent_id,
+                            "event_title": f"Patent: {patent.title[:50]}..."
+                            if patent.title
+                            else f"Patent {patent.patent_id}",
+                        }
+                    )
+
+            for trial in trials:
+                trial_year = _extract_year(trial.start_date)
+                if paper_year and trial_year is not None:
+                    time_diff = trial_year - paper_year
+                    if time_diff >= 0:  # Only consider forward citations
+                        trial_lag_sum += time_diff
+                        trial_lag_count += 1
+                trial_year_counts[trial_year] += 1
+                phase_counts[trial.phase] += 1
+                status_counts[trial.status] += 1
+                condition_counts[trial.condition] += 1
+                sponsor_counts[trial.sponsor] += 1
+
+                if with_timeline and trial_year is not None:
+                    events.append(
+                        {
+                            "date": trial_year,
+                            "type": "clinical_trial",
+                            "paper_id": paper_id,
+                            "trial_id": trial.trial_id,
+                            "event_title": f"Clinical Trial: {trial.title[:50]}..."
+                            if trial.title
+                            else f"Trial {trial.trial_id}",
+                        }
+                    )
+
+        per_paper = np.array(per_paper, dtype=np.int64).reshape(len(papers), 4)
+        patent_counts, trial_counts, citation_counts, years = per_paper.T
+
+        return cls(
+            patent_counts=patent_counts,
+            trial_counts=trial_counts,
+            citation_counts=citation_counts,
+            years=years,
+            fields=fields,
+            time_to_patent=(patent_lag_sum, patent_lag_count),
+            patent_field_counts=patent_field_counts,
+            assignee_counts=assignee_counts,
+            classification_counts=classification_counts,
+            patent_year_counts=patent_year_counts,
+            time_to_trial=(trial_lag_sum, trial_lag_count),
+            phase_counts=phase_counts,
+            status_counts=status_counts,
+            condition_counts=condition_counts,
+            sponsor_counts=sponsor_counts,
+            trial_year_counts=trial_year_counts,
+            timeline_events=events,
+        )
+
 
 class UptakeAggregator:
     """Aggregates and analyzes downstream uptake of research papers."""
@@ -37,99 +322,7 @@ class UptakeAggregator:
                 "total_patent_citations": 0,
             }
 
-        # Collect all patent citations
-        all_patents = []
-        papers_with_patents = 0
-
-        for paper in papers:
-            if paper.patent_citations:
-                papers_with_patents += 1
-                for patent in paper.patent_citations:
-                    patent_info = {
-                        "paper_id": paper.id,
-                        "paper_title": paper.title,
-                        "paper_year": paper.year,
-                        "primary_field": paper.primary_field,
-                        "patent_id": patent.patent_id,
-                        "patent_title": patent.title,
-                        "patent_year": patent.year,
-                        "patent_assignee": patent.assignee,
-                        "patent_classification": patent.classification,
-                        "citation_context": patent.citation_context.value
-                        if patent.citation_context
-                        else None,
-                    }
-                    all_patents.append(patent_info)
-
-        if not all_patents:
-            return {
-                "total_papers": len(papers),
-                "papers_with_patents": 0,
-                "patent_citation_rate": 0.0,
-                "total_patent_citations": 0,
-            }
-
-        patents_df = pd.DataFrame(all_patents)
-
-        # Basic statistics
-        total_patent_citations = len(all_patents)
-        patent_citation_rate = papers_with_patents / len(papers)
-
-        # Time analysis
-        time_to_patent = []
-        for _, row in patents_df.iterrows():
-            if row["paper_year"] and row["patent_year"]:
-                time_diff = row["patent_year"] - row["paper_year"]
-                if time_diff >= 0:  # Only consider forward citations
-                    time_to_patent.append(time_diff)
-
-        avg_time_to_patent = (
-            sum(time_to_patent) / len(time_to_patent) if time_to_patent else None
-        )
-
-        # Field analysis
-        field_patent_counts = (
-            patents_df.groupby("primary_field").size().to_dict()
-            if "primary_field" in patents_df.columns
-            else {}
-        )
-
-        # Assignee analysis
-        assignee_counts = (
-            patents_df["patent_assignee"].value_counts().head(10).to_dict()
-            if "patent_assignee" in patents_df.columns
-            else {}
-        )
-
-        # Classification analysis
-        classification_counts = Counter()
-        for classification in patents_df["patent_classification"].dropna():
-            if isinstance(classification, str):
-                # Extract main classification code (first part before /)
-                main_class = (
-                    classification.split("/")[0]
-                    if "/" in classification
-                    else classification
-                )
-                classification_counts[main_class] += 1
-
-        analysis = {
-            "total_papers": len(papers),
-            "papers_with_patents": papers_with_patents,
-            "patent_citation_rate": patent_citation_rate,
-            "total_patent_citations": total_patent_citations,
-            "average_patents_per_paper": total_patent_citations / len(papers),
-            "average_time_to_patent": avg_time_to_patent,
-            "field_distribution": field_patent_counts,
-            "top_assignees": assignee_counts,
-            "top_classifications": dict(classification_counts.most_common(10)),
-            "patent_timeline": self._create_patent_timeline(patents_df),
-            "high_patent_impact_papers": self._identify_high_patent_impact_papers(
-                papers
-            ),
-        }
-
-        return analysis
+        return self._patent_analysis(papers, _UptakeTally.from_papers(papers))
 
     def analyze_clinical_trial_uptake(
         self, papers: List[PaperRecord]
@@ -150,109 +343,7 @@ class UptakeAggregator:
                 "total_trial_citations": 0,
             }
 
-        # Collect all clinical trial citations
-        all_trials = []
-        papers_with_trials = 0
-
-        for paper in papers:
-            if paper.clinical_trials:
-                papers_with_trials += 1
-                for trial in paper.clinical_trials:
-                    trial_info = {
-                        "paper_id": paper.id,
-                        "paper_title": paper.title,
-                        "paper_year": paper.year,
-                        "primary_field": paper.primary_field,
-                        "trial_id": trial.trial_id,
-                        "trial_title": trial.title,
-                        "trial_status": trial.status,
-                        "trial_phase": trial.phase,
-                        "trial_start_date": trial.start_date,
-                        "trial_sponsor": trial.sponsor,
-                        "trial_condition": trial.condition,
-                    }
-                    all_trials.append(trial_info)
-
-        if not all_trials:
-            return {
-                "total_papers": len(papers),
-                "papers_with_trials": 0,
-                "trial_citation_rate": 0.0,
-                "total_trial_citations": 0,
-            }
-
-        trials_df = pd.DataFrame(all_trials)
-
-        # Basic statistics
-        total_trial_citations = len(all_trials)
-        trial_citation_rate = papers_with_trials / len(papers)
-
-        # Phase analysis
-        phase_counts = (
-            trials_df["trial_phase"].value_counts().to_dict()
-            if "trial_phase" in trials_df.columns
-            else {}
-        )
-
-        # Status analysis
-        status_counts = (
-            trials_df["trial_status"].value_counts().to_dict()
-            if "trial_status" in trials_df.columns
-            else {}
-        )
-
-        # Condition analysis
-        condition_counts = (
-            trials_df["trial_condition"].value_counts().head(10).to_dict()
-            if "trial_condition" in trials_df.columns
-            else {}
-        )
-
-        # Sponsor analysis
-        sponsor_counts = (
-            trials_df["trial_sponsor"].value_counts().head(10).to_dict()
-            if "trial_sponsor" in trials_df.columns
-            else {}
-        )
-
-        # Time analysis
-        time_to_trial = []
-        for _, row in trials_df.iterrows():
-            if row["paper_year"] and row["trial_start_date"]:
-                try:
-                    if isinstance(row["trial_start_date"], str):
-                        trial_year = int(row["trial_start_date"][:4])
-                    else:
-                        trial_year = row["trial_start_date"].year
-
-                    time_diff = trial_year - row["paper_year"]
-                    if time_diff >= 0:  # Only consider forward citations
-                        time_to_trial.append(time_diff)
-                except (ValueError, AttributeError):
-                    continue
-
-        avg_time_to_trial = (
-            sum(time_to_trial) / len(time_to_trial) if time_to_trial else None
-        )
-
-        analysis = {
-            "total_papers": len(papers),
-            "papers_with_trials": papers_with_trials,
-            "trial_citation_rate": trial_citation_rate,
-            "total_trial_citations": total_trial_citations,
-            "average_trials_per_paper": total_trial_citations / len(papers),
-            "average_time_to_trial": avg_time_to_trial,
-            "phase_distribution": phase_counts,
-            "status_distribution": status_counts,
-            "top_conditions": condition_counts,
-            "top_sponsors": sponsor_counts,
-            "trial_timeline": self._create_trial_timeline(trials_df),
-            "high_clinical_impact_papers": self._identify_high_clinical_impact_papers(
-                papers
-            ),
-        }
-
-        return analysis
+        return self._trial_analysis(papers, _UptakeTally.from_papers(papers))
 
     def analyze_policy_uptake(self, papers: List[PaperRecord]) -> Dict[str, Any]:
         """Analyze policy and guideline uptake.
@@ -293,40 +384,47 @@ class UptakeAggregator:
         if not paper:
             return 0.0
 
-        components = []
-        weights = []
+        patent_count = len(paper.patent_citations)
+        trial_count = len(paper.clinical_trials)
+        if not patent_count and not trial_count and not paper.citation_count:
+            return 0.0
+
+        # Weighted average over the components the paper has
+        weighted_sum = 0.0
+        total_weight = 0.0
 
         # Patent component
-        patent_count = len(paper.patent_citations)
         if patent_count > 0:
             # Log scale for patents (each patent adds diminishing value)
             patent_score = min(100, patent_count * 20 + (patent_count - 1) * 5)
-            components.append(patent_score)
-            weights.append(0.4)
+            weighted_sum += patent_score * 0.4
+            total_weight += 0.4
 
         # Clinical trial component
-        trial_count = len(paper.clinical_trials)
         if trial_count > 0:
             # Higher weight for clinical trials as they're rarer and more impactful
             trial_score = min(100, trial_count * 30 + (trial_count - 1) * 10)
-            components.append(trial_score)
-            weights.append(0.5)
+            weighted_sum += trial_score * 0.5
+            total_weight += 0.5
 
         # Citation impact component
         if paper.citation_count and paper.citation_count > 0:
             # Citation component with logarithmic scaling
             citation_score = min(50, np.log1p(paper.citation_count) * 8)
-            components.append(citation_score)
-            weights.append(0.1)
+            weighted_sum += citation_score * 0.1
+            total_weight += 0.1
 
-        if not components:
+        if not total_weight:
             return 0.0
 
-        # Weighted average
-        weighted_score = sum(c * w for c, w in zip(components, weights)) / sum(weights)
+        weighted_score = weighted_sum / total_weight
 
         return min(100, max(0, weighted_score))
 
+    def _translational_scores(self, papers: List[PaperRecord]) -> np.ndarray:
+        """Calculate the translational impact score of every paper at once."""
+        return _translational_scores(*_uptake_counts(papers))
+
     def create_uptake_timeline(self, papers: List[PaperRecord]) -> Dict[str, Any]:
         """Create timeline of downstream uptake events.
 
@@ -336,113 +434,54 @@ class UptakeAggregator:
         Returns:
             Dictionary with timeline data
         """
-        timeline_events = []
-
-        for paper in papers:
-            paper_year = paper.year or datetime.now().year
-
-            # Add publication event
-            timeline_events.append(
-                {
-                    "date": paper_year,
-                    "type": "publication",
-                    "paper_id": paper.id,
-                    "paper_title": paper.title,
-                    "event_title": f"Published: {paper.title[:50]}...",
-                }
-            )
-
-            # Add patent events
-            for patent in paper.patent_citations:
-                if patent.year:
-                    timeline_events.append(
-                        {
-                            "date": patent.year,
-                            "type": "patent",
-                            "paper_id": paper.id,
-                            "patent_id": patent.patent_id,
-                            "event_title": f"Patent: {patent.title[:50]}..."
-                            if patent.title
-                            else f"Patent {patent.patent_id}",
-                        }
-                    )
-
-            # Add clinical trial events
-            for trial in paper.clinical_trials:
-                if trial.start_date:
-                    try:
-                        if isinstance(trial.start_date, str):
-                            trial_year = int(trial.start_date[:4])
-                        else:
-                            trial_year = trial.start_date.year
-
-                        timeline_events.append(
-                            {
-                                "date": trial_year,
-                                "type": "clinical_trial",
-                                "paper_id": paper.id,
-                                "trial_id": trial.trial_id,
-                                "event_title": f"Clinical Trial: {trial.title[:50]}..."
-                                if trial.title
-                                else f"Trial {trial.trial_id}",
-                            }
-                        )
-                    except (ValueError, AttributeError):
-                        continue
-
-        # Sort by date
-        timeline_events.sort(key=lambda x: x["date"])
-
-        # Create summary statistics
-        event_counts = Counter(event["type"] for event in timeline_events)
-
-        return {
-            "timeline_events": timeline_events,
-            "event_counts": dict(event_counts),
-            "date_range": {
-                "start": min(event["date"] for event in timeline_events)
-                if timeline_events
-                else None,
-                "end": max(event["date"] for event in timeline_events)
-                if timeline_events
-                else None,
-            },
-        }
+        tally = _UptakeTally.from_papers(papers, with_timeline=True)
+        return self._summarize_timeline(tally.timeline_events)
 
     def identify_breakthrough_papers(
-        self, papers: List[PaperRecord], threshold: float = 80.0
+        self,
+        papers: List[PaperRecord],
+        threshold: float = 80.0,
+        scores: Optional[np.ndarray] = None,
     ) -> List[Dict[str, Any]]:
         """Identify papers with exceptional translational impact.
 
         Args:
             papers: List of paper records
             threshold: Minimum translational impact score threshold
+            scores: Precomputed translational impact scores aligned with
+                ``papers``; computed here if not given
 
         Returns:
             List of breakthrough papers with their impact metrics
         """
+        if scores is None:
+            scores = self._translational_scores(papers)
+
+        selected = np.flatnonzero(scores >= threshold)
+        selected_papers = [papers[i] for i in selected]
+        breakthrough_factors = self._identify_breakthrough_factors(selected_papers)
+
         breakthrough_papers = []
 
-        for paper in papers:
-            impact_score = self.calculate_translational_impact_score(paper)
-
-            if impact_score >= threshold:
-                paper_info = {
-                    "id": paper.id,
-                    "title": paper.title,
-                    "year": paper.year,
-                    "citation_count": paper.citation_count,
-                    "patent_citations": len(paper.patent_citations),
-                    "clinical_trials": len(paper.clinical_trials),
-                    "translational_impact_score": impact_score,
-                    "primary_field": paper.primary_field,
-                    "breakthrough_factors": self._identify_breakthrough_factors(paper),
-                }
-                breakthrough_papers.append(paper_info)
+        for paper, impact_score, factors in zip(
+            selected_papers, scores[selected].tolist(), breakthrough_factors
+        ):
+            paper_info = {
+                "id": paper.id,
+                "title": paper.title,
+                "year": paper.year,
+                "citation_count": paper.citation_count,
+                "patent_citations": len(paper.patent_citations),
+                "clinical_trials": len(paper.clinical_trials),
+                "translational_impact_score": impact_score,
+                "primary_field": paper.primary_field,
+                "breakthrough_factors": factors,
+            }
+            breakthrough_papers.append(paper_info)
 
         # Sort by impact score
         breakthrough_papers.sort(
-            key=lambda x: x["translational_impact_score"], reverse=True
+            key=itemgetter("translational_impact_score"), reverse=True
         )
 
         return breakthrough_papers
@@ -456,34 +495,36 @@ class UptakeAggregator:
         Returns:
             Comprehensive uptake report
         """
-        patent_analysis = self.analyze_patent_uptake(papers)
-        trial_analysis = self.analyze_clinical_trial_uptake(papers)
-        policy_analysis = self.analyze_policy_uptake(papers)
-        timeline = self.create_uptake_timeline(papers)
-        breakthrough_papers = self.identify_breakthrough_papers(papers)
-
-        # Calculate overall translational metrics
-        translational_scores = [
-            self.calculate_translational_impact_score(paper) for paper in papers
-        ]
+        if not papers:
+            return self._empty_uptake_report()
 
-        avg_translational_score = (
-            sum(translational_scores) / len(translational_scores)
-            if translational_scores
-            else 0
+        # Walk the papers once; every section below formats the same tally
+        current_year = datetime.now().year
+        tally = _UptakeTally.from_papers(papers, current_year, with_timeline=True)
+        translational_scores = _translational_scores(
+            tally.patent_counts, tally.trial_counts, tally.citation_counts
         )
 
         # Papers with any translational impact
-        papers_with_translational_impact = sum(
-            1
-            for paper in papers
-            if len(paper.patent_citations) > 0 or len(paper.clinical_trials) > 0
+        papers_with_translational_impact = int(
+            np.count_nonzero((tally.patent_counts > 0) | (tally.trial_counts > 0))
         )
 
-        translational_rate = (
-            papers_with_translational_impact / len(papers) if papers else 0
+        patent_analysis = self._patent_analysis(papers, tally)
+        trial_analysis = self._trial_analysis(papers, tally)
+        policy_analysis = self.analyze_policy_uptake(papers)
+        timeline = self._summarize_timeline(tally.timeline_events)
+        # Citations alone score at most 50, below the breakthrough threshold
+        breakthrough_papers = (
+            self.identify_breakthrough_papers(papers, scores=translational_scores)
+            if papers_with_translational_impact
+            else []
         )
 
+        # Calculate overall translational metrics
+        avg_translational_score = float(translational_scores.mean())
+        translational_rate = papers_with_translational_impact / len(papers)
+
         report = {
             "executive_summary": {
                 "total_papers": len(papers),
@@ -498,48 +539,144 @@ class UptakeAggregator:
             "timeline": timeline,
             "breakthrough_papers": breakthrough_papers,
             "recommendations": self._generate_uptake_recommendations(
-                papers, patent_analysis, trial_analysis
+                tally.fields, patent_analysis, trial_analysis, translational_scores
+            ),
+            "translational_potential": self._assess_translational_potential(
+                tally, translational_scores, current_year
             ),
-            "translational_potential": self._assess_translational_potential(papers),
         }
 
         return report
 
-    def _create_patent_timeline(self, patents_df: pd.DataFrame) -> Dict[str, Any]:
-        """Create patent citation timeline."""
-        if patents_df.empty:
-            return {}
+    def _empty_uptake_report(self) -> Dict[str, Any]:
+        """Build the uptake report of an empty paper list without analysis."""
+        return {
+            "executive_summary": {
+                "total_papers": 0,
+                "papers_with_translational_impact": 0,
+                "translational_impact_rate": 0,
+                "average_translational_score": 0,
+                "breakthrough_papers_count": 0,
+            },
+            "patent_analysis": self.analyze_patent_uptake([]),
+            "clinical_trial_analysis": self.analyze_clinical_trial_uptake([]),
+            "policy_analysis": self.analyze_policy_uptake([]),
+            "timeline": self._summarize_timeline([]),
+            "breakthrough_papers": [],
+            "recommendations": [],
+            "translational_potential": {"status": "insufficient_recent_data"},
+        }
+
+    def _patent_analysis(
+        self, papers: List[PaperRecord], tally: _UptakeTally
+    ) -> Dict[str, Any]:
+        """Format the patent uptake analysis of papers from their tally."""
+        total_papers = len(tally.patent_counts)
+        papers_with_patents = int(np.count_nonzero(tally.patent_counts))
+        total_patent_citations = int(tally.patent_counts.sum())
+
+        if not total_patent_citations:
+            return {
+                "total_papers": total_papers,
+                "papers_with_patents": 0,
+                "patent_citation_rate": 0.0,
+                "total_patent_citations": 0,
+            }
+
+        # Time analysis
+        lag_sum, lag_count = tally.time_to_patent
+        avg_time_to_patent = lag_sum / lag_count if lag_count else None
+
+        return {
+            "total_papers": total_papers,
+            "papers_with_patents": papers_with_patents,
+            "patent_citation_rate": papers_with_patents / total_papers,
+            "total_patent_citations": total_patent_citations,
+            "average_patents_per_paper": total_patent_citations / total_papers,
+            "average_time_to_patent": avg_time_to_patent,
+            "field_distribution": _sorted_counts(tally.patent_field_counts),
+            "top_assignees": _most_common(tally.assignee_counts, 10),
+            "top_classifications": _most_common(tally.classification_counts, 10),
+            "patent_timeline": self._create_patent_timeline(tally.patent_year_counts),
+            "high_patent_impact_papers": self._identify_high_patent_impact_papers(
+                papers, tally.patent_counts
+            ),
+        }
 
-        # Group patents by year
-        yearly_counts = patents_df.groupby("patent_year").size().to_dict()
+    def _trial_analysis(
+        self, papers: List[PaperRecord], tally: _UptakeTally
+    ) -> Dict[str, Any]:
+        """Format the clinical trial uptake analysis of papers from their tally."""
+        total_papers = len(tally.trial_counts)
+        papers_with_trials = int(np.count_nonzero(tally.trial_counts))
+        total_trial_citations = int(tally.trial_counts.sum())
+
+        if not total_trial_citations:
+            return {
+                "total_papers": total_papers,
+                "papers_with_trials": 0,
+                "trial_citation_rate": 0.0,
+                "total_trial_citations": 0,
+            }
+
+        # Time analysis
+        lag_sum, lag_count = tally.time_to_trial
+        avg_time_to_trial = lag_sum / lag_count if lag_count else None
+
+        return {
+            "total_papers": total_papers,
+            "papers_with_trials": papers_with_trials,
+            "trial_citation_rate": papers_with_trials / total_papers,
+            "total_trial_citations": total_trial_citations,
+            "average_trials_per_paper": total_trial_citations / total_papers,
+            "average_time_to_trial": avg_time_to_trial,
+            "phase_distribution": _most_common(tally.phase_counts),
+            "status_distribution": _most_common(tally.status_counts),
+            "top_conditions": _most_common(tally.condition_counts, 10),
+            "top_sponsors": _most_common(tally.sponsor_counts, 10),
+            "trial_timeline": self._create_trial_timeline(tally.trial_year_counts),
+            "high_clinical_impact_papers": self._identify_high_clinical_impact_papers(
+                papers, tally.trial_counts
+            ),
+        }
+
+    def _summarize_timeline(
+        self, timeline_events: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Sort timeline events by date and summarize them."""
+        # Sort by date; the date range is then read off the ends
+        timeline_events.sort(key=itemgetter("date"))
+
+        # Create summary statistics
+        event_counts = Counter(map(itemgetter("type"), timeline_events))
+
+        return {
+            "timeline_events": timeline_events,
+            "event_counts": dict(event_counts),
+            "date_range": {
+                "start": timeline_events[0]["date"] if timeline_events else None,
+                "end": timeline_events[-1]["date"] if timeline_events else None,
+            },
+        }
+
+    def _create_patent_timeline(self, yearly_counts: Counter) -> Dict[str, Any]:
+        """Create patent citation timeline from patent counts per year."""
+        yearly_counts = _sorted_counts(yearly_counts)
 
         return {
             "yearly_patent_counts": yearly_counts,
             "patent_growth_trend": self._calculate_growth_trend(yearly_counts),
         }
 
-    def _create_trial_timeline(self, trials_df: pd.DataFrame) -> Dict[str, Any]:
-        """Create clinical trial timeline."""
-        if trials_df.empty:
-            return {}
-
-        # Extract years from start dates
-        trial_years = []
-        for start_date in trials_df["trial_start_date"].dropna():
-            try:
-                if isinstance(start_date, str):
-                    year = int(start_date[:4])
-                else:
-                    year = start_date.year
-                trial_years.append(year)
-            except (ValueError, AttributeError):
-                continue
-
-        yearly_counts = Counter(trial_years)
+    def _create_trial_timeline(self, yearly_counts: Counter) -> Dict[str, Any]:
+        """Create clinical trial timeline from trial counts per start year."""
+        yearly_counts = {
+            year: count for year, count in yearly_counts.items() if year is not None
+        }
 
         return {
-            "yearly_trial_counts": dict(yearly_counts),
-            "trial_growth_trend": self._calculate_growth_trend(dict(yearly_counts)),
+            "yearly_trial_counts": yearly_counts,
+            "trial_growth_trend": self._calculate_growth_trend(yearly_counts),
         }
 
     def _calculate_growth_trend(self, yearly_counts: Dict[int, int]) -> str:
@@ -547,17 +684,15 @@ class UptakeAggregator:
         if len(yearly_counts) < 2:
             return "insufficient_data"
 
-        years = sorted(yearly_counts.keys())
-        counts = [yearly_counts[year] for year in years]
+        counts = np.array(
+            [yearly_counts[year] for year in sorted(yearly_counts)], dtype=np.float64
+        )
 
-        # Simple linear trend
-        if len(counts) >= 3:
-            recent_avg = sum(counts[-3:]) / 3
-            early_avg = (
-                sum(counts[:3]) / 3
-                if len(counts) >= 6
-                else sum(counts[:-3]) / len(counts[:-3])
-            )
+        # Simple linear trend: the last three years against the years before
+        # them (at most the first three); three years leave nothing to compare
+        if len(counts) > 3:
+            recent_avg = counts[-3:].mean()
+            early_avg = counts[:3].mean() if len(counts) >= 6 else counts[:-3].mean()
 
             if recent_avg > early_avg * 1.2:
                 return "increasing"
@@ -569,84 +704,97 @@ class UptakeAggregator:
         return "unknown"
 
     def _identify_high_patent_impact_papers(
-        self, papers: List[PaperRecord]
+        self, papers: List[PaperRecord], patent_counts: np.ndarray
     ) -> List[Dict[str, Any]]:
         """Identify papers with high patent impact."""
-        high_impact = []
 
-        for paper in papers:
-            patent_count = len(paper.patent_citations)
-            if patent_count >= 3:  # Threshold for high patent impact
-                high_impact.append(
-                    {
-                        "id": paper.id,
-                        "title": paper.title,
-                        "patent_count": patent_count,
-                        "citation_count": paper.citation_count,
-                    }
-                )
-
-        return sorted(high_impact, key=lambda x: x["patent_count"], reverse=True)
+        # Threshold for high patent impact
+        return [
+            {
+                "id": papers[i].id,
+                "title": papers[i].title,
+                "patent_count": int(patent_counts[i]),
+                "citation_count": papers[i].citation_count,
+            }
+            for i in _rank_above(patent_counts, 3)
+        ]
 
     def _identify_high_clinical_impact_papers(
-        self, papers: List[PaperRecord]
+        self, papers: List[PaperRecord], trial_counts: np.ndarray
     ) -> List[Dict[str, Any]]:
         """Identify papers with high clinical impact."""
-        high_impact = []
 
-        for paper in papers:
-            trial_count = len(paper.clinical_trials)
-            if trial_count >= 2:  # Threshold for high clinical impact
-                high_impact.append(
-                    {
-                        "id": paper.id,
-                        "title": paper.title,
-                        "trial_count": trial_count,
-                        "citation_count": paper.citation_count,
-                    }
-                )
-
-        return sorted(high_impact, key=lambda x: x["trial_count"], reverse=True)
-
-    def _identify_breakthrough_factors(self, paper: PaperRecord) -> List[str]:
-        """Identify factors that make a paper a breakthrough."""
-        factors = []
+        # Threshold for high clinical impact
+        return [
+            {
+                "id": papers[i].id,
+                "title": papers[i].title,
+                "trial_count": int(trial_counts[i]),
+                "citation_count": papers[i].citation_count,
+            }
+            for i in _rank_above(trial_counts, 2)
+        ]
 
-        if len(paper.patent_citations) >= 5:
-            factors.append("high_patent_impact")
+    def _identify_breakthrough_factors(
+        self, papers: List[PaperRecord]
+    ) -> List[List[str]]:
+        """Identify factors that make each paper a breakthrough.
 
-        if len(paper.clinical_trials) >= 3:
-            factors.append("high_clinical_impact")
+        Every factor is evaluated as a boolean mask over all papers at once.
 
-        if paper.citation_count and paper.citation_count >= 100:
-            factors.append("high_citation_impact")
+        Args:
+            papers: List of paper records
 
-        if paper.rcr and paper.rcr >= 5.0:
-            factors.append("exceptional_field_impact")
+        Returns:
+            List of factor names for each paper, aligned with ``papers``
+        """
+        n = len(papers)
+        patent_counts, trial_counts, citation_counts = _uptake_counts(papers)
+        rcrs = np.fromiter(
+            (paper.rcr or 0.0 for paper in papers), dtype=np.float64, count=n
+        )
 
         # Check for rapid uptake (patents/trials within 2 years)
-        paper_year = paper.year or datetime.now().year
-        rapid_patents = sum(
-            1
-            for patent in paper.patent_citations
-            if patent.year and patent.year - paper_year <= 2
+        current_year = datetime.now().year
+        rapid_patents = np.fromiter(
+            (
+                sum(
+                    1
+                    for patent in paper.patent_citations
+                    if patent.year and patent.year - (paper.year or current_year) <= 2
+                )
+                for paper in papers
+            ),
+            dtype=np.int64,
+            count=n,
         )
 
-        if rapid_patents >= 2:
-            factors.append("rapid_patent_uptake")
+        factor_masks = {
+            "high_patent_impact": patent_counts >= 5,
+            "high_clinical_impact": trial_counts >= 3,
+            "high_citation_impact": citation_counts >= 100,
+            "exceptional_field_impact": rcrs >= 5.0,
+            "rapid_patent_uptake": rapid_patents >= 2,
+        }
 
-        return factors
+        names = list(factor_masks)
+        flags = np.column_stack(list(factor_masks.values()))
+        return [
+            [name for name, flag in zip(names, paper_flags) if flag]
+            for paper_flags in flags.tolist()
+        ]
 
     def _generate_uptake_recommendations(
         self,
-        papers: List[PaperRecord],
+        fields: List[Optional[str]],
         patent_analysis: Dict[str, Any],
         trial_analysis: Dict[str, Any],
+        scores: np.ndarray,
     ) -> List[str]:
         """Generate recommendations for improving translational impact."""
         recommendations = []
 
-        if not papers:
+        if not fields:
             return recommendations
 
         patent_rate = patent_analysis.get("patent_citation_rate", 0)
@@ -676,60 +824,43 @@ class UptakeAggregator:
                 "This demonstrates strong clinical relevance."
             )
 
-        # Field-specific recommendations
-        field_patterns = defaultdict(list)
-        for paper in papers:
-            field = paper.primary_field or "Unknown"
-            translational_score = self.calculate_translational_impact_score(paper)
-            field_patterns[field].append(translational_score)
-
-        for field, scores in field_patterns.items():
-            if len(scores) >= 3:
-                avg_score = sum(scores) / len(scores)
-                if avg_score < 20:
-                    recommendations.append(
-                        f"In {field}, consider more applied research directions "
-                        "to increase translational potential."
-                    )
+        # Field-specific recommendations: mean score per field in one pass,
+        # reported in order of each field's first appearance
+        field_names, first_seen, field_ids = np.unique(
+            np.array([field or "Unknown" for field in fields]),
+            return_index=True,
+            return_inverse=True,
+        )
+        field_counts = np.bincount(field_ids)
+        field_means = np.bincount(field_ids, weights=scores) / field_counts
+
+        for i in np.argsort(first_seen):
+            if field_counts[i] >= 3 and field_means[i] < 20:
+                recommendations.append(
+                    f"In {field_names[i]}, consider more applied research directions "
+                    "to increase translational potential."
+                )
 
         return recommendations
 
     def _assess_translational_potential(
-        self, papers: List[PaperRecord]
+        self, tally: _UptakeTally, scores: np.ndarray, current_year: int
     ) -> Dict[str, Any]:
         """Assess future translational potential of the research portfolio."""
-        recent_papers = [
-            paper
-            for paper in papers
-            if paper.year and paper.year >= datetime.now().year - 3
-        ]
+        # Undated papers have year 0 in the tally and are never recent
+        recent = np.flatnonzero(tally.years >= current_year - 3)
 
-        if not recent_papers:
+        if not recent.size:
             return {"status": "insufficient_recent_data"}
 
-        recent_translational_scores = [
-            self.calculate_translational_impact_score(paper) for paper in recent_papers
-        ]
-
-        avg_recent_score = sum(recent_translational_scores) / len(
-            recent_translational_scores
-        )
+        avg_recent_score = float(scores[recent].mean())
 
         # Assess based on field and recency
-        clinical_fields = ["medicine", "biology", "biomedical", "health", "clinical"]
-        applied_fields = ["engineering", "computer science", "technology"]
-
-        field_alignment_score = 0
-        for paper in recent_papers:
-            field = paper.primary_field.lower() if paper.primary_field else ""
-            if any(clinical_field in field for clinical_field in clinical_fields):
-                field_alignment_score += 30
-            elif any(applied_field in field for applied_field in applied_fields):
-                field_alignment_score += 20
-            else:
-                field_alignment_score += 10
+        field_alignment_score = sum(
+            _field_alignment(tally.fields[i]) for i in recent.tolist()
+        )
 
-        field_alignment_score = min(100, field_alignment_score / len(recent_papers))
+        field_alignment_score = min(100, field_alignment_score / recent.size)
 
         potential_score = (avg_recent_score * 0.7) + (field_alignment_score * 0.3)
 
@@ -743,7 +874,7 @@ class UptakeAggregator:
         return {
             "potential_level": potential_level,
             "potential_score": potential_score,
-            "recent_papers_count": len(recent_papers),
+            "recent_papers_count": int(recent.size),
             "average_recent_translational_score": avg_recent_score,
             "field_alignment_score": field_alignment_score,
         }
@@ -1,5 +1,7 @@
 """Main CLI application for CitationMap."""
 
+import asyncio
+import heapq
 import logging
 from pathlib import Path
 from typing import List, Optional
@@ -61,7 +63,7 @@ def analyze(
         ) as progress:
             # Fetch papers
             fetch_task = progress.add_task("Fetching publication data...", total=None)
-            papers = _fetch_papers(orcid_id)
+            papers = asyncio.run(_fetch_papers(orcid_id))
             progress.update(fetch_task, description=f"Found {len(papers)} papers")
 
             if not papers:
@@ -98,7 +100,7 @@ def stats(orcid_id: str = typer.Argument(..., help="ORCID ID of the researcher")
     try:
         # Fetch papers
         with console.status("Loading data..."):
-            papers = _fetch_papers(orcid_id)
+            papers = asyncio.run(_fetch_papers(orcid_id))
 
         if not papers:
             console.print("[red]No papers found for ORCID ID[/red]")
@@ -115,18 +117,20 @@ def stats(orcid_id: str = typer.Argument(..., help="ORCID ID of the researcher")
         raise typer.Exit(1)
 
 
-def _fetch_papers(orcid_id: str) -> List[PaperRecord]:
+async def _fetch_papers(orcid_id: str) -> List[PaperRecord]:
     """Fetch papers for ORCID ID."""
-    openalex = OpenAlexClient()
-    papers = openalex.fetch_papers_by_orcid(orcid_id)
-
-    # Enhance with iCite data
-    icite = iCiteClient()
-    for paper in papers:
-        if paper.pmid:
-            icite_data = icite.fetch_paper_metrics(paper.pmid)
-            if icite_data:
-                paper.rcr = icite_data.get("relative_citation_ratio")
+    # Both clients share one event loop and are closed when the fetch is done
+    async with OpenAlexClient() as openalex, iCiteClient() as icite:
+        papers = await openalex.fetch_author_papers(orcid_id)
+
+        # Enhance with iCite data, one batched lookup for all PMIDs
+        pmids = [paper.pmid for paper in papers if paper.pmid]
+        if pmids:
+            metrics = await icite.get_metrics_by_pmids(pmids)
+            for paper in papers:
+                icite_data = metrics.get(paper.pmid) if paper.pmid else None
+                if icite_data:
+                    paper.rcr = icite_data.get("relative_citation_ratio")
 
     return papers
 
@@ -198,9 +202,7 @@ def _display_summary(papers: List[PaperRecord], analysis_results: dict):
 
     # Top papers
     if papers:
-        top_papers = sorted(papers, key=lambda p: p.citation_count or 0, reverse=True)[
-            :3
-        ]
+        top_papers = heapq.nlargest(3, papers, key=lambda p: p.citation_count or 0)
         console.print("\n[bold]Top Cited Papers:[/bold]")
         for i, paper in enumerate(top_papers, 1):
             console.print(f"{i}. {paper.title} ({paper.citation_count or 0} citations)")
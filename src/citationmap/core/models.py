@@ -1,10 +1,11 @@
 """Core data models for CitationMap."""
 
+import heapq
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 
 class FieldOfStudy(BaseModel):
@@ -69,6 +70,13 @@ class PatentCitation(BaseModel):
     citation_context: Optional[CitationContext] = None
     citation_count: int = 0
 
+    @property
+    def main_class(self) -> Optional[str]:
+        """Get the main classification code (the part before the first /)."""
+        if self.classification is None:
+            return None
+        return self.classification.partition("/")[0]
+
 
 class ClinicalTrial(BaseModel):
     """Represents a clinical trial that references a paper."""
@@ -174,6 +182,11 @@ class AnalysisResult(BaseModel):
     total_patent_citations: int = 0
     total_clinical_trials: int = 0
 
+    # Papers by lowercased field name, keyed to the papers list it indexes
+    _field_index: Optional[Tuple[List[PaperRecord], Dict[str, List[PaperRecord]]]] = (
+        PrivateAttr(default=None)
+    )
+
     @property
     def average_citations_per_paper(self) -> float:
         """Calculate average citations per paper."""
@@ -190,15 +203,26 @@ class AnalysisResult(BaseModel):
 
     def get_top_papers_by_citations(self, n: int = 10) -> List[PaperRecord]:
         """Get top N papers by citation count."""
-        return sorted(self.papers, key=lambda p: p.citation_count, reverse=True)[:n]
+        return heapq.nlargest(n, self.papers, key=lambda p: p.citation_count)
 
     def get_papers_by_field(self, field_name: str) -> List[PaperRecord]:
         """Get papers in a specific field of study."""
-        return [
-            paper
-            for paper in self.papers
-            if any(
-                field.display_name.lower() == field_name.lower()
-                for field in paper.fields_of_study
-            )
-        ]
+        return list(self._papers_by_field().get(field_name.lower(), []))
+
+    def _papers_by_field(self) -> Dict[str, List[PaperRecord]]:
+        """Index papers by lowercased field name.
+
+        The index is built once and reused while ``papers`` is the same list;
+        papers are expected not to change in place after analysis.
+        """
+        cached = self._field_index
+        if cached is not None and cached[0] is self.papers:
+            return cached[1]
+
+        index: Dict[str, List[PaperRecord]] = {}
+        for paper in self.papers:
+            for name in {field.display_name.lower() for field in paper.fields_of_study}:
+                index.setdefault(name, []).append(paper)
+
+        self._field_index = (self.papers, index)
+        return index
@@ -1,17 +1,36 @@
 """Disk cache abstraction layer for API responses."""
 
-import json
 import hashlib
+import zlib
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
-from datetime import datetime, timedelta
 import diskcache as dc
-from pydantic import BaseModel
+from diskcache.core import MODE_BINARY, MODE_RAW, UNKNOWN
+import orjson
+from pydantic import BaseModel, ConfigDict
+
+
+def _count_by_tag(cache: dc.Cache) -> Dict[str, int]:
+    """Count cache entries per tag without reading their values.
+    
+    diskcache has no public API for this, so the count is read from the
+    ``tag`` column of its ``Cache`` table (schema of diskcache 5.6).
+    
+    Args:
+        cache: Cache to count
+        
+    Returns:
+        Dictionary mapping tag (API name, "unknown" if untagged) to count
+    """
+    rows = cache._sql("SELECT tag, COUNT(*) FROM Cache GROUP BY tag").fetchall()
+    return {tag or "unknown": count for tag, count in rows}
 
 
 class CacheConfig(BaseModel):
     """Configuration for cache settings."""
     
+    model_config = ConfigDict(frozen=True)
+    
     directory: str = ".cache"
     expire_after: int = 604800  # 1 week in seconds
     max_size: str = "1GB"
@@ -30,6 +49,38 @@ class CacheConfig(BaseModel):
             return int(size_str)
 
 
+class OrjsonDisk(dc.Disk):
+    """Diskcache storage that serializes values as zlib-compressed JSON.
+    
+    Keys keep diskcache's native storage. Values are stored as the
+    compressed orjson bytes of the API response instead of a pickle.
+    """
+    
+    def __init__(self, directory: str, compress_level: int = 1, **kwargs):
+        """Initialize disk storage.
+        
+        Args:
+            directory: Cache directory path
+            compress_level: zlib compression level (0-9, 0 disables compression)
+            **kwargs: Arguments for ``diskcache.Disk``
+        """
+        self.compress_level = compress_level
+        super().__init__(directory, **kwargs)
+    
+    def store(self, value: Any, read: bool, key: Any = UNKNOWN):
+        """Serialize and compress a value before storing it."""
+        if not read:
+            value = zlib.compress(orjson.dumps(value), self.compress_level)
+        return super().store(value, read, key=key)
+    
+    def fetch(self, mode: int, filename: Optional[str], value: Any, read: bool) -> Any:
+        """Decompress and parse a stored value."""
+        data = super().fetch(mode, filename, value, read)
+        if not read and mode in (MODE_RAW, MODE_BINARY):
+            data = orjson.loads(zlib.decompress(data))
+        return data
+
+
 class CacheManager:
     """Manages disk cache for API responses with expiration."""
     
@@ -42,11 +93,14 @@ class CacheManager:
         self.config = config or CacheConfig()
         self.cache_dir = Path(self.config.directory)
         self.cache_dir.mkdir(exist_ok=True)
+        self._size_limit = self.config.max_size_bytes
         
         # Initialize diskcache
         self.cache = dc.Cache(
             str(self.cache_dir),
-            size_limit=self.config.max_size_bytes
+            disk=OrjsonDisk,
+            size_limit=self._size_limit,
+            tag_index=True
         )
     
     def _make_key(self, api_name: str, endpoint: str, params: Dict[str, Any]) -> str:
@@ -61,11 +115,11 @@ class CacheManager:
             Cache key string
         """
         # Sort params for consistent key generation
-        sorted_params = json.dumps(params, sort_keys=True)
-        key_data = f"{api_name}:{endpoint}:{sorted_params}"
+        sorted_params = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        key_data = f"{api_name}:{endpoint}:".encode() + sorted_params
         
-        # Use hash for shorter keys
-        return hashlib.sha256(key_data.encode()).hexdigest()[:32]
+        # Use a 128-bit BLAKE2b hash for shorter keys (32 hex characters)
+        return hashlib.blake2b(key_data, digest_size=16).hexdigest()
     
     def get(self, api_name: str, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Retrieve cached response.
@@ -81,28 +135,26 @@ class CacheManager:
         key = self._make_key(api_name, endpoint, params)
         
         try:
-            cached_data = self.cache.get(key)
-            if cached_data is None:
-                return None
-                
-            # Check if expired
-            cached_time = datetime.fromisoformat(cached_data["timestamp"])
-            expires_at = cached_time + timedelta(seconds=self.config.expire_after)
-            
-            if datetime.now() > expires_at:
-                self.cache.delete(key)
-                return None
-                
-            return cached_data["data"]
-            
-        except (KeyError, ValueError, TypeError):
+            # Expired entries are dropped by diskcache itself
+            data, tag = self.cache.get(key, tag=True)
+        except (zlib.error, orjson.JSONDecodeError):
             # Invalid cache entry, remove it
             self.cache.delete(key)
             return None
+        
+        if tag is None:
+            if data is not None:
+                # Untagged entry stored before expiry moved to diskcache, remove it
+                self.cache.delete(key)
+            return None
+        return data
     
     def set(self, api_name: str, endpoint: str, params: Dict[str, Any], data: Dict[str, Any]) -> None:
         """Store response in cache.
         
+        The entry expires after ``config.expire_after`` seconds and is tagged
+        with the API name so it can be cleared or counted without loading it.
+        
         Args:
             api_name: Name of the API
             endpoint: API endpoint
@@ -110,16 +162,7 @@ class CacheManager:
             data: Response data to cache
         """
         key = self._make_key(api_name, endpoint, params)
-        
-        cache_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "api_name": api_name,
-            "endpoint": endpoint,
-            "params": params,
-            "data": data
-        }
-        
-        self.cache.set(key, cache_entry)
+        self.cache.set(key, data, expire=self.config.expire_after, tag=api_name)
     
     def clear(self, api_name: Optional[str] = None) -> int:
         """Clear cache entries.
@@ -131,24 +174,10 @@ class CacheManager:
             Number of entries cleared
         """
         if api_name is None:
-            count = len(self.cache)
-            self.cache.clear()
-            return count
-        
-        # Clear entries for specific API
-        keys_to_delete = []
-        for key in self.cache:
-            try:
-                cached_data = self.cache.get(key)
-                if cached_data and cached_data.get("api_name") == api_name:
-                    keys_to_delete.append(key)
-            except (KeyError, TypeError):
-                continue
-        
-        for key in keys_to_delete:
-            self.cache.delete(key)
-            
-        return len(keys_to_delete)
+            return self.cache.clear()
+        
+        # Clear entries for specific API through the tag index
+        return self.cache.evict(api_name)
     
     def stats(self) -> Dict[str, Union[int, str]]:
         """Get cache statistics.
@@ -156,19 +185,12 @@ class CacheManager:
         Returns:
             Dictionary with cache statistics
         """
+        # Drop expired entries first so both counts cover the same entries
+        self.cache.expire()
+        
         total_entries = len(self.cache)
         cache_size = sum(self.cache.disk_size.values()) if hasattr(self.cache, 'disk_size') else 0
-        
-        # Count entries by API
-        api_counts = {}
-        for key in self.cache:
-            try:
-                cached_data = self.cache.get(key)
-                if cached_data:
-                    api_name = cached_data.get("api_name", "unknown")
-                    api_counts[api_name] = api_counts.get(api_name, 0) + 1
-            except (KeyError, TypeError):
-                continue
+        api_counts = _count_by_tag(self.cache)
         
         return {
             "total_entries": total_entries,
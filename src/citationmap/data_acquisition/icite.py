@@ -2,13 +2,21 @@
 
 import asyncio
 import logging
+from bisect import bisect_right
 from typing import List, Dict, Any, Optional
 import httpx
+import orjson
 
 from .cache import CacheManager
 
 logger = logging.getLogger(__name__)
 
+# Rough RCR -> percentile mapping based on RCR distribution characteristics:
+# an RCR of at least _RCR_BINS[i - 1] (and below _RCR_BINS[i]) maps to
+# _RCR_PERCENTILES[i]
+_RCR_BINS = (0.5, 1.0, 1.5, 2.0, 2.5, 4.0)
+_RCR_PERCENTILES = (10.0, 25.0, 50.0, 75.0, 85.0, 90.0, 95.0)
+
 
 class iCiteClient:
     """Client for NIH iCite API to get RCR and field citation metrics."""
@@ -95,7 +103,7 @@ class iCiteClient:
             response = await self.client.get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Cache the response
             self.cache.set("icite", endpoint, params, data)
@@ -125,27 +133,27 @@ class iCiteClient:
         batch_size = 1000
         all_metrics = {}
         
-        for i in range(0, len(pmids), batch_size):
-            batch_pmids = pmids[i:i + batch_size]
-            pmid_list = ",".join(batch_pmids)
-            
-            params = {
-                "pmids": pmid_list,
-                "format": "json"
-            }
-            
-            try:
-                response = await self._make_request("/pubs", params)
-                
-                for paper_data in response.get("data", []):
-                    pmid = str(paper_data.get("pmid"))
-                    if pmid:
-                        all_metrics[pmid] = paper_data
-                        
-            except Exception as e:
-                logger.error(f"Error fetching iCite data for PMIDs {batch_pmids}: {e}")
+        batches = [pmids[i:i + batch_size] for i in range(0, len(pmids), batch_size)]
+        
+        # Batches are requested concurrently; _rate_limit still spaces them out
+        responses = await asyncio.gather(
+            *[
+                self._make_request("/pubs", {"pmids": ",".join(batch), "format": "json"})
+                for batch in batches
+            ],
+            return_exceptions=True
+        )
+        
+        for batch_pmids, response in zip(batches, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Error fetching iCite data for PMIDs {batch_pmids}: {response}")
                 # Continue with other batches
                 continue
+            
+            for paper_data in response.get("data", []):
+                pmid = str(paper_data.get("pmid"))
+                if pmid:
+                    all_metrics[pmid] = paper_data
         
         return all_metrics
     
@@ -165,27 +173,27 @@ class iCiteClient:
         batch_size = 1000
         all_metrics = {}
         
-        for i in range(0, len(dois), batch_size):
-            batch_dois = dois[i:i + batch_size]
-            doi_list = ",".join(batch_dois)
-            
-            params = {
-                "dois": doi_list,
-                "format": "json"
-            }
-            
-            try:
-                response = await self._make_request("/pubs", params)
-                
-                for paper_data in response.get("data", []):
-                    doi = paper_data.get("doi")
-                    if doi:
-                        all_metrics[doi] = paper_data
-                        
-            except Exception as e:
-                logger.error(f"Error fetching iCite data for DOIs {batch_dois}: {e}")
+        batches = [dois[i:i + batch_size] for i in range(0, len(dois), batch_size)]
+        
+        # Batches are requested concurrently; _rate_limit still spaces them out
+        responses = await asyncio.gather(
+            *[
+                self._make_request("/pubs", {"dois": ",".join(batch), "format": "json"})
+                for batch in batches
+            ],
+            return_exceptions=True
+        )
+        
+        for batch_dois, response in zip(batches, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Error fetching iCite data for DOIs {batch_dois}: {response}")
                 # Continue with other batches
                 continue
+            
+            for paper_data in response.get("data", []):
+                doi = paper_data.get("doi")
+                if doi:
+                    all_metrics[doi] = paper_data
         
         return all_metrics
     
@@ -227,21 +235,7 @@ class iCiteClient:
         if rcr is None:
             return None
         
-        # Rough mapping based on RCR distribution characteristics
-        if rcr >= 4.0:
-            return 95.0
-        elif rcr >= 2.5:
-            return 90.0
-        elif rcr >= 2.0:
-            return 85.0
-        elif rcr >= 1.5:
-            return 75.0
-        elif rcr >= 1.0:
-            return 50.0
-        elif rcr >= 0.5:
-            return 25.0
-        else:
-            return 10.0
+        return _RCR_PERCENTILES[bisect_right(_RCR_BINS, rcr)]
     
     async def enrich_papers_with_metrics(
         self, 
@@ -8,7 +8,7 @@ from urllib.parse import urlencode
 import logging
 
 from .cache import CacheManager
-from ..core.models import PaperRecord, Author, Institution, FieldOfStudy
+from ..core.models import PaperRecord
 
 logger = logging.getLogger(__name__)
 
@@ -280,61 +280,61 @@ class OpenAlexClient:
             except ValueError:
                 pass
         
-        # Extract authors with institutions
+        # Extract authors with institutions. Nested records are built as plain
+        # dicts so the whole paper is validated in a single model_validate call
         authors = []
         for authorship in work.get("authorships", []):
             author_data = authorship.get("author", {})
             
             # Parse institutions
-            institutions = []
-            for inst_data in authorship.get("institutions", []):
-                institution = Institution(
-                    id=inst_data.get("id", "").replace("https://openalex.org/", ""),
-                    display_name=inst_data.get("display_name", ""),
-                    country_code=inst_data.get("country_code"),
-                    type=inst_data.get("type")
-                )
-                institutions.append(institution)
+            institutions = [
+                {
+                    "id": inst_data.get("id", "").replace("https://openalex.org/", ""),
+                    "display_name": inst_data.get("display_name", ""),
+                    "country_code": inst_data.get("country_code"),
+                    "type": inst_data.get("type")
+                }
+                for inst_data in authorship.get("institutions", [])
+            ]
             
-            author = Author(
-                id=author_data.get("id", "").replace("https://openalex.org/", ""),
-                display_name=author_data.get("display_name", ""),
-                orcid=author_data.get("orcid"),
-                institutions=institutions,
-                is_corresponding=authorship.get("is_corresponding", False)
-            )
-            authors.append(author)
+            authors.append({
+                "id": author_data.get("id", "").replace("https://openalex.org/", ""),
+                "display_name": author_data.get("display_name", ""),
+                "orcid": author_data.get("orcid"),
+                "institutions": institutions,
+                "is_corresponding": authorship.get("is_corresponding", False)
+            })
         
         # Extract fields of study
-        fields_of_study = []
-        for concept in work.get("concepts", []):
-            field = FieldOfStudy(
-                id=concept.get("id", "").replace("https://openalex.org/", ""),
-                display_name=concept.get("display_name", ""),
-                level=concept.get("level", 0),
-                score=concept.get("score", 0.0)
-            )
-            fields_of_study.append(field)
+        fields_of_study = [
+            {
+                "id": concept.get("id", "").replace("https://openalex.org/", ""),
+                "display_name": concept.get("display_name", ""),
+                "level": concept.get("level", 0),
+                "score": concept.get("score", 0.0)
+            }
+            for concept in work.get("concepts", [])
+        ]
         
         # Primary field is typically the highest scoring level 0 or 1 concept
         primary_field = None
         for field in fields_of_study:
-            if field.level <= 1:
-                primary_field = field.display_name
+            if field["level"] <= 1:
+                primary_field = field["display_name"]
                 break
         
-        return PaperRecord(
-            id=work_id,
-            doi=doi,
-            title=title,
-            authors=authors,
-            publication_date=pub_date,
-            journal=work.get("host_venue", {}).get("display_name"),
-            venue=work.get("host_venue", {}).get("display_name"),
-            citation_count=work.get("cited_by_count", 0),
-            fields_of_study=fields_of_study,
-            primary_field=primary_field
-        )
+        return PaperRecord.model_validate({
+            "id": work_id,
+            "doi": doi,
+            "title": title,
+            "authors": authors,
+            "publication_date": pub_date,
+            "journal": work.get("host_venue", {}).get("display_name"),
+            "venue": work.get("host_venue", {}).get("display_name"),
+            "citation_count": work.get("cited_by_count", 0),
+            "fields_of_study": fields_of_study,
+            "primary_field": primary_field
+        })
     
     async def fetch_author_papers(self, author_id: str) -> List[PaperRecord]:
         """Fetch all papers for an author.
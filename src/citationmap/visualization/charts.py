@@ -1,7 +1,7 @@
 """Interactive charts using Plotly."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 import plotly.express as px
@@ -60,7 +60,7 @@ class ChartGenerator:
         )
 
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=yearly_data["year"],
                 y=yearly_data["paper_count"],
                 mode="lines+markers",
@@ -118,11 +118,19 @@ class ChartGenerator:
         return fig
 
     def export_chart(
-        self, fig: go.Figure, filename: str, format_type: str = "html"
+        self,
+        fig: go.Figure,
+        filename: str,
+        format_type: str = "html",
+        include_plotlyjs: Union[bool, str] = "cdn",
     ) -> str:
-        """Export chart to file."""
+        """Export chart to file.
+
+        By default the HTML loads plotly.js from the CDN instead of inlining
+        it; pass ``include_plotlyjs=True`` for a self-contained offline file.
+        """
         if format_type.lower() == "html":
-            fig.write_html(filename)
+            fig.write_html(filename, include_plotlyjs=include_plotlyjs)
         else:
             raise ValueError(f"Unsupported format: {format_type}")
 
@@ -153,18 +153,25 @@ class TestDataMerger:
         assert "citation_count" in df.columns
         assert df.loc[0, "id"] == "paper1"
         assert df.loc[0, "primary_field"] == "Computer Science"
+        assert df["year"].dtype == np.float64
+        assert df["rcr"].dtype == np.float64
+        assert np.isnan(df.loc[2, "rcr"])
+        assert pd.api.types.is_datetime64_any_dtype(df["publication_date"])
+        assert isinstance(df["primary_field"].dtype, pd.CategoricalDtype)
 
     def test_papers_to_polars(self, sample_papers):
         """Test converting papers to Polars DataFrame."""
-        merger = DataMerger()
+        import polars as pl
 
-        # Mock polars import since it might not be available in test environment
-        with patch("src.citationmap.analysis.merger.pl") as mock_pl:
-            mock_df = Mock()
-            mock_pl.from_pandas.return_value = mock_df
+        merger = DataMerger()
+        df = merger.papers_to_polars(sample_papers)
 
-            result = merger.papers_to_polars(sample_papers)
-            mock_pl.from_pandas.assert_called_once()
+        assert isinstance(df, pl.DataFrame)
+        assert df.height == 3
+        assert df["id"].to_list() == ["paper1", "paper2", "paper3"]
+        assert df.schema["citation_count"] == pl.Int64
+        assert df["rcr"].to_list() == [2.5, 3.2, None]
+        assert merger.papers_to_polars([]).is_empty()
 
     def test_papers_to_dataframe_empty(self):
         """Test with empty papers list."""
@@ -174,6 +181,22 @@ class TestDataMerger:
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 0
 
+    def test_build_all(self, sample_papers):
+        """Test the fused build matches the individual dataframe builders."""
+        merger = DataMerger()
+        papers_df, citations_df, institutions_df = merger.build_all(sample_papers)
+
+        pd.testing.assert_frame_equal(
+            papers_df, merger.papers_to_dataframe(sample_papers)
+        )
+        pd.testing.assert_frame_equal(
+            citations_df, merger.create_citations_dataframe(sample_papers)
+        )
+        pd.testing.assert_frame_equal(
+            institutions_df, merger.create_institutions_dataframe(sample_papers)
+        )
+        assert all(df.empty for df in merger.build_all([]))
+
     def test_merge_icite_data(self, sample_papers):
         """Test merging iCite data."""
         merger = DataMerger()
@@ -193,6 +216,11 @@ class TestDataMerger:
         # RCR should be updated for the matched paper
         paper1_row = merged_df[merged_df["id"] == "paper1"].iloc[0]
         assert paper1_row["rcr"] == 3.0
+        assert paper1_row["fcr"] == 2.0
+        # Papers without iCite data keep their values
+        assert merged_df.loc[merged_df["id"] == "paper2", "rcr"].iloc[0] == 3.2
+        # The input frame is left unchanged
+        assert df.loc[0, "rcr"] == 2.5
 
     def test_create_citations_dataframe(self, sample_papers):
         """Test creating citations DataFrame."""
@@ -203,6 +231,8 @@ class TestDataMerger:
         assert len(citations_df) >= 1  # At least one citation from sample data
         assert "cited_paper_id" in citations_df.columns
         assert "citing_paper_id" in citations_df.columns
+        assert citations_df["citing_year"].dtype == np.float64
+        assert citations_df["num_citing_authors"].dtype == np.int64
 
     def test_create_institutions_dataframe(self, sample_papers):
         """Test creating institutions DataFrame."""
@@ -213,6 +243,25 @@ class TestDataMerger:
         assert len(institutions_df) >= 1
         assert "institution_name" in institutions_df.columns
         assert "institution_country" in institutions_df.columns
+        assert institutions_df["institution_latitude"].dtype == np.float64
+        # Institutions without coordinates get NaN rather than None
+        assert institutions_df["institution_longitude"].isna().any()
+
+    def test_paper_affiliations_cache(self, sample_papers):
+        """Test flattened affiliations are shared until the authors change."""
+        merger = DataMerger()
+        paper = sample_papers[0]
+
+        affiliations = merger._paper_affiliations(paper)
+        assert [inst.id for _, inst in affiliations] == ["inst1", "inst2"]
+        assert merger._paper_affiliations(paper) is affiliations
+
+        paper.authors = paper.authors[:1]
+        assert len(merger._paper_affiliations(paper)) == 1
+
+        # Entries are dropped with their paper
+        del paper, sample_papers[0]
+        assert len(merger._affiliations_cache) == 0
 
     def test_aggregate_field_metrics(self, sample_papers):
         """Test field metrics aggregation."""
@@ -225,6 +274,33 @@ class TestDataMerger:
         assert "paper_count" in field_metrics.columns
         assert "mean_citations" in field_metrics.columns
 
+        # Computer Science papers have 50 and 25 citations
+        cs = field_metrics[field_metrics["field_name"] == "Computer Science"].iloc[0]
+        assert cs["top_10_percent_threshold"] == pytest.approx(47.5)
+        assert cs["top_1_percent_threshold"] == pytest.approx(49.75)
+
+    def test_aggregate_field_metrics_missing_counts(self):
+        """Test percentile thresholds skip missing citation counts."""
+        merger = DataMerger()
+        df = pd.DataFrame(
+            {
+                "primary_field": ["a", "a", "b", "b", "b"],
+                "citation_count": [7.0, np.nan, 1.0, np.nan, 5.0],
+                "independent_citations": [0, 0, 0, 0, 0],
+                "rcr": [1.0] * 5,
+                "year": [2020] * 5,
+                "patent_citations": [0] * 5,
+                "clinical_trials": [0] * 5,
+            }
+        )
+
+        metrics = merger.aggregate_field_metrics(df).set_index("field_name")
+
+        assert metrics.loc["a", "top_10_percent_threshold"] == pytest.approx(7.0)
+        assert metrics.loc["a", "top_1_percent_threshold"] == pytest.approx(7.0)
+        assert metrics.loc["b", "top_10_percent_threshold"] == pytest.approx(4.6)
+        assert metrics.loc["b", "top_1_percent_threshold"] == pytest.approx(4.96)
+
     def test_create_analysis_summary(self, sample_papers):
         """Test creating analysis summary."""
         merger = DataMerger()
@@ -235,6 +311,37 @@ class TestDataMerger:
         assert "h_index" in summary
         assert "i10_index" in summary
         assert summary["total_papers"] == 3
+        # Citation counts 75, 50, 25
+        assert summary["h_index"] == 3
+        assert summary["i10_index"] == 3
+
+    def test_create_analysis_summary_prebuilt_frames(self, sample_papers):
+        """Test the summary reuses dataframes passed in by the caller."""
+        merger = DataMerger()
+        expected = merger.create_analysis_summary(sample_papers)
+
+        papers_df = merger.papers_to_dataframe(sample_papers)
+        institutions_df = merger.create_institutions_dataframe(sample_papers)
+        with patch.object(merger, "papers_to_dataframe") as build_papers:
+            with patch.object(merger, "create_institutions_dataframe") as build_insts:
+                summary = merger.create_analysis_summary(
+                    sample_papers, papers_df=papers_df, institutions_df=institutions_df
+                )
+        build_papers.assert_not_called()
+        build_insts.assert_not_called()
+
+        expected.pop("analysis_date")
+        summary.pop("analysis_date")
+        assert summary == expected
+
+        # Without a papers dataframe the year range comes from the records
+        with patch.object(merger, "papers_to_dataframe") as build_papers:
+            summary = merger.create_analysis_summary(sample_papers)
+        build_papers.assert_not_called()
+        assert summary["year_range"] == {
+            "earliest": int(papers_df["year"].min()),
+            "latest": int(papers_df["year"].max()),
+        }
 
 
 class TestFieldNormalizer:
@@ -256,6 +363,32 @@ class TestFieldNormalizer:
         percentile = normalizer.calculate_rcr_percentile(-1, "Computer Science", 2020)
         assert percentile is None
 
+    def test_calculate_rcr_percentiles_batch(self):
+        """Test batch RCR percentiles agree with the scalar calculation."""
+        normalizer = FieldNormalizer()
+
+        rcrs = [2.0, 0.5, None, 1.0]
+        fields = ["Computer Science", None, "Medicine", "Mathematics"]
+        years = [2020, 2010, 2018, None]
+
+        percentiles = normalizer.calculate_rcr_percentiles_batch(rcrs, fields, years)
+        assert percentiles.shape == (4,)
+        assert np.isnan(percentiles[2])
+        for i in (0, 1, 3):
+            assert percentiles[i] == pytest.approx(
+                normalizer.calculate_rcr_percentile(rcrs[i], fields[i], years[i])
+            )
+
+    def test_norm_cdf(self):
+        """Test standard normal CDF for scalars and arrays."""
+        normalizer = FieldNormalizer()
+
+        assert normalizer._norm_cdf(0.0) == pytest.approx(0.5)
+        assert normalizer._norm_cdf(1.96) == pytest.approx(0.975, abs=1e-4)
+
+        values = normalizer._norm_cdf(np.array([-1.0, 0.0, 1.0]))
+        assert values == pytest.approx([0.158655, 0.5, 0.841345], abs=1e-6)
+
     def test_calculate_field_impact_score(self, sample_papers):
         """Test field impact score calculation."""
         normalizer = FieldNormalizer()
@@ -269,6 +402,19 @@ class TestFieldNormalizer:
         score = normalizer.calculate_field_impact_score(empty_paper)
         assert score == 0.0
 
+    def test_calculate_field_impact_scores_matches_scalar(self, sample_papers):
+        """Test batch impact scores agree with the per-paper calculation."""
+        normalizer = FieldNormalizer()
+        papers = sample_papers + [PaperRecord(id="empty", title="Empty Paper")]
+
+        scores = normalizer.calculate_field_impact_scores(papers)
+        assert scores.shape == (len(papers),)
+        for paper, score in zip(papers, scores):
+            assert score == pytest.approx(
+                normalizer.calculate_field_impact_score(paper)
+            )
+        assert scores[-1] == 0.0
+
     def test_normalize_citation_metrics(self, sample_papers):
         """Test citation metrics normalization."""
         normalizer = FieldNormalizer()
@@ -282,6 +428,75 @@ class TestFieldNormalizer:
         for paper in normalized_papers:
             assert hasattr(paper, "field_impact_score")
 
+    def test_normalize_field_group_percentiles(self, sample_papers):
+        """Test z-scores and percentiles within a field group."""
+        normalizer = FieldNormalizer()
+
+        cs_papers = [p for p in sample_papers if p.primary_field == "Computer Science"]
+        normalized = normalizer._normalize_field_group(cs_papers)
+
+        # Two papers (50 and 25 citations) sit one std either side of the mean
+        assert normalized[0].citation_z_score == pytest.approx(1.0)
+        assert normalized[1].citation_z_score == pytest.approx(-1.0)
+        assert normalized[0].citation_percentile == pytest.approx(84.134, abs=1e-3)
+        assert normalized[1].citation_percentile == pytest.approx(15.866, abs=1e-3)
+
+    def test_normalize_field_group_identical_values(self):
+        """Test groups with identical metrics only get impact scores."""
+        normalizer = FieldNormalizer()
+
+        papers = [
+            PaperRecord(id=f"same_{i}", title="Same", citation_count=10, rcr=1.5)
+            for i in range(3)
+        ]
+        normalized = normalizer._normalize_field_group(papers)
+
+        assert len(normalized) == 3
+        for paper in normalized:
+            assert paper.citation_z_score is None
+            assert paper.rcr_z_score is None
+            assert paper.field_impact_score > 0
+
+    def test_field_baselines_cache(self, sample_papers):
+        """Test field baselines are cached and can be invalidated."""
+        normalizer = FieldNormalizer()
+
+        first = normalizer.normalize_citation_metrics(sample_papers)
+        n_cached = len(normalizer.field_baselines)
+        assert n_cached > 0
+
+        second = normalizer.normalize_citation_metrics(sample_papers)
+        assert len(normalizer.field_baselines) == n_cached
+        assert [p.citation_z_score for p in first] == [
+            p.citation_z_score for p in second
+        ]
+
+        normalizer.invalidate_field("Computer Science")
+        assert all(key[0] != "Computer Science" for key in normalizer.field_baselines)
+
+        normalizer.invalidate_field()
+        assert normalizer.field_baselines == {}
+
+    def test_from_papers(self, sample_papers):
+        """Test structure-of-arrays view matches list input."""
+        normalizer = FieldNormalizer()
+
+        soa = normalizer.from_papers(sample_papers)
+        assert len(soa) == len(sample_papers)
+        assert list(soa.fields[soa.field_codes]) == [
+            p.primary_field or "Unknown" for p in sample_papers
+        ]
+
+        groups = soa.group_index()
+        assert soa.group_indices() is soa.group_indices()
+        assert sum(len(indices) for indices in groups.values()) == len(sample_papers)
+
+        from_list = normalizer.calculate_field_rankings(sample_papers)
+        from_soa = normalizer.calculate_field_rankings(soa)
+        assert from_list.keys() == from_soa.keys()
+        for field in from_list:
+            assert from_list[field]["rankings"] == from_soa[field]["rankings"]
+
     def test_identify_field_outliers(self, sample_papers):
         """Test field outlier identification."""
         normalizer = FieldNormalizer()
@@ -293,6 +508,25 @@ class TestFieldNormalizer:
         total_outliers = sum(len(papers) for papers in outliers.values())
         assert total_outliers >= 0
 
+    def test_identify_field_outliers_at_threshold(self):
+        """Test a z-score exactly on the threshold is not an outlier."""
+        normalizer = FieldNormalizer()
+        papers = [
+            PaperRecord(
+                id=f"p{i}",
+                title=f"Paper {i}",
+                citation_count=count,
+                primary_field="Biology",
+            )
+            for i, count in enumerate([0, 10, 0, 0, 0])
+        ]
+
+        # Mean 2, population std 4: the cited paper has z = 2 exactly
+        assert normalizer.identify_field_outliers(papers, threshold=2.0) == {}
+
+        outliers = normalizer.identify_field_outliers(papers, threshold=1.9)
+        assert [paper.id for paper in outliers["Biology"]] == ["p1"]
+
     def test_calculate_field_rankings(self, sample_papers):
         """Test field rankings calculation."""
         normalizer = FieldNormalizer()
@@ -377,6 +611,94 @@ class TestIndependenceClassifier:
         # Test dissimilar names
         assert not classifier._are_similar_authors("john smith", "jane doe")
 
+    def test_fuzzy_name_matching(self):
+        """Test fuzzy matching of single and batched names."""
+        classifier = IndependenceClassifier()
+
+        assert classifier._are_similar_authors("jon smith", "john smith")
+        assert classifier._are_similar_institutions("stanford", "stanford")
+        assert not classifier._are_similar_institutions("stanford", "oxford")
+
+        assert classifier._any_fuzzy_match(
+            {"jane doe", "jon smith"}, {"john smith"}, classifier.author_threshold
+        )
+        assert not classifier._any_fuzzy_match(
+            {"jane doe"}, {"john smith", ""}, classifier.author_threshold
+        )
+        assert not classifier._any_fuzzy_match(set(), {"john smith"}, 0.8)
+
+        assert classifier._fuzzy_matched_names(
+            {"jane doe", "jon smith"},
+            {"john smith", "jane dow", "ann lee", ""},
+            classifier.author_threshold,
+        ) == frozenset({"john smith", "jane dow"})
+        assert classifier._fuzzy_matched_names(set(), {"ann lee"}, 0.8) == frozenset()
+
+    def test_author_overlap_by_orcid(self):
+        """Test ORCIDs decide author overlap without fuzzy name matching."""
+        classifier = IndependenceClassifier()
+
+        cited = PaperRecord(
+            id="1",
+            title="Cited",
+            authors=[
+                Author(display_name="John Smith", orcid="0000-0000-0000-0001"),
+            ],
+        )
+
+        # Same name, different ORCID: different people
+        other = Citation(
+            citing_paper_id="2",
+            citing_authors=[
+                Author(display_name="John Smith", orcid="0000-0000-0000-0002")
+            ],
+        )
+        assert not classifier._has_author_overlap(cited, other, {})
+
+        # Different name spelling, same ORCID (URL form): same person
+        same = Citation(
+            citing_paper_id="3",
+            citing_authors=[
+                Author(
+                    display_name="J. Smith",
+                    orcid="https://orcid.org/0000-0000-0000-0001",
+                )
+            ],
+        )
+        assert classifier._has_author_overlap(cited, same, {})
+
+        # Citing author without ORCID falls back to name matching
+        unknown = Citation(
+            citing_paper_id="4",
+            citing_authors=[
+                Author(display_name="Jane Doe", orcid="0000-0000-0000-0003"),
+                Author(display_name="Jon Smith"),
+            ],
+        )
+        assert classifier._has_author_overlap(cited, unknown, {})
+
+    def test_build_author_components(self):
+        """Test co-author components join authors linked through shared papers."""
+        classifier = IndependenceClassifier()
+
+        papers = [
+            PaperRecord(
+                id="1",
+                title="One",
+                authors=[Author(display_name="Ann Lee"), Author(display_name="Bo Li")],
+            ),
+            PaperRecord(
+                id="2",
+                title="Two",
+                authors=[Author(display_name="Bo Li"), Author(display_name="Cy Ng")],
+            ),
+            PaperRecord(id="3", title="Three", authors=[Author(display_name="Di Wu")]),
+        ]
+        components = classifier._build_author_components(papers)
+
+        assert components["ann lee"] == components["bo li"] == components["cy ng"]
+        assert components["di wu"] != components["ann lee"]
+
     def test_classify_citations(self, sample_papers):
         """Test citation classification."""
         classifier = IndependenceClassifier()
@@ -391,6 +713,18 @@ class TestIndependenceClassifier:
             assert paper.independent_citations is not None
             assert paper.self_citations is not None
 
+    def test_classify_citations_parallel(self, sample_papers):
+        """Test threaded classification matches sequential classification."""
+        classifier = IndependenceClassifier()
+
+        sequential = classifier.classify_citations(sample_papers)
+        parallel = classifier.classify_citations(sample_papers, n_jobs=2)
+
+        assert [p.id for p in parallel] == [p.id for p in sequential]
+        assert [(p.independent_citations, p.self_citations) for p in parallel] == [
+            (p.independent_citations, p.self_citations) for p in sequential
+        ]
+
     def test_analyze_citation_patterns(self, sample_papers):
         """Test citation pattern analysis."""
         classifier = IndependenceClassifier()
@@ -401,6 +735,43 @@ class TestIndependenceClassifier:
         assert "overall_independence_ratio" in analysis
         assert "field_patterns" in analysis
 
+    def test_analyze_citation_patterns_totals(self):
+        """Test field and year aggregation of citation counts."""
+        classifier = IndependenceClassifier()
+
+        papers = [
+            PaperRecord(
+                id="a",
+                title="A",
+                year=2020,
+                primary_field="Biology",
+                citation_count=10,
+                independent_citations=9,
+                self_citations=1,
+            ),
+            PaperRecord(
+                id="b",
+                title="B",
+                year=2020,
+                primary_field="Biology",
+                citation_count=10,
+                independent_citations=4,
+                self_citations=6,
+            ),
+            PaperRecord(id="c", title="C", citation_count=0),
+        ]
+        analysis = classifier.analyze_citation_patterns(papers)
+
+        assert analysis["total_citations"] == 20
+        assert analysis["field_patterns"]["Biology"]["papers"] == 2
+        assert analysis["field_patterns"]["Biology"]["independence_ratio"] == 0.65
+        assert analysis["field_patterns"]["Unknown"]["independence_ratio"] == 0.0
+        assert analysis["year_patterns"] == {
+            2020: {"papers": 2, "citations": 20, "independent": 13, "self": 7}
+        }
+        assert analysis["highly_independent_papers"] == ["a"]
+        assert analysis["high_self_citation_papers"] == ["b"]
+
     def test_generate_independence_report(self, sample_papers):
         """Test independence report generation."""
         classifier = IndependenceClassifier()
@@ -411,6 +782,17 @@ class TestIndependenceClassifier:
         assert "quality_metrics" in report
         assert "recommendations" in report
 
+    def test_generate_independence_report_uncited(self):
+        """Test report metrics when no paper has citations."""
+        classifier = IndependenceClassifier()
+
+        papers = [PaperRecord(id="u", title="Uncited", citation_count=0)]
+        report = classifier.generate_independence_report(papers)
+
+        assert report["quality_metrics"]["average_independence_ratio"] == 0.0
+        assert report["quality_metrics"]["papers_with_citations"] == 0
+        assert report["top_independent_papers"] == []
+
 
 class TestUptakeAggregator:
     """Test UptakeAggregator functionality."""
@@ -427,6 +809,10 @@ class TestUptakeAggregator:
 
         # Should find at least one paper with patents from sample data
         assert analysis["papers_with_patents"] >= 1
+        assert analysis["field_distribution"] == {"Computer Science": 1}
+        # Missing assignees and years are not counted
+        assert analysis["top_assignees"] == {}
+        assert analysis["patent_timeline"]["yearly_patent_counts"] == {}
 
     def test_analyze_clinical_trial_uptake(self, sample_papers):
         """Test clinical trial uptake analysis."""
@@ -440,6 +826,26 @@ class TestUptakeAggregator:
 
         # Should find at least one paper with trials from sample data
         assert analysis["papers_with_trials"] >= 1
+        assert analysis["phase_distribution"] == {"Phase II": 1}
+        assert analysis["status_distribution"] == {"Active": 1}
+        assert analysis["top_sponsors"] == {}
+
+        # Start years are compared with the publication year
+        paper = sample_papers[0].model_copy(
+            update={
+                "clinical_trials": [
+                    ClinicalTrial(
+                        nct_id="NCT1", title="T", start_date=datetime(2022, 6, 1)
+                    ),
+                    ClinicalTrial(nct_id="NCT2", title="T"),
+                ]
+            }
+        )
+        analysis = aggregator.analyze_clinical_trial_uptake([paper])
+        assert analysis["average_time_to_trial"] == 2
+        assert analysis["trial_timeline"]["yearly_trial_counts"] == {2022: 1}
+        timeline = aggregator.create_uptake_timeline([paper])
+        assert timeline["event_counts"] == {"publication": 1, "clinical_trial": 1}
 
     def test_analyze_policy_uptake(self, sample_papers):
         """Test policy uptake analysis (placeholder)."""
@@ -464,6 +870,12 @@ class TestUptakeAggregator:
         score = aggregator.calculate_translational_impact_score(sample_papers[1])
         assert score >= 0
 
+        # The batch scorer agrees with the per-paper score
+        scores = aggregator._translational_scores(sample_papers)
+        assert scores.tolist() == [
+            aggregator.calculate_translational_impact_score(p) for p in sample_papers
+        ]
+
     def test_create_uptake_timeline(self, sample_papers):
         """Test uptake timeline creation."""
         aggregator = UptakeAggregator()
@@ -476,6 +888,19 @@ class TestUptakeAggregator:
         # Should have events from sample data
         assert len(timeline["timeline_events"]) > 0
 
+    def test_calculate_growth_trend(self):
+        """Test growth trend classification of yearly counts."""
+        aggregator = UptakeAggregator()
+
+        assert aggregator._calculate_growth_trend({2020: 1}) == "insufficient_data"
+        assert aggregator._calculate_growth_trend({2020: 1, 2021: 2, 2022: 3}) == (
+            "unknown"
+        )
+        assert (
+            aggregator._calculate_growth_trend({2019: 1, 2020: 4, 2021: 4, 2022: 4})
+            == "increasing"
+        )
+
     def test_identify_breakthrough_papers(self, sample_papers):
         """Test breakthrough paper identification."""
         aggregator = UptakeAggregator()
@@ -492,6 +917,17 @@ class TestUptakeAggregator:
             assert "translational_impact_score" in paper
             assert "breakthrough_factors" in paper
 
+        # Precomputed scores give the same result
+        scores = np.array(
+            [aggregator.calculate_translational_impact_score(p) for p in sample_papers]
+        )
+        assert (
+            aggregator.identify_breakthrough_papers(
+                sample_papers, threshold=10.0, scores=scores
+            )
+            == breakthrough_papers
+        )
+
     def test_generate_uptake_report(self, sample_papers):
         """Test comprehensive uptake report generation."""
         aggregator = UptakeAggregator()
@@ -508,6 +944,15 @@ class TestUptakeAggregator:
         assert "total_papers" in exec_summary
         assert "translational_impact_rate" in exec_summary
 
+        # The single-pass report matches the standalone analyses
+        assert report["patent_analysis"] == aggregator.analyze_patent_uptake(
+            sample_papers
+        )
+        assert report["clinical_trial_analysis"] == (
+            aggregator.analyze_clinical_trial_uptake(sample_papers)
+        )
+        assert report["timeline"] == aggregator.create_uptake_timeline(sample_papers)
+
     def test_empty_papers_handling(self):
         """Test handling of empty paper lists."""
         merger = DataMerger()
@@ -520,6 +965,10 @@ class TestUptakeAggregator:
         assert normalizer.normalize_citation_metrics([]) == []
         assert classifier.classify_citations([]) == []
         assert aggregator.analyze_patent_uptake([])["total_papers"] == 0
+        empty_report = aggregator.generate_uptake_report([])
+        assert empty_report["executive_summary"]["total_papers"] == 0
+        assert empty_report["timeline"]["timeline_events"] == []
+        assert empty_report["recommendations"] == []
 
 
 if __name__ == "__main__":
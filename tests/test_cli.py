@@ -2,7 +2,7 @@
 
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from typer.testing import CliRunner
@@ -61,7 +61,7 @@ def sample_papers():
 class TestCLICommands:
     """Test CLI command functionality."""
 
-    @patch("src.citationmap.cli.main._fetch_papers")
+    @patch("src.citationmap.cli.main._fetch_papers", new_callable=AsyncMock)
     @patch("src.citationmap.cli.main._run_analysis")
     @patch("src.citationmap.cli.main._generate_reports")
     @patch("src.citationmap.cli.main._display_summary")
@@ -108,7 +108,7 @@ class TestCLICommands:
         mock_reports.assert_called_once()
         mock_display.assert_called_once()
 
-    @patch("src.citationmap.cli.main._fetch_papers")
+    @patch("src.citationmap.cli.main._fetch_papers", new_callable=AsyncMock)
     def test_analyze_command_no_papers(self, mock_fetch, runner):
         """Test analyze command when no papers are found."""
         mock_fetch.return_value = []
@@ -118,7 +118,7 @@ class TestCLICommands:
         assert result.exit_code == 1
         assert "No papers found" in result.stdout
 
-    @patch("src.citationmap.cli.main._fetch_papers")
+    @patch("src.citationmap.cli.main._fetch_papers", new_callable=AsyncMock)
     @patch("src.citationmap.cli.main._run_analysis")
     @patch("src.citationmap.cli.main._display_summary")
     def test_stats_command_success(
@@ -143,7 +143,7 @@ class TestCLICommands:
         mock_analysis.assert_called_once()
         mock_display.assert_called_once()
 
-    @patch("src.citationmap.cli.main._fetch_papers")
+    @patch("src.citationmap.cli.main._fetch_papers", new_callable=AsyncMock)
     def test_stats_command_no_papers(self, mock_fetch, runner):
         """Test stats command when no papers are found."""
         mock_fetch.return_value = []
@@ -159,27 +159,41 @@ class TestCLIHelperFunctions:
 
     @patch("src.citationmap.cli.main.OpenAlexClient")
     @patch("src.citationmap.cli.main.iCiteClient")
-    def test_fetch_papers(self, mock_icite_client, mock_openalex_client, sample_papers):
+    @pytest.mark.asyncio
+    async def test_fetch_papers(
+        self, mock_icite_client, mock_openalex_client, sample_papers
+    ):
         """Test paper fetching functionality."""
         from src.citationmap.cli.main import _fetch_papers
 
+        sample_papers[0].pmid = "12345"
+
         # Mock OpenAlex client
-        mock_openalex = Mock()
-        mock_openalex.fetch_papers_by_orcid.return_value = sample_papers
+        mock_openalex = MagicMock()
+        mock_openalex.__aenter__.return_value = mock_openalex
+        mock_openalex.fetch_author_papers = AsyncMock(return_value=sample_papers)
         mock_openalex_client.return_value = mock_openalex
 
         # Mock iCite client
-        mock_icite = Mock()
-        mock_icite.fetch_paper_metrics.return_value = {"relative_citation_ratio": 3.0}
+        mock_icite = MagicMock()
+        mock_icite.__aenter__.return_value = mock_icite
+        mock_icite.get_metrics_by_pmids = AsyncMock(
+            return_value={"12345": {"relative_citation_ratio": 3.0}}
+        )
         mock_icite_client.return_value = mock_icite
 
-        result = _fetch_papers("0000-0000-0000-0001")
+        result = await _fetch_papers("0000-0000-0000-0001")
 
         assert len(result) == 2
         assert result[0].title == "Test Paper 1"
-        mock_openalex.fetch_papers_by_orcid.assert_called_once_with(
+        assert result[0].rcr == 3.0
+        assert result[1].rcr == 1.8
+        mock_openalex.fetch_author_papers.assert_awaited_once_with(
             "0000-0000-0000-0001"
         )
+        mock_icite.get_metrics_by_pmids.assert_awaited_once_with(["12345"])
+        mock_openalex.__aexit__.assert_awaited_once()
+        mock_icite.__aexit__.assert_awaited_once()
 
     @patch("src.citationmap.cli.main.DataMerger")
     @patch("src.citationmap.cli.main.IndependenceClassifier")
@@ -276,7 +290,7 @@ class TestCLIHelperFunctions:
 class TestCLIErrorHandling:
     """Test CLI error handling."""
 
-    @patch("src.citationmap.cli.main._fetch_papers")
+    @patch("src.citationmap.cli.main._fetch_papers", new_callable=AsyncMock)
     def test_analyze_command_exception(self, mock_fetch, runner):
         """Test analyze command handles exceptions gracefully."""
         mock_fetch.side_effect = Exception("API Error")
@@ -286,7 +300,7 @@ class TestCLIErrorHandling:
         assert result.exit_code == 1
         assert "Error" in result.stdout
 
-    @patch("src.citationmap.cli.main._fetch_papers")
+    @patch("src.citationmap.cli.main._fetch_papers", new_callable=AsyncMock)
     def test_stats_command_exception(self, mock_fetch, runner):
         """Test stats command handles exceptions gracefully."""
         mock_fetch.side_effect = Exception("API Error")
@@ -4,7 +4,9 @@ import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import diskcache as dc
 import pytest
+from pydantic import ValidationError
 
 from src.citationmap.data_acquisition.cache import CacheConfig, CacheManager
 from src.citationmap.data_acquisition.icite import iCiteClient
@@ -29,6 +31,9 @@ class TestCacheManager:
         config = CacheConfig(max_size="2GB")
         assert config.max_size_bytes == 2 * 1024 * 1024 * 1024
 
+        with pytest.raises(ValidationError):
+            config.max_size = "1MB"  # Config is frozen
+
     def test_cache_manager_initialization(self):
         """Test cache manager initialization."""
         cache = CacheManager()
@@ -46,6 +51,16 @@ class TestCacheManager:
         key2 = cache._make_key("api", "/endpoint", params2)
 
         assert key1 == key2
+        assert len(key1) == 32
+
+        nested1 = {"filter": {"a": 1, "b": [1, 2]}, "page": 1}
+        nested2 = {"page": 1, "filter": {"b": [1, 2], "a": 1}}
+        assert cache._make_key("api", "/endpoint", nested1) == cache._make_key(
+            "api", "/endpoint", nested2
+        )
+        assert cache._make_key("api", "/endpoint", params1) != cache._make_key(
+            "api", "/other", params1
+        )
 
     def test_cache_set_and_get(self):
         """Test basic cache set and get operations."""
@@ -70,6 +85,69 @@ class TestCacheManager:
         result = cache.get("nonexistent", "/endpoint", {"q": "test"})
         assert result is None
 
+    def test_cache_large_value_roundtrip(self, tmp_path):
+        """Test values stored in separate files round-trip through JSON."""
+        cache = CacheManager(CacheConfig(directory=str(tmp_path)))
+
+        data = {
+            "data": [{"pmid": i, "rcr": i / 10, "title": "x" * 50} for i in range(1000)]
+        }
+        cache.set("icite", "/pubs", {"pmids": "all"}, data)
+
+        assert cache.get("icite", "/pubs", {"pmids": "all"}) == data
+
+    def test_cache_invalid_entry_removed(self, tmp_path):
+        """Test entries that cannot be decoded are dropped."""
+        cache = CacheManager(CacheConfig(directory=str(tmp_path)))
+        key = cache._make_key("api", "/endpoint", {"q": "test"})
+
+        # Uncompressed JSON bytes, written without the cache's disk format
+        with dc.Cache(str(tmp_path)) as raw_cache:
+            raw_cache.set(key, b'{"result": 1}', tag="api")
+
+        assert cache.get("api", "/endpoint", {"q": "test"}) is None
+        assert key not in cache.cache
+
+    def test_cache_expiry(self, tmp_path):
+        """Test expired entries are not returned."""
+        cache = CacheManager(CacheConfig(directory=str(tmp_path), expire_after=-1))
+
+        cache.set("api", "/endpoint", {"q": "test"}, {"result": 1})
+        cache.set("api", "/endpoint", {"q": "other"}, {"result": 2})
+        assert cache.get("api", "/endpoint", {"q": "test"}) is None
+
+        stats = cache.stats()
+        assert stats["total_entries"] == 0
+        assert stats["api_breakdown"] == {}
+
+    def test_cache_untagged_entry_removed(self, tmp_path):
+        """Test untagged entries from the old storage format are dropped."""
+        cache = CacheManager(CacheConfig(directory=str(tmp_path)))
+        key = cache._make_key("api", "/endpoint", {"q": "test"})
+
+        with dc.Cache(str(tmp_path)) as raw_cache:
+            raw_cache.set(key, {"timestamp": "2024-01-01T00:00:00", "data": {}})
+
+        assert cache.get("api", "/endpoint", {"q": "test"}) is None
+        assert key not in cache.cache
+
+    def test_cache_clear_and_stats_by_api(self, tmp_path):
+        """Test entries are counted and cleared per API."""
+        cache = CacheManager(CacheConfig(directory=str(tmp_path)))
+
+        cache.set("openalex", "/works", {"page": 1}, {"results": []})
+        cache.set("openalex", "/works", {"page": 2}, {"results": []})
+        cache.set("icite", "/pubs", {"pmids": "1"}, {"data": []})
+
+        stats = cache.stats()
+        assert stats["total_entries"] == 3
+        assert stats["api_breakdown"] == {"openalex": 2, "icite": 1}
+
+        assert cache.clear("openalex") == 2
+        assert cache.get("openalex", "/works", {"page": 1}) is None
+        assert cache.get("icite", "/pubs", {"pmids": "1"}) == {"data": []}
+        assert cache.clear() == 1
+
 
 class TestOpenAlexClient:
     """Test OpenAlex client functionality."""
@@ -173,7 +251,10 @@ class TestiCiteClient:
 
         assert client._calculate_percentile(None) is None
         assert client._calculate_percentile(4.5) == 95.0
+        assert client._calculate_percentile(4.0) == 95.0
+        assert client._calculate_percentile(3.99) == 90.0
         assert client._calculate_percentile(2.5) == 90.0
+        assert client._calculate_percentile(2.0) == 85.0
         assert client._calculate_percentile(1.5) == 75.0
         assert client._calculate_percentile(1.0) == 50.0
         assert client._calculate_percentile(0.5) == 25.0
@@ -213,6 +294,28 @@ class TestiCiteClient:
             assert enriched[0]["percentile"] == 85.0
             assert "rcr" not in enriched[1]  # No iCite data for second paper
 
+    @pytest.mark.asyncio
+    async def test_get_metrics_by_pmids_batches(self):
+        """Test PMIDs are split into batches and failed batches are skipped."""
+        pmids = [str(i) for i in range(1500)]
+
+        async def fake_request(endpoint, params):
+            batch = params["pmids"].split(",")
+            if batch[0] == "1000":
+                raise Exception("API Error")
+            return {"data": [{"pmid": int(pmid)} for pmid in batch]}
+
+        with patch.object(
+            iCiteClient, "_make_request", side_effect=fake_request
+        ) as mock_request:
+            client = iCiteClient()
+            metrics = await client.get_metrics_by_pmids(pmids)
+
+            assert mock_request.call_count == 2
+            assert len(metrics) == 1000
+            assert metrics["999"] == {"pmid": 999}
+            assert "1000" not in metrics
+
 
 @pytest.mark.asyncio
 async def test_integration_example():
@@ -11,6 +11,7 @@ from src.citationmap.core.models import (
     FieldOfStudy,
     Institution,
     PaperRecord,
+    PatentCitation,
 )
 
 
@@ -84,6 +85,19 @@ class TestPaperRecord:
         assert paper.year == 2023
 
 
+class TestPatentCitation:
+    """Test PatentCitation model."""
+
+    def test_main_class(self):
+        """Test main classification code extraction."""
+        patent = PatentCitation(
+            patent_id="1", patent_title="P", classification="G06F/17"
+        )
+        assert patent.main_class == "G06F"
+        assert patent.model_copy(update={"classification": "A61K"}).main_class == "A61K"
+        assert PatentCitation(patent_id="2", patent_title="P").main_class is None
+
+
 class TestAnalysisResult:
     """Test AnalysisResult model."""
 
@@ -114,6 +128,37 @@ class TestAnalysisResult:
         result = AnalysisResult(total_citations=0, total_independent_citations=0)
         assert result.independence_ratio == 0.0
 
+    def test_get_top_papers_by_citations(self):
+        """Test top papers are ordered by citations, ties in input order."""
+        papers = [
+            PaperRecord(id=f"p{i}", title=f"Paper {i}", citation_count=count)
+            for i, count in enumerate([5, 20, 5, 10])
+        ]
+        result = AnalysisResult(papers=papers)
+
+        top = result.get_top_papers_by_citations(3)
+        assert [paper.id for paper in top] == ["p1", "p3", "p0"]
+        assert len(result.get_top_papers_by_citations()) == 4
+
+    def test_get_papers_by_field(self):
+        """Test case-insensitive field lookup."""
+        biology = FieldOfStudy(id="f1", display_name="Biology", level=0, score=0.9)
+        physics = FieldOfStudy(id="f2", display_name="Physics", level=0, score=0.5)
+        papers = [
+            PaperRecord(id="p1", title="Paper 1", fields_of_study=[biology]),
+            PaperRecord(id="p2", title="Paper 2", fields_of_study=[physics, biology]),
+            PaperRecord(id="p3", title="Paper 3", fields_of_study=[physics]),
+        ]
+        result = AnalysisResult(papers=papers)
+
+        assert [p.id for p in result.get_papers_by_field("biology")] == ["p1", "p2"]
+        assert [p.id for p in result.get_papers_by_field("PHYSICS")] == ["p2", "p3"]
+        assert result.get_papers_by_field("Chemistry") == []
+
+        # A copy with a new papers list gets a fresh index
+        copy = result.model_copy(update={"papers": papers[:1]})
+        assert [p.id for p in copy.get_papers_by_field("Biology")] == ["p1"]
+
 
 class TestCitationContext:
     """Test CitationContext enum."""
@@ -93,6 +93,7 @@ class TestChartGenerator:
             result_path = generator.export_chart(fig, tmp_path, "html")
             assert result_path == tmp_path
             assert Path(tmp_path).exists()
+            assert "cdn.plot.ly" in Path(tmp_path).read_text()
         finally:
             Path(tmp_path).unlink(missing_ok=True)
 